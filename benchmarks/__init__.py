@@ -0,0 +1 @@
+# Microbenchmarks with stored baselines, run with ``python -m benchmarks.run``
@@ -0,0 +1,503 @@
+import argparse
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+# Allow running as a script as well as with ``python -m benchmarks.fake_github``
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import make_repositories
+from src.core.serialization import dumps, loads
+
+# GitHub's default and largest REST page sizes
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+_USER = re.compile(r'^/users/([^/]+)$')
+_USER_REPOS = re.compile(r'^/users/([^/]+)/repos$')
+_REPO_TOPICS = re.compile(r'^/repos/([^/]+)/([^/]+)/topics$')
+
+class FakeGitHub:
+    """
+    Local stand-in for the GitHub REST and GraphQL endpoints the services call
+
+    Principles:
+    - Deterministic data per username, never touch api.github.com
+    - Behave like GitHub where it shapes client behavior: pagination,
+      ETags, rate-limit headers
+    - Injectable latency and failures to exercise pooling, retries and
+      circuit breakers
+
+    Serves ``/users/<login>``, ``/users/<login>/repos``, ``/user``,
+    ``/user/repos``, ``/repos/<owner>/<repo>/topics`` and ``/graphql`` for the
+    batched topics lookup and the contributions query. Counters are
+    available at ``/_fake/stats``.
+    """
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        repos_per_user: int = 60,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: int = 5000,
+        rate_limit_window: float = 3600,
+        error_rate: float = 0.0,
+        error_status: int = 502,
+        listing_topics: bool = True,
+        authenticated_user: str = 'octocat',
+        seed: int = 0
+    ):
+        """
+        Initialize the fake server, call start() to serve
+
+        :param host: Interface to bind
+        :param port: Port to bind, 0 picks a free one
+        :param repos_per_user: Repositories owned by every user
+        :param latency: Seconds added to every response
+        :param jitter: Up to this many extra seconds, drawn uniformly per response
+        :param rate_limit: Calls per token and resource in each window
+        :param rate_limit_window: Seconds until a spent budget resets
+        :param error_rate: Fraction of calls answered with error_status
+        :param error_status: Status of injected failures
+        :param listing_topics: Include topics in repository listings, as GitHub
+                               does; without them clients look topics up separately
+        :param authenticated_user: Login returned by ``/user``
+        :param seed: Seed for data, latency jitter and injected failures
+        """
+        self.repos_per_user = repos_per_user
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.listing_topics = listing_topics
+        self.authenticated_user = authenticated_user
+        self.seed = seed
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._repositories: Dict[str, List[Dict[str, Any]]] = {}
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        # Spent calls and window start per (token, resource)
+        self._budgets: Dict[Tuple[str, str], List[float]] = {}
+        self._forced_failures: deque = deque()
+        self._stats: Counter = Counter()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL to use as github.api_base_url
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeGitHub':
+        """
+        Serve on a background thread
+        """
+        # A short poll interval keeps stop() fast
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            name='fake-github',
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and release the port
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeGitHub':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, count: int = 1, status: int = None, path: str = ''):
+        """
+        Answer the next matching calls with an error, regardless of error_rate
+
+        :param count: Calls to fail
+        :param status: Response status, defaults to error_status
+        :param path: Only fail calls whose path starts with this
+        """
+        with self._lock:
+            for _ in range(count):
+                self._forced_failures.append((path, status or self.error_status))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Calls served so far
+
+        :return: Totals plus ``endpoint.<name>`` counts per endpoint
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self):
+        """
+        Forget counters, spent budgets and pending injected failures
+        """
+        with self._lock:
+            self._stats.clear()
+            self._budgets.clear()
+            self._forced_failures.clear()
+
+    def repositories(self, login: str) -> List[Dict[str, Any]]:
+        """
+        Repository payloads of a user, most recently updated first
+
+        :param login: User login
+        :return: REST repository payloads including topics
+        """
+        with self._lock:
+            repositories = self._repositories.get(login)
+            if repositories is None:
+                repositories = self._repositories[login] = self._make_repositories(login)
+                self._nodes.update((repo['node_id'], repo) for repo in repositories)
+            return repositories
+
+    def profile(self, login: str) -> Dict[str, Any]:
+        """
+        REST user payload of a user
+
+        :param login: User login
+        :return: User payload
+        """
+        return {
+            'login': login,
+            'id': zlib.crc32(login.encode('utf-8')),
+            'name': login.replace('-', ' ').title(),
+            'email': f'{login}@example.com',
+            'bio': 'Synthetic user served by the fake GitHub API',
+            'location': 'Localhost',
+            'public_repos': self.repos_per_user,
+            'followers': zlib.crc32(login.encode('utf-8')) % 500,
+            'following': 10,
+            'avatar_url': f'{self.url}/avatars/{login}',
+            'html_url': f'https://github.com/{login}',
+            'type': 'User'
+        }
+
+    def contributions(self, login: str) -> Dict[str, Any]:
+        """
+        Contribution calendar of a user over the last 52 weeks
+
+        :param login: User login
+        :return: contributionCalendar payload
+        """
+        rng = random.Random(zlib.crc32(login.encode('utf-8')) ^ self.seed)
+        weeks = [
+            {'contributionDays': [{'contributionCount': rng.randint(0, 12)} for _ in range(7)]}
+            for _ in range(52)
+        ]
+        total = sum(day['contributionCount'] for week in weeks for day in week['contributionDays'])
+        return {'totalContributions': total, 'weeks': weeks}
+
+    def _make_repositories(self, login: str) -> List[Dict[str, Any]]:
+        """
+        Build REST payloads from the synthetic benchmark listings
+        """
+        records = make_repositories(self.repos_per_user, seed=zlib.crc32(login.encode('utf-8')) ^ self.seed)
+        repositories = []
+        for index, record in enumerate(records):
+            full_name = f'{login}/{record.name}'
+            repositories.append({
+                'id': index + 1,
+                'node_id': 'R_' + hashlib.sha1(full_name.encode('utf-8')).hexdigest()[:16],
+                'name': record.name,
+                'full_name': full_name,
+                'owner': {'login': login},
+                'private': False,
+                'fork': False,
+                'description': record.description,
+                'language': record.language,
+                'stargazers_count': record.stars,
+                'watchers_count': record.stars,
+                'forks_count': record.forks,
+                'created_at': record.created_at,
+                'updated_at': record.updated_at,
+                'pushed_at': record.updated_at,
+                'html_url': f'https://github.com/{full_name}',
+                'topics': list(record.topics)
+            })
+        return repositories
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: bytes) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Answer one call
+
+        :return: Tuple of status, JSON payload and extra headers
+        """
+        if method == 'POST' and path == '/graphql':
+            return self._graphql(loads(body or b'{}'))
+        if method != 'GET':
+            return 404, {'message': 'Not Found'}, {}
+
+        if path == '/user':
+            return 200, self.profile(self.authenticated_user), {}
+        if path == '/user/repos':
+            return self._repository_page(self.authenticated_user, path, query)
+
+        match = _USER.match(path)
+        if match:
+            return 200, self.profile(match.group(1)), {}
+        match = _USER_REPOS.match(path)
+        if match:
+            return self._repository_page(match.group(1), path, query)
+        match = _REPO_TOPICS.match(path)
+        if match:
+            owner, name = match.groups()
+            for repo in self.repositories(owner):
+                if repo['name'] == name:
+                    return 200, {'names': repo['topics']}, {}
+        return 404, {'message': 'Not Found'}, {}
+
+    def _repository_page(self, login: str, path: str, query: Dict[str, str]) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        One page of a listing, linked to the others like GitHub does
+        """
+        try:
+            per_page = min(max(int(query.get('per_page', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+            page = max(int(query.get('page', 1)), 1)
+        except ValueError:
+            return 422, {'message': 'Validation Failed'}, {}
+
+        repositories = self.repositories(login)
+        start = (page - 1) * per_page
+        items = repositories[start:start + per_page]
+        if not self.listing_topics:
+            items = [{key: value for key, value in repo.items() if key != 'topics'} for repo in items]
+
+        last = max((len(repositories) + per_page - 1) // per_page, 1)
+        links = []
+        if page < last:
+            links.append(f'<{self._page_url(path, query, page + 1)}>; rel="next"')
+            links.append(f'<{self._page_url(path, query, last)}>; rel="last"')
+        return 200, items, {'Link': ', '.join(links)} if links else {}
+
+    def _page_url(self, path: str, query: Dict[str, str], page: int) -> str:
+        return f'{self.url}{path}?{urlencode(dict(query, page=page))}'
+
+    def _graphql(self, request: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Answer the topics and contributions queries the services send
+        """
+        query = request.get('query') or ''
+        variables = request.get('variables') or {}
+
+        if 'nodes(ids:' in query:
+            with self._lock:
+                nodes = [self._nodes.get(node_id) for node_id in variables.get('ids') or []]
+            return 200, {'data': {'nodes': [
+                {
+                    'nameWithOwner': repo['full_name'],
+                    'repositoryTopics': {'nodes': [{'topic': {'name': topic}} for topic in repo['topics']]}
+                } if repo is not None else None
+                for repo in nodes
+            ]}}, {}
+
+        if 'contributionsCollection' in query and variables.get('username'):
+            return 200, {'data': {'user': {'contributionsCollection': {
+                'contributionCalendar': self.contributions(variables['username'])
+            }}}}, {}
+
+        return 200, {'errors': [{'message': 'Query not supported by the fake GitHub API'}]}, {}
+
+    def _charge(self, token: str, resource: str, cost: int = 1) -> Dict[str, str]:
+        """
+        Spend calls of a token's budget
+
+        :param token: Token the call was made with
+        :param resource: Rate-limit resource the call is charged to
+        :param cost: Calls spent, 0 for answers GitHub does not charge
+        :return: Rate-limit headers, remaining is -1 when the budget was already spent
+        """
+        now = time.time()
+        with self._lock:
+            budget = self._budgets.get((token, resource))
+            if budget is None or now >= budget[1] + self.rate_limit_window:
+                budget = self._budgets[(token, resource)] = [0, now]
+            exhausted = cost > 0 and budget[0] >= self.rate_limit
+            if not exhausted:
+                budget[0] = min(budget[0] + cost, self.rate_limit)
+            used = budget[0]
+            reset = int(budget[1] + self.rate_limit_window)
+        return {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': '-1' if exhausted else str(self.rate_limit - used),
+            'X-RateLimit-Used': str(used),
+            'X-RateLimit-Reset': str(reset),
+            'X-RateLimit-Resource': resource
+        }
+
+    def _injected_failure(self, path: str) -> Optional[int]:
+        """
+        Status of an injected failure for this call, None to answer normally
+        """
+        with self._lock:
+            for index, (prefix, status) in enumerate(self._forced_failures):
+                if path.startswith(prefix):
+                    del self._forced_failures[index]
+                    return status
+            if self.error_rate > 0 and self._random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+
+    def _count(self, *names: str):
+        with self._lock:
+            self._stats.update(names)
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so client connection reuse shows up in the numbers
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self._serve('GET')
+
+            def do_POST(self):
+                self._serve('POST')
+
+            def _serve(self, method: str):
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+                if url.path == '/_fake/stats':
+                    self._respond(200, dumps(fake.stats()), {})
+                    return
+
+                endpoint = 'graphql' if url.path == '/graphql' else (url.path.strip('/').split('/') or [''])[0]
+                fake._count('requests', f'endpoint.{endpoint}')
+                delay = fake._delay()
+                if delay > 0:
+                    time.sleep(delay)
+
+                status = fake._injected_failure(url.path)
+                if status is not None:
+                    fake._count('injected_errors')
+                    headers = {'Retry-After': '1'} if status == 429 else {}
+                    self._respond(status, dumps({'message': 'Injected failure'}), headers)
+                    return
+
+                resource = 'graphql' if endpoint == 'graphql' else 'core'
+                status, payload, extra = fake._route(method, url.path, query, body)
+                encoded = dumps(payload)
+                etag = '"' + hashlib.sha1(encoded).hexdigest() + '"' if method == 'GET' and status == 200 else None
+
+                # Like GitHub, a 304 revalidation is not charged to the budget
+                not_modified = etag is not None and etag in (
+                    tag.strip().replace('W/', '', 1) for tag in self.headers.get('If-None-Match', '').split(',')
+                )
+                headers = fake._charge(self._token(), resource, cost=0 if not_modified else 1)
+                if headers['X-RateLimit-Remaining'] == '-1':
+                    fake._count('rate_limited')
+                    headers['X-RateLimit-Remaining'] = '0'
+                    self._respond(403, dumps({'message': 'API rate limit exceeded'}), headers)
+                    return
+
+                headers.update(extra)
+                if etag is not None:
+                    headers['ETag'] = etag
+                if not_modified:
+                    fake._count('not_modified')
+                    self._respond(304, b'', headers)
+                    return
+                self._respond(status, encoded, headers)
+
+            def _token(self) -> str:
+                # "token <value>" or "Bearer <value>", anonymous calls share one budget
+                authorization = self.headers.get('Authorization', '')
+                return authorization.split(' ', 1)[-1] if authorization else 'anonymous'
+
+            def _respond(self, status: int, body: bytes, headers: Dict[str, str]):
+                self.send_response(status)
+                if body:
+                    self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Load tests would drown in access logs
+                pass
+
+        return Handler
+
+def main(argv: List[str] = None) -> int:
+    """
+    Fake GitHub command line entry point, serves until interrupted
+    """
+    parser = argparse.ArgumentParser(description='Serve a local stand-in for the GitHub API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9000)
+    parser.add_argument('--repos', type=int, default=60, help='Repositories per user')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random seconds per response')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Calls per token and resource per window')
+    parser.add_argument('--rate-limit-window', type=float, default=3600, help='Seconds until a spent budget resets')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of calls that fail')
+    parser.add_argument('--error-status', type=int, default=502, help='Status of injected failures')
+    parser.add_argument('--no-listing-topics', action='store_true', help='Leave topics out of repository listings')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    fake = FakeGitHub(
+        host=args.host,
+        port=args.port,
+        repos_per_user=args.repos,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        listing_topics=not args.no_listing_topics,
+        seed=args.seed
+    )
+    fake.start()
+    print(f'Fake GitHub API at {fake.url}, set GITHUB_API_BASE_URL={fake.url}', file=sys.stderr)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+import argparse
+import itertools
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import requests
+
+# Allow running as a script as well as with ``python -m benchmarks.load``
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.fake_github import FakeGitHub
+from src.core.serialization import dumps
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Accepted by config validation, only ever sent to the fake GitHub API
+FAKE_TOKEN = 'ghp_' + 'f' * 36
+
+class LoadReport:
+    """
+    Throughput, latency percentiles and failures of a load run
+    """
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        # Transport failures by exception type, no status was received
+        self.errors: Counter = Counter()
+        self.start = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, latency: float, status: int = None, error: BaseException = None):
+        """
+        Account for one request
+
+        :param latency: Seconds until the full response was read or the call failed
+        :param status: Response status
+        :param error: Transport error raised instead of a response
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            if error is not None:
+                self.errors[type(error).__name__] += 1
+            else:
+                self.statuses[status] += 1
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.start
+
+    @property
+    def succeeded(self) -> int:
+        return sum(count for status, count in self.statuses.items() if 200 <= status < 300)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Nearest-rank latency percentile
+
+        :param q: Quantile between 0 and 1
+        :return: Seconds, None without requests
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return None
+        rank = max(math.ceil(q * len(latencies)), 1)
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Report throughput, latency percentiles and status counts
+        """
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self.start
+        total = len(self.latencies)
+        return {
+            'requests': total,
+            'succeeded': self.succeeded,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'errors': dict(self.errors),
+            'concurrency': self.concurrency,
+            'elapsed_s': round(elapsed, 3),
+            'throughput_per_s': round(total / elapsed, 2) if elapsed > 0 else None,
+            'p50_ms': _milliseconds(self.percentile(0.50)),
+            'p90_ms': _milliseconds(self.percentile(0.90)),
+            'p99_ms': _milliseconds(self.percentile(0.99)),
+            'max_ms': _milliseconds(max(self.latencies) if self.latencies else None)
+        }
+
+def run_load(
+    url: str,
+    usernames: Sequence[str],
+    concurrency: int = 16,
+    total: int = 500,
+    duration: float = None,
+    output_format: str = 'json',
+    timeout: float = 60
+) -> LoadReport:
+    """
+    Drive /generate_resume with closed-loop concurrent clients
+
+    Every client keeps its own keep-alive session and sends its next request
+    as soon as the previous one completes. Usernames are cycled, so repeated
+    users exercise the resume cache and distinct ones the GitHub path.
+
+    :param url: Base URL of the resume service
+    :param usernames: GitHub usernames to request
+    :param concurrency: Concurrent clients
+    :param total: Requests to send, ignored when duration is given
+    :param duration: Seconds to keep sending instead of a request count
+    :param output_format: Export format requested
+    :param timeout: Seconds before a single request counts as failed
+    :return: Load report
+    """
+    report = LoadReport(concurrency)
+    counter = itertools.count()
+    deadline = time.perf_counter() + duration if duration else None
+    endpoint = url.rstrip('/') + '/generate_resume'
+
+    def client():
+        with requests.Session() as session:
+            while True:
+                index = next(counter)
+                if deadline is not None:
+                    if time.perf_counter() >= deadline:
+                        return
+                elif index >= total:
+                    return
+                data = {'github_username': usernames[index % len(usernames)], 'format': output_format}
+                start = time.perf_counter()
+                try:
+                    response = session.post(endpoint, data=data, timeout=timeout)
+                    # Streamed exports only count once the whole body arrived
+                    response.content
+                except requests.RequestException as e:
+                    report.add(time.perf_counter() - start, error=e)
+                else:
+                    report.add(time.perf_counter() - start, status=response.status_code)
+
+    threads = [threading.Thread(target=client, name=f'load-client-{n}') for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report.finish()
+    return report
+
+def free_port(host: str = '127.0.0.1') -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+def wait_until_ready(url: str, timeout: float = 30, process: subprocess.Popen = None):
+    """
+    Poll the service until it answers
+
+    :param url: Base URL of the resume service
+    :param timeout: Seconds to wait
+    :param process: Server process, a crash fails fast instead of waiting
+    :raises RuntimeError: If the service does not come up in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f'Resume service exited with status {process.returncode}')
+        try:
+            requests.get(url.rstrip('/') + '/jobs/stats', timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.1)
+    raise RuntimeError(f'Resume service at {url} did not start within {timeout}s')
+
+@contextmanager
+def serve_app(github_url: str, port: int = None, env: Dict[str, str] = None, verbose: bool = False) -> Iterator[str]:
+    """
+    Run the Flask service in a subprocess pointed at a GitHub stand-in
+
+    Snapshots and artifacts go to a throwaway directory, so every run starts cold.
+
+    :param github_url: Base URL of the GitHub API to use
+    :param port: Port to serve on, a free one by default
+    :param env: Extra environment variables for the service
+    :param verbose: Pass the service's output through
+    :return: Base URL of the running service
+    """
+    port = port or free_port()
+    with tempfile.TemporaryDirectory(prefix='resume-load-') as workdir:
+        environment = dict(
+            os.environ,
+            GITHUB_API_BASE_URL=github_url,
+            PORT=str(port),
+            RESUME_SNAPSHOT_DIR=os.path.join(workdir, 'snapshots'),
+            ARTIFACT_CACHE_DIR=os.path.join(workdir, 'artifacts'),
+            **(env or {})
+        )
+        environment.setdefault('GITHUB_TOKEN', FAKE_TOKEN)
+        output = None if verbose else subprocess.DEVNULL
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'src.app'],
+            cwd=PROJECT_ROOT,
+            env=environment,
+            stdout=output,
+            stderr=output
+        )
+        url = f'http://127.0.0.1:{port}'
+        try:
+            wait_until_ready(url, process=process)
+            yield url
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+def format_report(result: Dict[str, Any], github: Dict[str, int] = None) -> str:
+    """
+    Render a load report as text
+    """
+    lines = [
+        f"requests      {result['requests']} ({result['succeeded']} succeeded) with {result['concurrency']} clients",
+        f"elapsed       {result['elapsed_s']}s",
+        f"throughput    {result['throughput_per_s']} req/s",
+        f"latency       p50 {result['p50_ms']}ms  p90 {result['p90_ms']}ms  "
+        f"p99 {result['p99_ms']}ms  max {result['max_ms']}ms",
+        f"statuses      {result['statuses']}"
+    ]
+    if result['errors']:
+        lines.append(f"errors        {result['errors']}")
+    if github:
+        calls = github.get('requests', 0)
+        per_request = calls / result['requests'] if result['requests'] else 0
+        lines.append(f"github calls  {calls} ({per_request:.2f} per request), {github.get('not_modified', 0)} not modified, "
+                     f"{github.get('rate_limited', 0)} rate limited, {github.get('injected_errors', 0)} injected errors")
+    return '\n'.join(lines)
+
+def main(argv: List[str] = None) -> int:
+    """
+    Load test command line entry point
+
+    Without --url the service is started against an in-process fake GitHub API.
+
+    :return: 1 if any request failed, else 0
+    """
+    parser = argparse.ArgumentParser(description='Load test /generate_resume')
+    parser.add_argument('--url', help='Running resume service, started against a fake GitHub API when omitted')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--requests', type=int, default=500, help='Requests to send')
+    parser.add_argument('--duration', type=float, help='Seconds to run instead of a request count')
+    parser.add_argument('--users', type=int, default=20, help='Distinct usernames, cycled across requests')
+    parser.add_argument('--format', default='json', help='Export format to request')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    fake_options = parser.add_argument_group('fake GitHub API, without --url')
+    fake_options.add_argument('--latency', type=float, default=0.05, help='Seconds added to every GitHub response')
+    fake_options.add_argument('--jitter', type=float, default=0.02, help='Extra random seconds per GitHub response')
+    fake_options.add_argument('--repos', type=int, default=60, help='Repositories per user')
+    fake_options.add_argument('--rate-limit', type=int, default=5000, help='GitHub calls per token per hour')
+    fake_options.add_argument('--error-rate', type=float, default=0.0, help='Fraction of GitHub calls that fail')
+    fake_options.add_argument('--verbose', action='store_true', help='Show the service output')
+    args = parser.parse_args(argv)
+
+    usernames = [f'load-user-{n}' for n in range(args.users)]
+
+    def drive(url: str) -> Dict[str, Any]:
+        return run_load(url, usernames, args.concurrency, args.requests, args.duration, args.format).as_dict()
+
+    github = None
+    if args.url:
+        result = drive(args.url)
+    else:
+        fake = FakeGitHub(
+            repos_per_user=args.repos,
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_limit=args.rate_limit,
+            error_rate=args.error_rate
+        )
+        with fake, serve_app(fake.url, verbose=args.verbose) as url:
+            result = drive(url)
+            github = fake.stats()
+
+    if args.json:
+        print(dumps(dict(result, github=github), pretty=True).decode('utf-8'))
+    else:
+        print(format_report(result, github))
+    return 0 if result['succeeded'] == result['requests'] else 1
+
+def _milliseconds(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,262 @@
+import argparse
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+# Allow running as a script as well as with ``python -m benchmarks.run``
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import make_agent_resume, make_repositories, make_resume
+from src.core.error_handling import PDFRenderError
+from src.core.serialization import dumps, loads
+from src.resume_exporter import ResumeExporter
+from src.services.resume_service import ResumeService
+from src.utils.export_service import ExportService
+from src.utils.pdf_renderer import get_pdf_renderer
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+# Slower than the baseline by more than this fraction counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+class Benchmark(NamedTuple):
+    """
+    Operation measured at every listing size
+    """
+    name: str
+    # Builds the zero-argument callable to time for a listing size
+    setup: Callable[[int], Callable[[], Any]]
+    # Largest size worth measuring, PDF rendering of 10k projects is not
+    max_size: Optional[int] = None
+    # Skipped where WeasyPrint cannot render
+    needs_pdf: bool = False
+
+def _resume_service() -> ResumeService:
+    return ResumeService(github_service=None)
+
+def _pdf_output() -> str:
+    return os.path.join(tempfile.gettempdir(), 'benchmark_resume.pdf')
+
+BENCHMARKS = (
+    Benchmark('resume_service.rank_projects', lambda size: (
+        lambda service=_resume_service(), repos=make_repositories(size): service._rank_projects(repos)
+    )),
+    Benchmark('resume_service.extract_skills', lambda size: (
+        lambda service=_resume_service(), repos=make_repositories(size): service._extract_skills(repos)
+    )),
+    Benchmark('export_service.to_json', lambda size: (
+        lambda resume=make_resume(size): ExportService.to_json(resume)
+    )),
+    Benchmark('export_service.to_markdown', lambda size: (
+        lambda resume=make_resume(size): ExportService.to_markdown(resume)
+    )),
+    Benchmark('export_service.to_html', lambda size: (
+        lambda resume=make_resume(size): ExportService.to_html(resume)
+    )),
+    # Rendering cost of a to_pdf artifact miss, to_pdf itself serves the stored artifact afterwards
+    Benchmark('export_service.render_pdf', lambda size: (
+        lambda resume=make_resume(size): ExportService.render_pdf(resume)
+    ), max_size=1000, needs_pdf=True),
+    Benchmark('resume_exporter.to_json', lambda size: (
+        lambda resume=make_agent_resume(size): ResumeExporter.to_json(resume)
+    )),
+    Benchmark('resume_exporter.to_markdown', lambda size: (
+        lambda resume=make_agent_resume(size): ResumeExporter.to_markdown(resume)
+    )),
+    Benchmark('resume_exporter.to_pdf', lambda size: (
+        lambda resume=make_agent_resume(size): ResumeExporter.to_pdf(resume, _pdf_output())
+    ), max_size=1000, needs_pdf=True)
+)
+
+def pdf_available() -> bool:
+    """
+    Whether PDFs can be rendered here, checked once before timing any
+    """
+    try:
+        get_pdf_renderer().render('<p>benchmark</p>')
+    except (PDFRenderError, ImportError, OSError) as e:
+        print(f'PDF benchmarks skipped: {e}', file=sys.stderr)
+        return False
+    return True
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> float:
+    """
+    Median seconds per call
+
+    Each of the repeats runs the call enough times to last at least
+    min_time, so fast operations are not dominated by timer resolution.
+
+    :param func: Zero-argument callable
+    :param repeat: Timed rounds, the median round is reported
+    :param min_time: Minimum seconds per round
+    :return: Seconds per call
+    """
+    # Warm-up, also surfaces errors before timing
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    rounds = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return statistics.median(rounds)
+
+def run(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    benchmarks: Sequence[Benchmark] = BENCHMARKS,
+    repeat: int = 5,
+    min_time: float = 0.05
+) -> Dict[str, Optional[float]]:
+    """
+    Measure every benchmark at every size
+
+    :param sizes: Repository counts of the synthetic resumes
+    :param benchmarks: Benchmarks to run
+    :param repeat: Timed rounds per measurement
+    :param min_time: Minimum seconds per round
+    :return: Seconds per call keyed by ``name[size]``, None when unavailable here
+    """
+    results: Dict[str, Optional[float]] = {}
+    # PDF rendering needs WeasyPrint and its system libraries
+    can_render_pdf = any(benchmark.needs_pdf for benchmark in benchmarks) and pdf_available()
+    for benchmark in benchmarks:
+        for size in sizes:
+            if benchmark.max_size is not None and size > benchmark.max_size:
+                continue
+            key = f'{benchmark.name}[{size}]'
+            if benchmark.needs_pdf and not can_render_pdf:
+                results[key] = None
+                continue
+            results[key] = measure(benchmark.setup(size), repeat, min_time)
+    return results
+
+def compare(
+    results: Dict[str, Optional[float]],
+    baseline: Dict[str, Optional[float]],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Benchmarks slower than their baseline by more than the threshold
+
+    :param results: Current seconds per call
+    :param baseline: Stored seconds per call
+    :param threshold: Allowed slowdown as a fraction
+    :return: Regressed benchmark keys
+    """
+    return [
+        key for key, seconds in results.items()
+        if seconds is not None and baseline.get(key) and seconds > baseline[key] * (1 + threshold)
+    ]
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Optional[float]]:
+    """
+    Read stored baseline results
+
+    :param path: Baseline file
+    :return: Seconds per call by benchmark key, empty without a baseline
+    """
+    try:
+        with open(path, 'rb') as f:
+            return loads(f.read()).get('results', {})
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(results: Dict[str, Optional[float]], path: str = BASELINE_PATH):
+    """
+    Store results as the new baseline, with the environment they were measured in
+
+    :param results: Seconds per call by benchmark key
+    :param path: Baseline file
+    """
+    record = {
+        'environment': environment(),
+        'results': results
+    }
+    with open(path, 'wb') as f:
+        f.write(dumps(record, pretty=True, sort_keys=True) + b'\n')
+
+def environment() -> Dict[str, Any]:
+    """
+    Interpreter and optional accelerators that shape the numbers
+    """
+    def available(module: str) -> bool:
+        try:
+            __import__(module)
+        except ImportError:
+            return False
+        return True
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'orjson': available('orjson')
+    }
+
+def report(results: Dict[str, Optional[float]], baseline: Dict[str, Optional[float]], regressions: List[str]) -> str:
+    """
+    Render results next to the baseline as a text table
+    """
+    lines = [f"{'benchmark':<42} {'current':>12} {'baseline':>12} {'change':>8}"]
+    for key, seconds in results.items():
+        reference = baseline.get(key)
+        current = 'skipped' if seconds is None else _format_seconds(seconds)
+        stored = _format_seconds(reference) if reference else '-'
+        change = f'{(seconds / reference - 1) * 100:+.0f}%' if seconds is not None and reference else ''
+        flag = '  REGRESSION' if key in regressions else ''
+        lines.append(f'{key:<42} {current:>12} {stored:>12} {change:>8}{flag}')
+    return '\n'.join(lines)
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.1f}us'
+    if seconds < 1:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds:.2f}s'
+
+def main(argv: List[str] = None) -> int:
+    """
+    Benchmark command line entry point
+
+    :return: 1 if any benchmark regressed beyond the threshold, else 0
+    """
+    parser = argparse.ArgumentParser(description='Run microbenchmarks and compare them with the stored baseline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='Repository counts to measure')
+    parser.add_argument('-k', '--filter', help='Only run benchmarks whose name contains this text')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Allowed slowdown, 0.25 is 25%%')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed rounds per measurement')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file')
+    parser.add_argument('--update-baseline', action='store_true', help='Store the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in BENCHMARKS if not args.filter or args.filter in b.name]
+    results = run(args.sizes, benchmarks, repeat=args.repeat)
+    baseline = load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.threshold)
+    print(report(results, baseline, regressions))
+
+    if args.update_baseline:
+        save_baseline(dict(baseline, **results), args.baseline)
+        print(f'Baseline written to {args.baseline}')
+        return 0
+
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import random
+from typing import Any, Dict, List
+from src.core.models import Repository
+
+LANGUAGES = ('Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C', 'Ruby', 'Haskell', None)
+TOPICS = ('cli', 'web', 'api', 'ml', 'devops', 'database', 'testing', 'security', 'graphql', 'docs')
+
+def make_repositories(count: int, seed: int = 0) -> List[Repository]:
+    """
+    Build a deterministic listing shaped like a real user's repositories
+
+    Stars and forks follow a long tail, most repositories have a language
+    and a few topics, and the listing is ordered by last update.
+
+    :param count: Number of repositories
+    :param seed: Random seed, the same seed always gives the same listing
+    :return: Repository records, most recently updated first
+    """
+    rng = random.Random(seed)
+    repositories = []
+    for index in range(count):
+        stars = int(rng.paretovariate(1.2)) - 1
+        repositories.append(Repository(
+            name=f'project-{index}',
+            full_name=f'benchmark/project-{index}',
+            description=f'Synthetic project number {index} used for benchmarks',
+            language=rng.choice(LANGUAGES),
+            stars=stars,
+            forks=stars // rng.randint(2, 10),
+            created_at='2020-01-01T00:00:00Z',
+            updated_at=f'2024-{12 - index % 12:02d}-{28 - index % 28:02d}T00:00:00Z',
+            html_url=f'https://github.com/benchmark/project-{index}',
+            topics=tuple(rng.sample(TOPICS, rng.randint(0, 3)))
+        ))
+    return repositories
+
+def make_resume(count: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Build a resume dictionary listing every synthetic repository as a project
+
+    :param count: Number of projects
+    :param seed: Random seed
+    :return: Resume in the ResumeService output shape
+    """
+    repositories = make_repositories(count, seed)
+    return {
+        'basics': {
+            'name': 'Benchmark User',
+            'username': 'benchmark',
+            'email': 'benchmark@example.com',
+            'bio': 'Synthetic profile',
+            'location': 'Internet',
+            'avatar': 'https://avatars.githubusercontent.com/u/0'
+        },
+        'work': [],
+        'projects': [repo.to_dict() for repo in repositories],
+        'skills': {'programming_languages': ['Python', 'Go', 'Rust'], 'topics': list(TOPICS)},
+        'contributions': {'total_repositories': count, 'followers': 100, 'following': 10}
+    }
+
+def make_agent_resume(count: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Build a resume dictionary in the GitHubResumeAgent shape used by ResumeExporter
+
+    :param count: Number of repositories
+    :param seed: Random seed
+    :return: Agent resume dictionary
+    """
+    repositories = make_repositories(count, seed)
+    return {
+        'profile': {
+            'name': 'Benchmark User',
+            'email': 'benchmark@example.com',
+            'location': 'Internet',
+            'bio': 'Synthetic profile',
+            'total_repositories': count,
+            'total_contributions': count * 10
+        },
+        'repositories': [
+            {
+                'name': repo.name,
+                'description': repo.description,
+                'language': repo.language,
+                'stars': repo.stars,
+                'forks': repo.forks,
+                'url': repo.html_url,
+                'topics': list(repo.topics)
+            }
+            for repo in repositories
+        ],
+        'skills': ['Python', 'Go', 'Rust'],
+        'contributions': {'total_repositories': count, 'total_contributions': count * 10}
+    }
@@ -9,12 +9,17 @@ setup(
         'requests==2.31.0',
         'python-dotenv==1.0.0',
         'PyGithub==2.1.1',
-        'markdown2==2.4.10',
-        'pdfkit==1.0.0',
+        'httpx==0.27.0',
+        'Jinja2==3.1.2',
+        'weasyprint==60.1',
     ],
+    extras_require={
+        'speedups': ['orjson>=3.9'],
+    },
     entry_points={
         'console_scripts': [
             'github-resume=src.app:main',
+            'github-resume-batch=src.batch:main',
         ],
     },
     author='Daniel Corbett',
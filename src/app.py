@@ -1,10 +1,19 @@
 import os
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, request, jsonify, render_template, send_file, stream_with_context
 from src.core.config import config
 from src.services.github_service import GitHubService
 from src.services.resume_service import ResumeService
-from src.utils.export_service import ExportService
-from src.core.logging import app_logger
+from src.services.resume_cache import ResumeCache
+from src.services.snapshot_store import SnapshotStore
+from src.services.batch_service import BatchReport, BatchService
+from src.services.job_queue import FAILED, Job, JobQueue
+from src.utils.export_service import ExportService, buffer_chunks
+from src.utils.template_engine import resume_templates
+from src.core.logging import app_logger, trace_logger
+from src.core.error_handling import CircuitBreakerError, JobQueueFull, RateLimitExceeded, circuit_breakers, retry_budget
+from src.core.serialization import dumps
+from src.core.performance_monitor import monitor
+from src.core.tracing import current_trace, end_trace, start_trace
 
 def create_app():
     """
@@ -22,7 +31,114 @@ def create_app():
         SECRET_KEY=os.urandom(24),
         DEBUG=config.get('app.debug', False)
     )
+
+    # Resume cache shared by every request in this process
+    resume_cache = ResumeCache.from_config()
+    app.extensions['resume_cache'] = resume_cache
+
+    # Per-user snapshots let refreshes fetch only what changed
+    snapshot_store = SnapshotStore.from_config()
+
+    def finish_trace(token):
+        """
+        End the current trace and write it to the trace log when enabled
+        """
+        trace = end_trace(token)
+        if trace is not None and config.get('tracing.log', False):
+            trace_logger.info(dumps(trace.to_dict()).decode('utf-8'))
+
+    def run_job(job: Job) -> dict:
+        """
+        Background job handler, renders PDFs ahead of the result request
+        """
+        # The job ID is the request ID of everything the job logs
+        token = start_trace(job.id)
+        try:
+            resume_service = ResumeService(GitHubService(), snapshots=snapshot_store)
+            resume = resume_cache.get_or_generate(
+                job.username,
+                resume_service.generate_resume,
+                version=resume_service.cache_version
+            )
+            if job.output_format == 'pdf':
+                ExportService.pdf_artifact(resume)
+            return resume
+        finally:
+            finish_trace(token)
+
+    # Background generation decoupled from request latency
+    job_queue = JobQueue.from_config(run_job)
+    app.extensions['job_queue'] = job_queue
+
+    # One pool of spawned workers serves every batch request
+    batch_service = BatchService()
+    app.extensions['batch_service'] = batch_service
+
+    def export_response(username: str, resume: dict, output_format: str, version: str = None):
+        """
+        Serve a resume in the requested export format
+
+        :param username: GitHub username
+        :param resume: Resume dictionary
+        :param output_format: Export format
+        :param version: Resume cache version, enables reuse of encoded JSON
+        :return: Flask response
+        """
+        if output_format == 'json':
+            if request.values.get('pretty', '').lower() in ('1', 'true', 'yes'):
+                return Response(dumps(resume, pretty=True), mimetype='application/json')
+            # Repeat requests reuse the bytes encoded for the cached resume
+            encoded = resume_cache.encode(username, resume, version=version) if version is not None else dumps(resume)
+            return Response(encoded, mimetype='application/json')
+        elif output_format == 'pdf':
+            # Pinned until send_file has opened it, the open handle keeps
+            # serving the artifact even if it is evicted afterwards
+            pdf_path = ExportService.pdf_artifact(resume, pin=True)
+            try:
+                # The artifact name is its content hash, a strong validator
+                return send_file(
+                    pdf_path,
+                    mimetype='application/pdf',
+                    download_name=f'{username}_resume.pdf',
+                    etag=os.path.splitext(os.path.basename(pdf_path))[0]
+                )
+            finally:
+                ExportService.release_artifact(pdf_path)
+        elif output_format in resume_templates:
+            # Template formats stream as they render
+            chunks = buffer_chunks(resume_templates.stream(output_format, resume))
+            return Response(chunks, mimetype=resume_templates.get_format(output_format).mimetype)
+        else:
+            return jsonify({'error': 'Invalid output format'}), 400
     
+    @app.before_request
+    def begin_trace():
+        """
+        Trace the request, reusing the caller's X-Request-ID when it is safe
+        """
+        g.trace_token = start_trace(request.headers.get('X-Request-ID'))
+
+    @app.after_request
+    def add_trace_headers(response):
+        """
+        Report the request ID and the stage timings measured so far
+
+        Streamed bodies render after the headers are sent, their spans only
+        reach the trace log.
+        """
+        trace = current_trace()
+        if trace is not None:
+            response.headers['X-Request-ID'] = trace.request_id
+            if config.get('tracing.server_timing', True):
+                response.headers['Server-Timing'] = trace.server_timing()
+        return response
+
+    @app.teardown_request
+    def close_trace(error=None):
+        token = g.pop('trace_token', None)
+        if token is not None:
+            finish_trace(token)
+
     @app.route('/')
     def index():
         """
@@ -46,26 +162,175 @@ def create_app():
             
             # Initialize services
             github_service = GitHubService()
-            resume_service = ResumeService(github_service)
+            resume_service = ResumeService(github_service, snapshots=snapshot_store)
             
-            # Generate resume
-            resume = resume_service.generate_resume(username)
+            # Generate resume, served from cache when possible
+            resume = resume_cache.get_or_generate(
+                username,
+                resume_service.generate_resume,
+                version=resume_service.cache_version
+            )
             
             # Export based on format
-            if output_format == 'json':
-                return jsonify(resume)
-            elif output_format == 'markdown':
-                return ExportService.to_markdown(resume)
-            elif output_format == 'pdf':
-                pdf_path = ExportService.to_pdf(resume)
-                return jsonify({'pdf_path': pdf_path})
-            else:
-                return jsonify({'error': 'Invalid output format'}), 400
+            return export_response(username, resume, output_format, version=resume_service.cache_version)
         
+        except RateLimitExceeded as e:
+            app_logger.warning(f"Resume generation deferred: {e}")
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = str(int(e.retry_after or 60))
+            return response, 429
+
+        except CircuitBreakerError as e:
+            # GitHub is failing, shed load instead of tying up workers
+            app_logger.warning(f"Resume generation shed: {e}")
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = str(int(config.get('circuit_breaker.recovery_time', 30)))
+            return response, 503
+
         except Exception as e:
             app_logger.error(f"Resume generation error: {e}")
             return jsonify({'error': str(e)}), 500
     
+    @app.route('/batch_generate', methods=['POST'])
+    def batch_generate():
+        """
+        Generate resumes for many users, streamed back as JSON lines
+
+        Accepts a JSON body ``{"usernames": [...]}`` or a form field
+        ``usernames`` separated by newlines or commas. Each line of the
+        response is one user's result; the last line is the summary.
+        """
+        payload = request.get_json(silent=True) or {}
+        usernames = payload.get('usernames')
+        if usernames is None:
+            raw = request.form.get('usernames', '')
+            usernames = raw.replace(',', '\n').splitlines()
+        usernames = list(dict.fromkeys(name.strip() for name in usernames if isinstance(name, str) and name.strip()))
+
+        # Validate input
+        if not usernames:
+            return jsonify({'error': 'At least one GitHub username is required'}), 400
+        max_usernames = config.get('batch.max_usernames', 1000)
+        if len(usernames) > max_usernames:
+            return jsonify({'error': f'At most {max_usernames} usernames per batch request'}), 400
+
+        def generate():
+            report = BatchReport(len(usernames), workers=batch_service.workers)
+            for record in batch_service.iter_results(usernames):
+                report.add(record)
+                yield dumps(record) + b'\n'
+            yield dumps({'summary': report.as_dict()}) + b'\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+    @app.route('/jobs', methods=['POST'])
+    def submit_job():
+        """
+        Queue resume generation and answer with a job ID right away
+        """
+        username = request.form.get('github_username')
+        output_format = request.form.get('format', 'json')
+
+        # Validate input
+        if not username:
+            return jsonify({'error': 'GitHub username is required'}), 400
+        if output_format not in ('json', 'pdf') and output_format not in resume_templates:
+            return jsonify({'error': 'Invalid output format'}), 400
+        try:
+            priority = int(request.form.get('priority', 0))
+        except ValueError:
+            return jsonify({'error': 'Priority must be an integer'}), 400
+
+        try:
+            job = job_queue.submit(username, output_format, priority)
+        except JobQueueFull as e:
+            app_logger.warning(f"Resume job rejected: {e}")
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = '30'
+            return response, 503
+
+        response = jsonify(job_status(job))
+        response.headers['Location'] = f'/jobs/{job.id}'
+        return response, 202
+
+    def job_status(job: Job) -> dict:
+        """
+        Public status of a job with links to poll and fetch the result
+        """
+        status = job.to_dict()
+        status['position'] = job_queue.position(job.id)
+        status['status_url'] = f'/jobs/{job.id}'
+        status['result_url'] = f'/jobs/{job.id}/result'
+        return status
+
+    @app.route('/jobs/<job_id>')
+    def get_job(job_id):
+        """
+        Report the status of a resume job
+        """
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        return jsonify(job_status(job))
+
+    @app.route('/jobs/<job_id>/result')
+    def get_job_result(job_id):
+        """
+        Serve a finished job's resume in the format it was requested in
+        """
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        if job.status == FAILED:
+            return jsonify(job_status(job)), 500
+        if not job.done:
+            # Not ready yet, poll again
+            response = jsonify(job_status(job))
+            response.headers['Retry-After'] = '2'
+            return response, 202
+        return export_response(job.username, job.result, job.output_format)
+
+    @app.route('/jobs/stats')
+    def job_stats():
+        """
+        Report job queue counters for monitoring
+        """
+        return jsonify(job_queue.stats())
+
+    @app.route('/circuits/stats')
+    def circuit_stats():
+        """
+        Report circuit breaker state per GitHub endpoint
+        """
+        return jsonify(circuit_breakers.stats())
+
+    @app.route('/retry/stats')
+    def retry_stats():
+        """
+        Report retry budget counters for monitoring
+        """
+        return jsonify(retry_budget.stats())
+
+    # Component counters exported next to the function timings
+    monitor.register_gauges('resume_cache', resume_cache.stats)
+    monitor.register_gauges('jobs', job_queue.stats)
+    monitor.register_gauges('retry_budget', retry_budget.stats)
+    monitor.register_gauges('circuit', circuit_breakers.stats)
+
+    @app.route('/metrics')
+    def metrics():
+        """
+        Expose performance metrics in the Prometheus text format
+        """
+        return Response(monitor.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+    @app.route('/cache/stats')
+    def cache_stats():
+        """
+        Report resume cache counters for monitoring
+        """
+        return jsonify(resume_cache.stats())
+
     @app.errorhandler(Exception)
     def handle_error(e):
         """
@@ -82,4 +347,4 @@ app = create_app()
 if __name__ == '__main__':
     # Validate configuration before starting
     config.validate()
-    app.run(host='0.0.0.0', port=5000)
+    app.run(host='0.0.0.0', port=config.get('app.port', 5000))
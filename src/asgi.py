@@ -0,0 +1,235 @@
+import asyncio
+import os
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import parse_qs
+from src.services.async_github_service import AsyncGitHubService
+from src.services.async_resume_service import AsyncResumeService
+from src.core.serialization import dumps, loads
+from src.utils.export_service import ExportService, buffer_chunks
+from src.utils.template_engine import resume_templates
+from src.core.config import config
+from src.core.error_handling import CircuitBreakerError, RateLimitExceeded
+from src.core.logging import app_logger, trace_logger
+from src.core.tracing import current_trace, end_trace, start_trace
+
+class ResumeASGIApp:
+    """
+    Minimal ASGI entry point for concurrent resume generation
+
+    Principles:
+    - One event loop serves many in-flight resume builds
+    - Same request contract as the Flask /generate_resume route
+    - Pooled GitHub client for the whole process lifetime
+
+    Run with any ASGI server, e.g. ``uvicorn src.asgi:app``.
+    """
+    def __init__(self):
+        self.github_service: Optional[AsyncGitHubService] = None
+
+    async def __call__(self, scope: Dict[str, Any], receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        if scope['type'] != 'http':
+            return
+
+        headers = dict(scope.get('headers') or [])
+        token = start_trace(headers.get(b'x-request-id', b'').decode('latin-1') or None)
+        try:
+            await self._handle(scope, receive, self._traced_send(send))
+        finally:
+            trace = end_trace(token)
+            if config.get('tracing.log', False):
+                trace_logger.info(dumps(trace.to_dict()).decode('utf-8'))
+
+    async def _handle(self, scope: Dict[str, Any], receive, send):
+        """
+        Route an HTTP request
+        """
+        if scope['path'] != '/generate_resume' or scope['method'] != 'POST':
+            await self._send(send, 404, {'error': 'Not found'})
+            return
+
+        started = False
+
+        async def tracked_send(message: Dict[str, Any]):
+            nonlocal started
+            if message['type'] == 'http.response.start':
+                started = True
+            await send(message)
+
+        try:
+            params = self._parse_body(scope, await self._read_body(receive))
+            await self._generate_resume(scope, params, tracked_send)
+        except Exception as e:
+            if started:
+                # Headers are out, a second response start would break the
+                # protocol; let the server abort the connection instead
+                app_logger.error(f"Resume response failed mid-stream: {e}")
+                raise
+            if isinstance(e, RateLimitExceeded):
+                app_logger.warning(f"Resume generation deferred: {e}")
+                await self._send(send, 429, {'error': str(e)}, retry_after=int(e.retry_after or 60))
+            elif isinstance(e, CircuitBreakerError):
+                # GitHub is failing, shed load like the Flask app does
+                app_logger.warning(f"Resume generation shed: {e}")
+                retry_after = int(config.get('circuit_breaker.recovery_time', 30))
+                await self._send(send, 503, {'error': str(e)}, retry_after=retry_after)
+            else:
+                app_logger.error(f"Resume generation error: {e}")
+                await self._send(send, 500, {'error': str(e)})
+
+    async def _generate_resume(self, scope: Dict[str, Any], params: Dict[str, str], send):
+        """
+        Generate resume and reply in the requested format
+        """
+        username = params.get('github_username')
+        output_format = params.get('format', 'json')
+
+        # Validate input
+        if not username:
+            await self._send(send, 400, {'error': 'GitHub username is required'})
+            return
+
+        resume = await AsyncResumeService(self._get_github_service()).generate_resume(username)
+
+        # Export based on format
+        if output_format == 'json':
+            await self._send(send, 200, resume)
+        elif output_format == 'pdf':
+            # PDF rendering blocks, keep it off the event loop
+            pdf_path = await asyncio.to_thread(ExportService.pdf_artifact, resume, True)
+            try:
+                await self._send_file(scope, send, pdf_path, 'application/pdf')
+            finally:
+                # Pinned until sent, releasing may evict other artifacts
+                await asyncio.to_thread(ExportService.release_artifact, pdf_path)
+        elif output_format in resume_templates:
+            mimetype = resume_templates.get_format(output_format).mimetype
+            await self._stream(send, resume_templates.stream(output_format, resume), f'{mimetype}; charset=utf-8')
+        else:
+            await self._send(send, 400, {'error': 'Invalid output format'})
+
+    @staticmethod
+    def _traced_send(send):
+        """
+        Wrap send to add the request ID and Server-Timing to response headers
+        """
+        async def traced_send(message: Dict[str, Any]):
+            if message['type'] == 'http.response.start':
+                trace = current_trace()
+                headers = list(message.get('headers') or [])
+                headers.append((b'x-request-id', trace.request_id.encode('latin-1')))
+                if config.get('tracing.server_timing', True):
+                    headers.append((b'server-timing', trace.server_timing().encode('latin-1')))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        return traced_send
+
+    def _get_github_service(self) -> AsyncGitHubService:
+        """
+        Return the process-wide async GitHub service
+        """
+        if self.github_service is None:
+            self.github_service = AsyncGitHubService()
+        return self.github_service
+
+    async def _lifespan(self, receive, send):
+        """
+        Handle ASGI startup and shutdown events
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.github_service is not None:
+                    await self.github_service.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        """
+        Collect the full request body
+        """
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        return body
+
+    @staticmethod
+    def _parse_body(scope: Dict[str, Any], body: bytes) -> Dict[str, str]:
+        """
+        Parse a form-encoded or JSON request body
+        """
+        headers = dict(scope.get('headers') or [])
+        content_type = headers.get(b'content-type', b'').decode('latin-1')
+        if content_type.startswith('application/json'):
+            return loads(body or b'{}')
+        return {key: values[0] for key, values in parse_qs(body.decode('utf-8')).items()}
+
+    @staticmethod
+    async def _send(send, status: int, payload: Any, content_type: str = 'application/json', retry_after: int = None):
+        """
+        Send a complete HTTP response
+        """
+        if isinstance(payload, str):
+            body = payload.encode('utf-8')
+        else:
+            body = dumps(payload)
+        headers = [
+            (b'content-type', content_type.encode('latin-1')),
+            (b'content-length', str(len(body)).encode('latin-1'))
+        ]
+        if retry_after is not None:
+            headers.append((b'retry-after', str(retry_after).encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    async def _stream(send, chunks: Iterable[str], content_type: str):
+        """
+        Send a rendered document as it is produced, without a content length
+        """
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', content_type.encode('latin-1'))]
+        })
+        for chunk in buffer_chunks(chunks):
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    @staticmethod
+    async def _send_file(scope: Dict[str, Any], send, path: str, content_type: str):
+        """
+        Send a file, zero-copy when the server supports the pathsend extension
+        """
+        headers = [
+            (b'content-type', content_type.encode('latin-1')),
+            (b'content-length', str(os.path.getsize(path)).encode('latin-1')),
+            # The artifact name is its content hash, a strong validator
+            (b'etag', f'"{os.path.splitext(os.path.basename(path))[0]}"'.encode('latin-1'))
+        ]
+        await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+
+        if 'http.response.pathsend' in (scope.get('extensions') or {}):
+            await send({'type': 'http.response.pathsend', 'path': path})
+            return
+
+        body = await asyncio.to_thread(ResumeASGIApp._read_file, path)
+        await send({'type': 'http.response.body', 'body': body})
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+
+# ASGI application instance
+app = ResumeASGIApp()
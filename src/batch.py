@@ -0,0 +1,55 @@
+import argparse
+import json
+import sys
+from typing import List
+from src.services.batch_service import BatchService
+
+def read_usernames(sources: List[str]) -> List[str]:
+    """
+    Collect usernames from arguments, files or stdin
+
+    Each source is a username, a path prefixed with ``@`` holding one
+    username per line, or ``-`` for stdin. Blank lines and ``#`` comments
+    are ignored.
+
+    :param sources: Command-line sources
+    :return: Usernames in order of appearance
+    """
+    usernames = []
+    for source in sources:
+        if source == '-':
+            lines = sys.stdin.read().splitlines()
+        elif source.startswith('@'):
+            with open(source[1:]) as f:
+                lines = f.read().splitlines()
+        else:
+            lines = [source]
+        usernames.extend(line.split('#', 1)[0].strip() for line in lines)
+    return [username for username in usernames if username]
+
+def main(argv: List[str] = None) -> int:
+    """
+    Batch resume generation command line entry point
+    """
+    parser = argparse.ArgumentParser(description='Generate resumes for many GitHub users')
+    parser.add_argument('usernames', nargs='+', help='Usernames, @file with one username per line, or - for stdin')
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('-o', '--output', help='JSONL file receiving one result per line')
+    output.add_argument('-d', '--output-dir', help='Directory receiving one <username>.json per user')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes (default: batch.workers)')
+    args = parser.parse_args(argv)
+
+    batch_service = BatchService(workers=args.workers)
+    try:
+        report = batch_service.run(
+            read_usernames(args.usernames),
+            output_path=args.output,
+            output_dir=args.output_dir
+        )
+    finally:
+        batch_service.shutdown()
+    print(json.dumps(report, indent=2))
+    return 1 if report['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -31,15 +31,97 @@ class ConfigManager:
         cls._config = {
             'github': {
                 'token': os.getenv('GITHUB_TOKEN'),
-                'api_base_url': 'https://api.github.com',
-                'rate_limit_buffer': 0.1  # 10% buffer for rate limits
+                # Extra tokens balanced alongside GITHUB_TOKEN, comma-separated
+                'tokens': [token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()],
+                'api_base_url': os.getenv('GITHUB_API_BASE_URL', 'https://api.github.com'),  # Point at a stand-in for load tests
+                'rate_limit_buffer': 0.1,  # 10% buffer for rate limits
+                'rate_limit_pacing_threshold': float(os.getenv('GITHUB_RATE_LIMIT_PACING', '0.2')),  # Pace below 20% left
+                'rate_limit_max_wait': float(os.getenv('GITHUB_RATE_LIMIT_MAX_WAIT', '30')),  # Seconds before failing fast
+                'max_concurrent_requests': int(os.getenv('GITHUB_MAX_CONCURRENCY', '10'))
+            },
+            'http': {
+                'pool_connections': int(os.getenv('HTTP_POOL_CONNECTIONS', '10')),  # Cached host pools
+                'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', '20')),  # Connections per host
+                'pool_block': os.getenv('HTTP_POOL_BLOCK', 'False') == 'True',
+                'timeout': float(os.getenv('HTTP_TIMEOUT', '10'))
             },
             'app': {
                 'debug': os.getenv('FLASK_DEBUG', 'False') == 'True',
-                'environment': os.getenv('FLASK_ENV', 'production')
+                'environment': os.getenv('FLASK_ENV', 'production'),
+                'port': int(os.getenv('PORT', '5000'))
+            },
+            'retry': {
+                'max_delay': float(os.getenv('RETRY_MAX_DELAY', '30')),  # Longest wait, longer Retry-After fails
+                'budget_ratio': float(os.getenv('RETRY_BUDGET_RATIO', '0.1')),  # Retries earned per call
+                'budget_min_per_second': float(os.getenv('RETRY_BUDGET_MIN_PER_SECOND', '1')),
+                'budget_max_tokens': float(os.getenv('RETRY_BUDGET_MAX_TOKENS', '10'))
+            },
+            'circuit_breaker': {
+                'window': float(os.getenv('CIRCUIT_WINDOW', '60')),  # Seconds of outcomes per failure rate
+                'min_calls': int(os.getenv('CIRCUIT_MIN_CALLS', '10')),  # Calls in the window before opening
+                'failure_rate': float(os.getenv('CIRCUIT_FAILURE_RATE', '0.5')),
+                'recovery_time': float(os.getenv('CIRCUIT_RECOVERY_TIME', '30')),  # Seconds open before probing
+                'half_open_max_calls': int(os.getenv('CIRCUIT_HALF_OPEN_CALLS', '2'))
+            },
+            'monitoring': {
+                'enabled': os.getenv('MONITORING_ENABLED', 'True') == 'True',  # Per-function timers and /metrics
+                'memory_sample_rate': float(os.getenv('MONITORING_MEMORY_SAMPLE_RATE', '0.01'))  # Calls traced with tracemalloc
+            },
+            'tracing': {
+                'server_timing': os.getenv('TRACING_SERVER_TIMING', 'True') == 'True',  # Span durations in responses
+                'log': os.getenv('TRACING_LOG', 'False') == 'True'  # Structured span log in logs/trace.log
+            },
+            'cache': {
+                'backend': os.getenv('RESPONSE_CACHE_BACKEND', 'memory'),  # memory, disk or none
+                'directory': os.getenv('RESPONSE_CACHE_DIR', '.cache/github'),
+                'max_entries': int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+            },
+            'resume_cache': {
+                'max_entries': int(os.getenv('RESUME_CACHE_MAX_ENTRIES', '256')),
+                'ttl': float(os.getenv('RESUME_CACHE_TTL', '600')),  # Seconds served as fresh
+                'stale_ttl': float(os.getenv('RESUME_CACHE_STALE_TTL', '3600')),  # Seconds served while refreshing
+                'refresh_workers': int(os.getenv('RESUME_CACHE_REFRESH_WORKERS', '2'))
+            },
+            'resume': {
+                'fetch_workers': int(os.getenv('RESUME_FETCH_WORKERS', '8'))
+            },
+            'snapshots': {
+                'enabled': os.getenv('RESUME_SNAPSHOTS', 'True') == 'True',  # Incremental regeneration
+                'directory': os.getenv('RESUME_SNAPSHOT_DIR', '.cache/snapshots'),
+                'max_age': float(os.getenv('RESUME_SNAPSHOT_MAX_AGE', str(7 * 24 * 3600)))  # Seconds before a full rebuild
+            },
+            'ranking': {
+                'stars_weight': float(os.getenv('RANKING_STARS_WEIGHT', '0.4')),
+                'forks_weight': float(os.getenv('RANKING_FORKS_WEIGHT', '0.3')),
+                'language_bonus': float(os.getenv('RANKING_LANGUAGE_BONUS', '0.3')),
+                'popular_languages': [
+                    language.strip()
+                    for language in os.getenv('RANKING_POPULAR_LANGUAGES', 'Python,JavaScript,TypeScript,Java,Go').split(',')
+                    if language.strip()
+                ],
+                'top_k': int(os.getenv('RANKING_TOP_K', '10'))  # Projects per resume
+            },
+            'jobs': {
+                'workers': int(os.getenv('JOB_WORKERS', '2')),  # Background generation threads
+                'max_depth': int(os.getenv('JOB_MAX_DEPTH', '100')),  # Queued jobs before rejecting
+                'max_finished': int(os.getenv('JOB_MAX_FINISHED', '1000')),  # Finished jobs kept in memory
+                'database': os.getenv('JOB_DATABASE')  # SQLite file for durable jobs, in memory when unset
+            },
+            'batch': {
+                'workers': int(os.getenv('BATCH_WORKERS', str(os.cpu_count() or 1))),
+                'max_usernames': int(os.getenv('BATCH_MAX_USERNAMES', '1000'))  # Per HTTP batch request
+            },
+            'pdf': {
+                'workers': int(os.getenv('PDF_WORKERS', '2')),  # Long-lived renderer processes
+                'max_concurrency': int(os.getenv('PDF_MAX_CONCURRENCY', '4')),
+                'timeout': float(os.getenv('PDF_TIMEOUT', '30'))  # Seconds per render
+            },
+            'artifacts': {
+                'directory': os.getenv('ARTIFACT_CACHE_DIR', '.cache/artifacts'),
+                'max_bytes': int(os.getenv('ARTIFACT_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))  # Disk budget for rendered exports
             },
             'export': {
-                'formats': ['json', 'markdown', 'pdf'],
+                'formats': ['json', 'markdown', 'html', 'pdf'],
                 'max_projects': 50
             }
         }
@@ -77,11 +159,13 @@ class ConfigManager:
         
         :raises ValueError: If critical configuration is missing
         """
-        if not cls.get('github.token'):
+        # get() never returns the token, read it where GitHubService does
+        token = (os.getenv('GITHUB_TOKEN') or cls._config['github']['token'] or '').strip()
+        if not token:
             raise ValueError("GitHub token is required")
 
         # Additional validation logic
-        if len(cls.get('github.token', '')) < 20:
+        if len(token) < 20:
             raise ValueError("Invalid GitHub token format")
 
 # Singleton instance for easy import
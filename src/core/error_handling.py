@@ -1,88 +1,632 @@
+import asyncio
+import random
+import threading
 import time
+from collections import deque
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import httpx
+import requests
+from src.core.config import config
 from src.core.logging import error_logger
 
+def is_service_failure(error: Exception) -> bool:
+    """
+    Whether an error says the remote service is unhealthy
+
+    Client errors such as 404 for an unknown user and deliberate rate-limit
+    back-pressure say nothing about the service's health.
+
+    :param error: Raised exception
+    :return: True for transport errors and 5xx responses
+    """
+    if isinstance(error, (RateLimitExceeded, CircuitBreakerError)):
+        return False
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return True
+
 class CircuitBreaker:
     """
-    Implement Circuit Breaker pattern for resilient API calls
-    
+    Thread-safe circuit breaker driven by a sliding-window failure rate
+
     Principles:
     - Prevent cascading failures
     - Provide graceful degradation
-    - Automatic recovery
+    - Automatic recovery through a bounded number of probes
     """
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+
     def __init__(
-        self, 
-        failure_threshold: int = 3, 
-        recovery_time: float = 60.0
+        self,
+        name: str = 'default',
+        window: float = 60.0,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        recovery_time: float = 30.0,
+        half_open_max_calls: int = 2,
+        on_transition: Callable[[str, str, str], None] = None,
+        clock: Callable[[], float] = time.monotonic
     ):
-        self.failure_count = 0
-        self.failure_threshold = failure_threshold
+        """
+        Initialize circuit breaker
+
+        :param name: Endpoint the breaker protects
+        :param window: Seconds of call outcomes the failure rate is computed over
+        :param min_calls: Calls in the window before the circuit may open
+        :param failure_rate: Failure fraction in the window that opens the circuit
+        :param recovery_time: Seconds the circuit stays open before probing
+        :param half_open_max_calls: Probes let through while half-open, all must succeed to close
+        :param on_transition: Callback receiving name, old state and new state
+        :param clock: Monotonic time source
+        """
+        self.name = name
+        # Path part of the name, e.g. users for api.github.com/users
+        self.endpoint = name.rsplit('/', 1)[-1]
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
         self.recovery_time = recovery_time
-        self.last_failure_time: Optional[float] = None
-        self.state = 'CLOSED'
+        self.half_open_max_calls = half_open_max_calls
+        self.on_transition = on_transition
+        self.clock = clock
+        self.state = self.CLOSED
+        self.opened_at: Optional[float] = None
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._window_failures = 0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'failures': 0, 'fast_fails': 0, 'opened': 0, 'half_opened': 0, 'closed': 0}
 
     def __call__(self, func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                probe = self.acquire()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    self.record_error(e, probe)
+                    raise
+                self.record(False, probe)
+                return result
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Check if circuit is open
-            if self.state == 'OPEN':
-                if time.time() - self.last_failure_time > self.recovery_time:
-                    self.state = 'HALF_OPEN'
-                else:
-                    error_logger.warning(f"Circuit OPEN for {func.__name__}")
-                    raise CircuitBreakerError(f"Service {func.__name__} is temporarily unavailable")
-
+            probe = self.acquire()
             try:
                 result = func(*args, **kwargs)
-                # Reset on success
-                if self.state == 'HALF_OPEN':
-                    self.state = 'CLOSED'
-                    self.failure_count = 0
-                return result
-            
             except Exception as e:
-                self.failure_count += 1
-                error_logger.error(f"Error in {func.__name__}: {e}")
-
-                if self.failure_count >= self.failure_threshold:
-                    self.state = 'OPEN'
-                    self.last_failure_time = time.time()
-                
+                self.record_error(e, probe)
                 raise
+            self.record(False, probe)
+            return result
 
         return wrapper
 
-def retry(max_attempts: int = 3, delay: float = 1.0):
+    def acquire(self) -> bool:
+        """
+        Admit a call or fail fast
+
+        :return: True if the call is a half-open probe, pass it back to record
+        :raises CircuitBreakerError: While open, or half-open with every probe slot taken
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if self.clock() - self.opened_at < self.recovery_time:
+                    self._stats['fast_fails'] += 1
+                    raise CircuitBreakerError(f"Service {self.name} is temporarily unavailable")
+                self._transition(self.HALF_OPEN)
+
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self._stats['fast_fails'] += 1
+                    raise CircuitBreakerError(f"Service {self.name} is recovering, probes in flight")
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, failed: bool, probe: bool = False):
+        """
+        Record the outcome of an admitted call
+
+        :param failed: Whether the call failed because of the service
+        :param probe: Value returned by acquire for this call
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            if failed:
+                self._stats['failures'] += 1
+
+            if probe:
+                self._probes -= 1
+                if self.state != self.HALF_OPEN:
+                    return
+                if failed:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_max_calls:
+                        self._transition(self.CLOSED)
+                return
+
+            # Calls admitted before the circuit opened do not reset it
+            if self.state != self.CLOSED:
+                return
+
+            now = self.clock()
+            self._outcomes.append((now, failed))
+            self._window_failures += failed
+            while self._outcomes and self._outcomes[0][0] <= now - self.window:
+                self._window_failures -= self._outcomes.popleft()[1]
+
+            if len(self._outcomes) >= self.min_calls and self._window_failures >= self.failure_rate * len(self._outcomes):
+                self._open()
+
+    def record_error(self, error: Exception, probe: bool = False):
+        """
+        Record a call that raised, counting only service failures
+
+        :param error: Raised exception
+        :param probe: Value returned by acquire for this call
+        """
+        failed = is_service_failure(error)
+        if failed:
+            error_logger.error(f"Error calling {self.name}: {error}")
+        if failed or not probe:
+            self.record(failed, probe)
+        else:
+            self.release(probe)
+
+    def release(self, probe: bool):
+        """
+        End an admitted call without judging the service, freeing its probe slot
+
+        :param probe: Value returned by acquire for this call
+        """
+        if probe:
+            with self._lock:
+                self._probes -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of breaker state and counters
+
+        :return: State, window failure rate, call, failure, fast-fail and transition counters
+        """
+        with self._lock:
+            calls = len(self._outcomes)
+            return dict(
+                self._stats,
+                state=self.state,
+                window_calls=calls,
+                window_failure_rate=self._window_failures / calls if calls else 0.0
+            )
+
+    def _open(self):
+        """
+        Open the circuit, the caller holds the lock
+        """
+        self.opened_at = self.clock()
+        self._transition(self.OPEN)
+
+    def _transition(self, state: str):
+        """
+        Move to a new state and publish it, the caller holds the lock
+        """
+        previous, self.state = self.state, state
+        self._stats[{self.OPEN: 'opened', self.HALF_OPEN: 'half_opened', self.CLOSED: 'closed'}[state]] += 1
+        if state == self.HALF_OPEN:
+            self._probes = self._probe_successes = 0
+        elif state == self.CLOSED:
+            self._outcomes.clear()
+            self._window_failures = 0
+
+        log = error_logger.warning if state == self.OPEN else error_logger.info
+        log(f"Circuit {self.name}: {previous} -> {state}")
+        if self.on_transition is not None:
+            try:
+                self.on_transition(self.name, previous, state)
+            except Exception as e:
+                error_logger.error(f"Circuit transition listener failed: {e}")
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide circuit breakers, one per endpoint
+
+    Principles:
+    - Share breaker state across every service instance and thread
+    - Isolate endpoints so one failing API does not cut off the others
+    - Publish state transitions to subscribers
     """
-    Retry decorator with exponential backoff
-    
-    :param max_attempts: Maximum retry attempts
-    :param delay: Initial delay between retries
+    def __init__(self, **settings):
+        """
+        Initialize registry
+
+        :param settings: CircuitBreaker keyword arguments applied to every breaker
+        """
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listeners: List[Callable[[str, str, str], None]] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'CircuitBreakerRegistry':
+        """
+        Create a registry from the circuit_breaker.* settings
+        """
+        return cls(
+            window=config.get('circuit_breaker.window', 60.0),
+            min_calls=config.get('circuit_breaker.min_calls', 10),
+            failure_rate=config.get('circuit_breaker.failure_rate', 0.5),
+            recovery_time=config.get('circuit_breaker.recovery_time', 30.0),
+            half_open_max_calls=config.get('circuit_breaker.half_open_max_calls', 2)
+        )
+
+    def get(self, name: str) -> CircuitBreaker:
+        """
+        Return the breaker for an endpoint, creating it on first use
+
+        :param name: Endpoint name
+        :return: Shared circuit breaker
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(name, on_transition=self._publish, **self.settings)
+                    self._breakers[name] = breaker
+        return breaker
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """
+        Return the breaker for the endpoint a URL belongs to
+
+        Endpoints are the host plus the first path segment, for example
+        ``api.github.com/users`` or ``api.github.com/graphql``.
+
+        :param url: Request URL
+        :return: Shared circuit breaker
+        """
+        parts = urlsplit(url)
+        segment = parts.path.strip('/').split('/', 1)[0]
+        return self.get(f'{parts.netloc}/{segment}')
+
+    def subscribe(self, listener: Callable[[str, str, str], None]):
+        """
+        Register a callback receiving endpoint name, old state and new state
+
+        :param listener: Transition callback
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot of every breaker for monitoring
+
+        :return: Breaker stats by endpoint name
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.stats() for name, breaker in breakers.items()}
+
+    def reset(self):
+        """
+        Forget every breaker
+        """
+        with self._lock:
+            self._breakers.clear()
+
+    def _publish(self, name: str, previous: str, state: str):
+        for listener in list(self._listeners):
+            listener(name, previous, state)
+
+def retry_after_hint(error: Exception, now: Callable[[], float] = time.time) -> Optional[float]:
+    """
+    Seconds the server asked the client to wait before trying again
+
+    :param error: Raised exception carrying an HTTP response
+    :param now: Wall-clock source for HTTP dates and reset times
+    :return: Seconds to wait, or None without a hint
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not hasattr(headers, 'get'):
+        return None
+
+    value = headers.get('Retry-After')
+    if isinstance(value, str) and value.strip():
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - now())
+            except (TypeError, ValueError):
+                return None
+
+    # Exhausted budgets name the time they reset instead
+    if headers.get('X-RateLimit-Remaining') == '0':
+        try:
+            return max(0.0, float(headers.get('X-RateLimit-Reset')) - now())
+        except (TypeError, ValueError):
+            return None
+    return None
+
+def is_retryable(error: Exception) -> bool:
     """
+    Whether a failed call may succeed when repeated
+
+    Transport errors, 5xx responses and rate-limit answers (429, or 403
+    with a wait hint as GitHub sends for secondary limits) are transient.
+    Other client errors, such as 404 for an unknown user or 401 for a bad
+    token, fail the same way every time.
+
+    :param error: Raised exception
+    :return: True if the call should be retried
+    """
+    if isinstance(error, (RateLimitExceeded, CircuitBreakerError)):
+        return False
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status_code, int):
+        if status_code >= 500 or status_code == 429:
+            return True
+        return status_code == 403 and retry_after_hint(error) is not None
+    return isinstance(error, TRANSIENT_ERRORS)
+
+class RetryBudget:
+    """
+    Process-wide allowance of retries relative to first attempts
+
+    Principles:
+    - Retries add at most a fixed fraction of extra traffic
+    - A small floor keeps retries possible while traffic is light
+    - Once spent, calls fail instead of amplifying an outage
+    """
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize retry budget
+
+        :param ratio: Retries earned per first attempt
+        :param min_per_second: Retries earned per second regardless of traffic
+        :param max_tokens: Most retries that can be saved up
+        :param clock: Monotonic time source
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.clock = clock
+        self._tokens = max_tokens
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._stats = {'attempts': 0, 'retries': 0, 'exhausted': 0}
+
+    @classmethod
+    def from_config(cls) -> 'RetryBudget':
+        """
+        Create a retry budget from the retry.* settings
+        """
+        return cls(
+            ratio=config.get('retry.budget_ratio', 0.1),
+            min_per_second=config.get('retry.budget_min_per_second', 1.0),
+            max_tokens=config.get('retry.budget_max_tokens', 10.0)
+        )
+
+    def deposit(self):
+        """
+        Record a first attempt, earning a fraction of a retry
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+            self._stats['attempts'] += 1
+
+    def withdraw(self) -> bool:
+        """
+        Spend one retry
+
+        :return: False if the budget is exhausted and the call must not be retried
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self._stats['exhausted'] += 1
+                return False
+            self._tokens -= 1
+            self._stats['retries'] += 1
+            return True
+
+    def reset(self):
+        """
+        Refill the budget and clear its counters
+        """
+        with self._lock:
+            self._tokens = self.max_tokens
+            self._updated = self.clock()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of budget counters for monitoring
+
+        :return: Attempt, retry and exhaustion counters plus retries available
+        """
+        with self._lock:
+            self._refill()
+            return dict(self._stats, available=self._tokens)
+
+    def _refill(self):
+        """
+        Earn the time-based floor, the caller holds the lock
+        """
+        now = self.clock()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+class RetryPolicy:
+    """
+    When and how long to wait before repeating a failed call
+
+    Backoff uses full jitter, a uniform wait between zero and the
+    exponential cap, so callers failing together do not retry together.
+    """
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = None,
+        budget: RetryBudget = None
+    ):
+        """
+        Initialize retry policy
+
+        :param max_attempts: Maximum attempts, the first one included
+        :param base_delay: Backoff cap of the first retry, doubled per retry
+        :param max_delay: Longest wait, longer server hints are not waited for
+        :param budget: Retry budget, defaults to the process-wide one
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = config.get('retry.max_delay', 30.0) if max_delay is None else max_delay
+        self._budget = budget
+
+    @property
+    def budget(self) -> RetryBudget:
+        return self._budget or retry_budget
+
+    def next_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Wait before the next attempt
+
+        :param attempt: Attempts made so far
+        :param error: Error of the last attempt
+        :return: Seconds to wait, or None if the error must be raised
+        """
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return None
+
+        hint = retry_after_hint(error)
+        if hint is not None:
+            if hint > self.max_delay:
+                return None
+            delay = hint
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+        if not self.budget.withdraw():
+            error_logger.warning(f"Retry budget exhausted, not retrying: {error}")
+            return None
+        return delay
+
+def retry(max_attempts: int = 3, delay: float = 1.0, max_delay: float = None, budget: RetryBudget = None):
+    """
+    Retry decorator for transient errors with full-jitter backoff
+
+    Honors Retry-After and draws every retry from the shared retry budget.
+
+    :param max_attempts: Maximum attempts, the first one included
+    :param delay: Backoff cap of the first retry
+    :param max_delay: Longest wait between attempts
+    :param budget: Retry budget, defaults to the process-wide one
+    """
+    policy = RetryPolicy(max_attempts, delay, max_delay, budget)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempts = 0
-            current_delay = delay
+            policy.budget.deposit()
+            attempt = 0
 
-            while attempts < max_attempts:
+            while True:
+                attempt += 1
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    attempts += 1
-                    error_logger.warning(f"Attempt {attempts} failed: {e}")
-                    
-                    if attempts == max_attempts:
+                    wait = policy.next_delay(attempt, e)
+                    if wait is None:
+                        raise
+                    error_logger.warning(f"Attempt {attempt} of {func.__name__} failed, retrying in {wait:.2f}s: {e}")
+                    time.sleep(wait)
+
+        return wrapper
+    return decorator
+
+def async_retry(max_attempts: int = 3, delay: float = 1.0, max_delay: float = None, budget: RetryBudget = None):
+    """
+    Retry decorator for transient errors with full-jitter backoff for coroutines
+
+    Waits with asyncio.sleep so backoff never blocks the event loop.
+
+    :param max_attempts: Maximum attempts, the first one included
+    :param delay: Backoff cap of the first retry
+    :param max_delay: Longest wait between attempts
+    :param budget: Retry budget, defaults to the process-wide one
+    """
+    policy = RetryPolicy(max_attempts, delay, max_delay, budget)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            policy.budget.deposit()
+            attempt = 0
+
+            while True:
+                attempt += 1
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    wait = policy.next_delay(attempt, e)
+                    if wait is None:
                         raise
-                    
-                    time.sleep(current_delay)
-                    current_delay *= 2  # Exponential backoff
-        
+                    error_logger.warning(f"Attempt {attempt} of {func.__name__} failed, retrying in {wait:.2f}s: {e}")
+                    await asyncio.sleep(wait)
+
         return wrapper
     return decorator
 
 class CircuitBreakerError(Exception):
     """Custom exception for circuit breaker state"""
     pass
+
+class PDFRenderError(Exception):
+    """Raised when a PDF cannot be rendered in time"""
+    pass
+
+class RateLimitExceeded(Exception):
+    """Raised when the GitHub rate-limit budget will not recover in time"""
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class JobQueueFull(Exception):
+    """Raised when the resume job queue is at its maximum depth"""
+    pass
+
+# Errors raised before any response arrived, worth another attempt
+TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError
+)
+
+# Process-wide breakers shared by every GitHub service
+circuit_breakers = CircuitBreakerRegistry.from_config()
+
+# Process-wide retry allowance shared by every retrying call
+retry_budget = RetryBudget.from_config()
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+from src.core.config import config
+from src.core.http_client import token_fingerprint
+from src.core.logging import error_logger
+from src.core.serialization import dumps, loads
+
+class ResponseCache(ABC):
+    """
+    Storage interface for validator-tagged HTTP responses
+
+    Entries are plain dictionaries with ``etag``, ``last_modified``,
+    ``body`` and ``headers`` keys so every backend can serialize them.
+    """
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the entry stored under a key, None if missing
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: Dict[str, Any]):
+        """
+        Store an entry under a key
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Drop every entry
+        """
+
+class MemoryResponseCache(ResponseCache):
+    """
+    Thread-safe in-memory response cache with LRU eviction
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class DiskResponseCache(ResponseCache):
+    """
+    Response cache persisted as one JSON file per entry
+
+    Survives restarts and is shared by every worker process on the host.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            error_logger.warning(f"Unreadable response cache entry for {key}: {e}")
+            return None
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        # Write to a temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dumps(entry))
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            error_logger.warning(f"Could not store response cache entry for {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+def cache_key(token: str, url: str, params: Mapping[str, Any] = None, accept: str = None) -> str:
+    """
+    Build a cache key scoped to the credential that fetched the response
+
+    :param token: GitHub API token, only its fingerprint is stored
+    :param url: Request URL
+    :param params: Query parameters
+    :param accept: Accept header, responses differ per media type
+    :return: Cache key
+    """
+    fingerprint = token_fingerprint(token)
+    query = '&'.join(f'{k}={v}' for k, v in sorted((params or {}).items()))
+    return f'{fingerprint} {url}?{query} {accept or ""}'
+
+def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Build revalidation headers for a cached entry
+
+    :param entry: Cached entry or None
+    :return: If-None-Match / If-Modified-Since headers
+    """
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def make_entry(headers: Mapping[str, Any], body: Any) -> Optional[Dict[str, Any]]:
+    """
+    Build a cache entry from a response, if it carries validators
+
+    :param headers: Response headers
+    :param body: Decoded JSON body
+    :return: Cache entry or None when the response cannot be revalidated
+    """
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    etag = etag if isinstance(etag, str) else None
+    last_modified = last_modified if isinstance(last_modified, str) else None
+    if not etag and not last_modified:
+        return None
+
+    link = headers.get('Link')
+    return {
+        'etag': etag,
+        'last_modified': last_modified,
+        'body': body,
+        'headers': {'Link': link} if isinstance(link, str) else {}
+    }
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """
+    Create the response cache selected by configuration
+
+    :return: Configured cache, or None when caching is disabled
+    """
+    backend = config.get('cache.backend', 'memory')
+    if backend == 'memory':
+        return MemoryResponseCache(config.get('cache.max_entries', 1024))
+    if backend == 'disk':
+        return DiskResponseCache(config.get('cache.directory', '.cache/github'))
+    return None
+
+# Shared cache for the whole process
+response_cache = create_response_cache()
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import threading
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+from github import Github, Auth
+from src.core.config import config
+
+def token_fingerprint(token: str) -> str:
+    """
+    Stable identifier for a token that is safe to log or persist
+
+    :param token: GitHub API token
+    :return: Short hash of the token
+    """
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of pooled HTTP clients keyed by token
+
+    Principles:
+    - Reuse keep-alive connections across requests and threads
+    - Configure pool sizes in one place
+    - Never share sockets across forked workers
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._github_clients: Dict[str, Github] = {}
+
+        # Sockets must not leak into forked worker processes
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def get_session(self, token: str) -> requests.Session:
+        """
+        Return the pooled session for a token, creating it on first use
+
+        :param token: GitHub API token
+        :return: Shared requests session
+        """
+        session = self._sessions.get(token)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                session = self._create_session(token)
+                self._sessions[token] = session
+            return session
+
+    def get_github_client(self, token: str) -> Github:
+        """
+        Return the shared PyGithub client for a token
+
+        :param token: GitHub API token
+        :return: Shared PyGithub client
+        """
+        client = self._github_clients.get(token)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._github_clients.get(token)
+            if client is None:
+                client = Github(
+                    auth=Auth.Token(token),
+                    base_url=config.get('github.api_base_url', 'https://api.github.com'),
+                    pool_size=config.get('http.pool_maxsize', 20)
+                )
+                self._github_clients[token] = client
+            return client
+
+    def close_all(self):
+        """
+        Close every pooled session and forget all clients
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._github_clients.clear()
+
+    def _create_session(self, token: str) -> requests.Session:
+        """
+        Build a session with a keep-alive connection pool
+
+        :param token: GitHub API token
+        :return: Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.get('http.pool_connections', 10),
+            pool_maxsize=config.get('http.pool_maxsize', 20),
+            pool_block=config.get('http.pool_block', False)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json'
+        })
+        return session
+
+    def _reset_after_fork(self):
+        """
+        Drop inherited clients in a freshly forked child process
+        """
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._github_clients = {}
+
+# Shared registry for the whole process
+http_clients = HTTPClientRegistry()
@@ -2,6 +2,15 @@ import logging
 import sys
 from logging.handlers import RotatingFileHandler
 from src.core.config import config
+from src.core.tracing import current_request_id
+
+class RequestIdFilter(logging.Filter):
+    """
+    Stamp records with the ID of the request being served, '-' outside requests
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = current_request_id() or '-'
+        return True
 
 class LoggerFactory:
     """
@@ -43,14 +52,19 @@ class LoggerFactory:
         
         # Formatters
         console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s'
         )
         file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+            '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(filename)s:%(lineno)d - %(message)s'
         )
         
         console_handler.setFormatter(console_formatter)
         file_handler.setFormatter(file_formatter)
+
+        # Request IDs tie together the log lines of one request
+        request_id_filter = RequestIdFilter()
+        console_handler.addFilter(request_id_filter)
+        file_handler.addFilter(request_id_filter)
         
         # Add handlers
         logger.addHandler(console_handler)
@@ -62,3 +76,4 @@ class LoggerFactory:
 github_logger = LoggerFactory.create_logger('github_resume_agent')
 app_logger = LoggerFactory.create_logger('resume_app')
 error_logger = LoggerFactory.create_logger('errors', level='ERROR')
+trace_logger = LoggerFactory.create_logger('trace')
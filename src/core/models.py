@@ -0,0 +1,153 @@
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+def intern_string(value: Any) -> Any:
+    """
+    Share one copy of a frequently repeated string
+
+    :param value: String or any other value
+    :return: Interned string, other values unchanged
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+def intern_strings(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Intern a sequence of strings into a tuple
+
+    :param values: Strings such as repository topics
+    :return: Tuple of interned strings
+    """
+    return tuple(intern_string(value) for value in values or ())
+
+class Repository(NamedTuple):
+    """
+    Repository fields used for resumes
+
+    Language names and topics repeat across repositories and users, so they
+    are interned and every repository shares the same string objects.
+    """
+    name: Optional[str] = None
+    full_name: Optional[str] = None
+    description: Optional[str] = None
+    language: Optional[str] = None
+    stars: int = 0
+    forks: int = 0
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    html_url: Optional[str] = None
+    topics: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, repo: Dict[str, Any], topics: Iterable[str] = ()) -> 'Repository':
+        """
+        Build a record from a REST API repository payload
+
+        :param repo: Raw repository payload
+        :param topics: Resolved repository topics
+        :return: Repository record
+        """
+        return cls(
+            name=repo.get('name'),
+            full_name=repo.get('full_name'),
+            description=repo.get('description'),
+            language=intern_string(repo.get('language')),
+            stars=repo.get('stargazers_count') or 0,
+            forks=repo.get('forks_count') or 0,
+            created_at=repo.get('created_at'),
+            updated_at=repo.get('updated_at'),
+            html_url=repo.get('html_url'),
+            topics=intern_strings(topics)
+        )
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Repository':
+        """
+        Rebuild a record serialized with to_dict
+
+        :param record: Repository dictionary
+        :return: Repository record
+        """
+        fields = {name: record[name] for name in cls._fields if name in record}
+        fields['language'] = intern_string(fields.get('language'))
+        fields['topics'] = intern_strings(fields.get('topics'))
+        return cls(**fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to the resume JSON shape
+        """
+        record = self._asdict()
+        record['topics'] = list(self.topics)
+        return record
+
+class Profile(NamedTuple):
+    """
+    User profile fields used for resumes
+    """
+    name: Optional[str] = None
+    login: Optional[str] = None
+    email: Optional[str] = None
+    bio: Optional[str] = None
+    location: Optional[str] = None
+    public_repos: int = 0
+    followers: int = 0
+    following: int = 0
+    avatar_url: Optional[str] = None
+
+    @classmethod
+    def from_api(cls, profile: Dict[str, Any]) -> 'Profile':
+        """
+        Build a record from a REST API user payload
+
+        :param profile: Raw user payload
+        :return: Profile record
+        """
+        return cls(
+            name=profile.get('name'),
+            login=profile.get('login'),
+            email=profile.get('email'),
+            bio=profile.get('bio'),
+            location=intern_string(profile.get('location')),
+            public_repos=profile.get('public_repos') or 0,
+            followers=profile.get('followers') or 0,
+            following=profile.get('following') or 0,
+            avatar_url=profile.get('avatar_url')
+        )
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Profile':
+        """
+        Rebuild a record serialized with to_dict
+
+        :param record: Profile dictionary
+        :return: Profile record
+        """
+        return cls(**{name: record[name] for name in cls._fields if name in record})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to the normalized profile shape
+        """
+        return self._asdict()
+
+class Resume(NamedTuple):
+    """
+    Assembled resume before serialization
+    """
+    basics: Dict[str, Any]
+    projects: Tuple[Repository, ...]
+    skills: Dict[str, List[str]]
+    contributions: Dict[str, Any]
+    work: Tuple[Dict[str, Any], ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to the resume JSON shape served and cached by the application
+        """
+        return {
+            'basics': dict(self.basics),
+            'work': list(self.work),
+            'projects': [project.to_dict() for project in self.projects],
+            'skills': self.skills,
+            'contributions': dict(self.contributions)
+        }
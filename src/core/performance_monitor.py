@@ -0,0 +1,349 @@
+import asyncio
+import random
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from src.core.config import config
+from src.core.tracing import record_span
+
+# Latency bucket upper bounds in seconds, from a cached call to a slow PDF
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram, aggregated in memory
+    """
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One extra bucket for values above the last bound
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating within its bucket
+
+        :param q: Quantile between 0 and 1
+        :return: Estimated value in seconds, None without observations
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                if index == len(self.bounds):
+                    # Unbounded bucket, the last bound is the best estimate
+                    return lower
+                return lower + (self.bounds[index] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Cumulative counts per upper bound, as Prometheus expects
+
+        :return: List of (le, count) pairs ending with +Inf
+        """
+        pairs, total = [], 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            total += bucket_count
+            pairs.append((repr(bound), total))
+        pairs.append(('+Inf', self.count))
+        return pairs
+
+class FunctionMetrics:
+    """
+    Aggregated measurements of one instrumented function
+    """
+    __slots__ = ('wall', 'cpu_seconds', 'errors', 'memory_samples', 'memory_peak_bytes')
+
+    def __init__(self, bounds: Sequence[float]):
+        self.wall = Histogram(bounds)
+        self.cpu_seconds = 0.0
+        self.errors = 0
+        self.memory_samples = 0
+        # Largest peak seen in a sampled call
+        self.memory_peak_bytes = 0
+
+class PerformanceMonitor:
+    """
+    Low-overhead instrumentation aggregated per function
+
+    Principles:
+    - Time every call cheaply with wall and CPU clocks
+    - Trace memory only for a sampled fraction of calls
+    - Aggregate in memory and export on demand, never log per call
+    """
+    def __init__(
+        self,
+        enabled: bool = True,
+        memory_sample_rate: float = 0.01,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        namespace: str = 'github_resume'
+    ):
+        """
+        Initialize performance monitor
+
+        :param enabled: Instrument decorated functions at all
+        :param memory_sample_rate: Fraction of calls traced with tracemalloc
+        :param buckets: Latency histogram bucket bounds in seconds
+        :param namespace: Prefix of exported metric names
+        """
+        self.enabled = enabled
+        self.memory_sample_rate = memory_sample_rate
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._metrics: Dict[str, FunctionMetrics] = {}
+        self._gauges: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'PerformanceMonitor':
+        """
+        Create a monitor from the monitoring.* settings
+        """
+        return cls(
+            enabled=config.get('monitoring.enabled', True),
+            memory_sample_rate=config.get('monitoring.memory_sample_rate', 0.01)
+        )
+
+    def track(self, name: str = None) -> Callable[[Callable], Callable]:
+        """
+        Decorator instrumenting a function or coroutine function
+
+        :param name: Metric label, defaults to the function's qualified name
+        :return: Decorator, a no-op while the monitor is disabled
+        """
+        def decorator(func: Callable) -> Callable:
+            if not self.enabled:
+                return func
+            label = name or func.__qualname__
+
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    # CPU time of a coroutine is shared with the event loop, only wall time is kept
+                    start = time.perf_counter()
+                    failed = True
+                    try:
+                        result = await func(*args, **kwargs)
+                        failed = False
+                        return result
+                    finally:
+                        wall = time.perf_counter() - start
+                        self.observe(label, wall, error=failed)
+                        record_span(label, start, wall)
+
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                traced = self._start_memory_trace()
+                start, cpu_start = time.perf_counter(), time.thread_time()
+                failed = True
+                try:
+                    result = func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    wall, cpu = time.perf_counter() - start, time.thread_time() - cpu_start
+                    peak = self._stop_memory_trace() if traced else None
+                    self.observe(label, wall, cpu, error=failed, memory_peak=peak)
+                    # Every instrumented call is also a span of the request being served
+                    record_span(label, start, wall)
+
+            return wrapper
+        return decorator
+
+    def observe(
+        self,
+        name: str,
+        wall: float,
+        cpu: float = 0.0,
+        error: bool = False,
+        memory_peak: Optional[int] = None
+    ):
+        """
+        Record one call
+
+        :param name: Function label
+        :param wall: Wall-clock seconds
+        :param cpu: CPU seconds spent by the calling thread
+        :param error: Whether the call raised
+        :param memory_peak: Peak traced bytes, for sampled calls
+        """
+        with self._lock:
+            metrics = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = FunctionMetrics(self.buckets)
+            metrics.wall.observe(wall)
+            metrics.cpu_seconds += cpu
+            if error:
+                metrics.errors += 1
+            if memory_peak is not None:
+                metrics.memory_samples += 1
+                metrics.memory_peak_bytes = max(metrics.memory_peak_bytes, memory_peak)
+
+    def register_gauges(self, prefix: str, collect: Callable[[], Dict[str, Any]]):
+        """
+        Export numeric stats of another component as gauges
+
+        Nested dictionaries, such as per-endpoint circuit breaker stats,
+        become one labelled series per outer key.
+
+        :param prefix: Metric name prefix
+        :param collect: Callable returning the component's stats
+        """
+        with self._lock:
+            self._gauges[prefix] = collect
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summary per function for logs and JSON endpoints
+
+        :return: Calls, errors, mean/p50/p99 milliseconds, CPU and sampled memory per function
+        """
+        with self._lock:
+            summary = {}
+            for name, metrics in self._metrics.items():
+                wall = metrics.wall
+                summary[name] = {
+                    'calls': wall.count,
+                    'errors': metrics.errors,
+                    'mean_ms': wall.sum / wall.count * 1000 if wall.count else None,
+                    'p50_ms': _milliseconds(wall.quantile(0.5)),
+                    'p99_ms': _milliseconds(wall.quantile(0.99)),
+                    'cpu_ms': metrics.cpu_seconds * 1000,
+                    'memory_samples': metrics.memory_samples,
+                    'memory_peak_bytes': metrics.memory_peak_bytes
+                }
+            return summary
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        :return: Exposition text
+        """
+        prefix = self.namespace
+        with self._lock:
+            metrics = list(self._metrics.items())
+            gauges = list(self._gauges.items())
+            lines = [
+                f'# HELP {prefix}_call_duration_seconds Wall-clock duration of instrumented calls',
+                f'# TYPE {prefix}_call_duration_seconds histogram'
+            ]
+            for name, function in metrics:
+                label = f'function="{_escape(name)}"'
+                for bound, total in function.wall.cumulative():
+                    lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="{bound}"}} {total}')
+                lines.append(f'{prefix}_call_duration_seconds_sum{{{label}}} {function.wall.sum!r}')
+                lines.append(f'{prefix}_call_duration_seconds_count{{{label}}} {function.wall.count}')
+
+            for metric, kind, help_text, value in (
+                ('call_cpu_seconds_total', 'counter', 'CPU time of instrumented calls', lambda m: m.cpu_seconds),
+                ('call_errors_total', 'counter', 'Instrumented calls that raised', lambda m: m.errors),
+                ('call_memory_peak_bytes', 'gauge', 'Largest traced memory peak of sampled calls', lambda m: m.memory_peak_bytes)
+            ):
+                lines.append(f'# HELP {prefix}_{metric} {help_text}')
+                lines.append(f'# TYPE {prefix}_{metric} {kind}')
+                for name, function in metrics:
+                    lines.append(f'{prefix}_{metric}{{function="{_escape(name)}"}} {value(function)!r}')
+
+        for gauge_prefix, collect in gauges:
+            lines.extend(_gauge_lines(f'{prefix}_{gauge_prefix}', collect()))
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """
+        Drop every aggregated measurement
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def _start_memory_trace(self) -> bool:
+        """
+        Start tracing memory for a sampled call
+
+        tracemalloc is process-wide, so a call only traces when nothing else
+        is tracing, and only the call that started tracing stops it. Nested
+        and concurrent calls are never cut off by one another.
+
+        :return: True if this call owns the trace
+        """
+        if self.memory_sample_rate <= 0 or random.random() >= self.memory_sample_rate:
+            return False
+        with self._lock:
+            if tracemalloc.is_tracing():
+                return False
+            tracemalloc.start()
+            return True
+
+    def _stop_memory_trace(self) -> int:
+        """
+        Stop the trace owned by this call
+
+        :return: Peak traced bytes
+        """
+        with self._lock:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+    @staticmethod
+    def track_performance(logger=None) -> Callable[[Callable], Callable]:
+        """
+        Decorator to monitor function performance with the shared monitor
+
+        :param logger: Unused, measurements are aggregated instead of logged per call
+        :return: Decorator
+        """
+        return monitor.track()
+
+def _milliseconds(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
+
+def _escape(value: str) -> str:
+    """
+    Escape a Prometheus label value
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _gauge_lines(prefix: str, stats: Dict[str, Any]) -> List[str]:
+    """
+    Render a component's numeric stats as gauges
+    """
+    series: Dict[str, List[str]] = {}
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            # Nested stats are labelled by their outer key
+            for field, number in value.items():
+                if _is_number(number):
+                    series.setdefault(f'{prefix}_{field}', []).append(f'{{name="{_escape(str(key))}"}} {number!r}')
+        elif _is_number(value):
+            series.setdefault(f'{prefix}_{key}', []).append(f' {value!r}')
+
+    lines = []
+    for metric, samples in series.items():
+        lines.append(f'# TYPE {metric} gauge')
+        lines.extend(metric + sample for sample in samples)
+    return lines
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# Process-wide monitor used by the instrumented services
+monitor = PerformanceMonitor.from_config()
@@ -0,0 +1,254 @@
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from src.core.config import config
+from src.core.error_handling import RateLimitExceeded
+from src.core.logging import github_logger
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """
+    Read a numeric header, ignoring missing or malformed values
+    """
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+class RateLimitState:
+    """
+    Last known rate-limit budget for one credential and resource
+    """
+    __slots__ = ('limit', 'remaining', 'reset', 'blocked_until', 'next_slot')
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self.blocked_until = 0.0
+        self.next_slot = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset': self.reset,
+            'blocked_until': self.blocked_until
+        }
+
+class RateLimitScheduler:
+    """
+    Process-wide scheduler that paces GitHub calls against the remaining budget
+
+    Principles:
+    - Track the budget GitHub reports in response headers
+    - Always hold back the configured buffer
+    - Slow down smoothly instead of failing hard
+    """
+    def __init__(
+        self,
+        buffer: float = 0.1,
+        pacing_threshold: float = 0.2,
+        max_wait: float = 30.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize scheduler
+
+        :param buffer: Fraction of each budget never spent
+        :param pacing_threshold: Fraction of the budget below which calls are spread until reset
+        :param max_wait: Longest a caller may be held before failing fast
+        :param clock: Wall-clock source, GitHub reset times are epoch seconds
+        """
+        self.buffer = buffer
+        self.pacing_threshold = pacing_threshold
+        self.max_wait = max_wait
+        self.clock = clock
+        self._states: Dict[Tuple[str, str], RateLimitState] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> 'RateLimitScheduler':
+        """
+        Create a scheduler from the github.rate_limit_* settings
+        """
+        return cls(
+            buffer=config.get('github.rate_limit_buffer', 0.1),
+            pacing_threshold=config.get('github.rate_limit_pacing_threshold', 0.2),
+            max_wait=config.get('github.rate_limit_max_wait', 30.0)
+        )
+
+    def _state(self, key: str, resource: str) -> RateLimitState:
+        state = self._states.get((key, resource))
+        if state is None:
+            state = self._states[(key, resource)] = RateLimitState()
+        return state
+
+    def _reserve(self, key: str, resource: str) -> Tuple[bool, float]:
+        """
+        Try to admit one call against a budget
+
+        :return: Tuple of (admitted, seconds to wait); admitted calls proceed
+                 after the wait, others must try again once it has passed
+        :raises RateLimitExceeded: If the wait would exceed max_wait
+        """
+        with self._lock:
+            state = self._state(key, resource)
+            now = self.clock()
+
+            # The window has rolled over, GitHub refilled the budget
+            if state.reset is not None and now >= state.reset:
+                state.remaining = state.limit
+                state.reset = None
+                state.next_slot = 0.0
+
+            next_slot = None
+            if state.blocked_until > now:
+                admitted, wait = False, state.blocked_until - now
+            elif state.remaining is None or not state.limit:
+                admitted, wait = True, 0.0
+            else:
+                usable = state.remaining - math.ceil(state.limit * self.buffer)
+                window = max((state.reset or now) - now, 0.0)
+
+                if usable <= 0 and state.reset is None:
+                    # Spent with no known reset: hold calls for max_wait, then
+                    # let them through to learn the budget from fresh headers
+                    state.blocked_until = now + self.max_wait
+                    state.remaining = None
+                    admitted, wait = False, self.max_wait
+                elif usable <= 0:
+                    admitted, wait = False, window
+                elif usable < state.limit * self.pacing_threshold and window > 0:
+                    # Spread what is left of the budget evenly until the reset
+                    slot = max(now, state.next_slot)
+                    next_slot = slot + window / usable
+                    admitted, wait = True, slot - now
+                else:
+                    admitted, wait = True, 0.0
+
+            # Rejected callers must not hold a slot or spend budget
+            if wait > self.max_wait:
+                raise RateLimitExceeded(
+                    f"GitHub {resource} rate limit exhausted, retry in {math.ceil(wait)}s",
+                    retry_after=wait
+                )
+
+            if next_slot is not None:
+                state.next_slot = next_slot
+            if admitted and state.remaining is not None:
+                # Account for the call before its response headers confirm it
+                state.remaining -= 1
+            return admitted, wait
+
+    def acquire(self, key: str, resource: str = 'core'):
+        """
+        Block until a call against a budget may proceed
+
+        :param key: Credential identifier
+        :param resource: GitHub rate-limit resource (core, graphql, search)
+        :raises RateLimitExceeded: If the budget will not recover within max_wait
+        """
+        while True:
+            admitted, wait = self._reserve(key, resource)
+            if wait > 0:
+                github_logger.info(f"Pacing GitHub {resource} call for {wait:.2f}s")
+                time.sleep(wait)
+            if admitted:
+                return
+
+    async def acquire_async(self, key: str, resource: str = 'core'):
+        """
+        Wait on the event loop until a call against a budget may proceed
+
+        :param key: Credential identifier
+        :param resource: GitHub rate-limit resource (core, graphql, search)
+        :raises RateLimitExceeded: If the budget will not recover within max_wait
+        """
+        while True:
+            admitted, wait = self._reserve(key, resource)
+            if wait > 0:
+                github_logger.info(f"Pacing GitHub {resource} call for {wait:.2f}s")
+                await asyncio.sleep(wait)
+            if admitted:
+                return
+
+    def update(self, key: str, headers: Mapping[str, Any], status_code: Optional[int] = None, resource: str = 'core'):
+        """
+        Record the budget reported by a GitHub response
+
+        :param key: Credential identifier
+        :param headers: Response headers
+        :param status_code: Response status code
+        :param resource: Resource the call was charged to, unless the response says otherwise
+        """
+        reported = headers.get('X-RateLimit-Resource') if hasattr(headers, 'get') else None
+        if isinstance(reported, str):
+            resource = reported
+
+        limit = _header_number(headers, 'X-RateLimit-Limit')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        reset = _header_number(headers, 'X-RateLimit-Reset')
+        retry_after = _header_number(headers, 'Retry-After')
+
+        with self._lock:
+            state = self._state(key, resource)
+            now = self.clock()
+            if limit is not None:
+                state.limit = int(limit)
+            if remaining is not None:
+                state.remaining = int(remaining)
+            if reset is not None:
+                state.reset = reset
+
+            if retry_after is not None:
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+            elif status_code in (403, 429) and state.remaining == 0 and state.reset:
+                state.blocked_until = max(state.blocked_until, state.reset)
+
+    def headroom(self, key: str, resource: str = 'core') -> Optional[int]:
+        """
+        Calls a budget can still afford above the buffer
+
+        :param key: Credential identifier
+        :param resource: GitHub rate-limit resource
+        :return: Usable calls, 0 while blocked, None if the budget is unknown
+        """
+        with self._lock:
+            state = self._states.get((key, resource))
+            if state is None:
+                return None
+            now = self.clock()
+            if state.blocked_until > now:
+                return 0
+            if state.reset is not None and now >= state.reset:
+                return None
+            if state.remaining is None or not state.limit:
+                return None
+            return max(state.remaining - math.ceil(state.limit * self.buffer), 0)
+
+    def snapshot(self, key: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the last known budgets
+
+        :param key: Only report this credential
+        :return: Mapping of "key/resource" to budget details
+        """
+        with self._lock:
+            return {
+                f'{state_key}/{resource}': state.as_dict()
+                for (state_key, resource), state in self._states.items()
+                if key is None or state_key == key
+            }
+
+# Shared scheduler for every GitHub call in the process
+rate_limiter = RateLimitScheduler.from_config()
@@ -0,0 +1,51 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator, the standard library produces the same documents
+    orjson = None
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON
+
+    :param obj: JSON-serializable object
+    :param pretty: Indent with two spaces instead of emitting compact output
+    :param sort_keys: Emit object keys in sorted order
+    :return: Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+def dumps_str(obj: Any, pretty: bool = False) -> str:
+    """
+    Encode an object as a JSON string
+
+    :param obj: JSON-serializable object
+    :param pretty: Indent with two spaces instead of emitting compact output
+    :return: JSON text
+    """
+    return dumps(obj, pretty=pretty).decode('utf-8')
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document
+
+    :param data: JSON text or UTF-8 bytes
+    :return: Decoded object
+    :raises ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
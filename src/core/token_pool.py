@@ -0,0 +1,143 @@
+import itertools
+import os
+import threading
+from typing import Dict, List, Optional
+from src.core.config import config
+from src.core.http_client import token_fingerprint
+from src.core.logging import github_logger
+from src.core.rate_limit import RateLimitScheduler, rate_limiter
+
+class TokenPool:
+    """
+    Pool of GitHub credentials balanced by remaining rate-limit budget
+
+    Principles:
+    - Spend the token with the most budget left
+    - Rotate exhausted tokens out until their window resets
+    - Drop revoked tokens for good
+    """
+    def __init__(self, tokens: List[str], scheduler: RateLimitScheduler = None):
+        """
+        Initialize token pool
+
+        :param tokens: GitHub API tokens
+        :param scheduler: Rate-limit scheduler holding per-token budgets
+        :raises ValueError: If no token is given
+        """
+        self.tokens = list(dict.fromkeys(token.strip() for token in tokens if token and token.strip()))
+        if not self.tokens:
+            raise ValueError("Token pool requires at least one GitHub token")
+
+        self.scheduler = scheduler or rate_limiter
+        self._fingerprints: Dict[str, str] = {token: token_fingerprint(token) for token in self.tokens}
+        self._revoked = set()
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> Optional['TokenPool']:
+        """
+        Build the pool from GITHUB_TOKENS plus GITHUB_TOKEN
+
+        :return: Token pool, or None when fewer than two tokens are configured
+        """
+        tokens = list(config.get('github.tokens') or [])
+        primary = os.getenv('GITHUB_TOKEN')
+        if primary:
+            tokens.insert(0, primary)
+        tokens = [token.strip() for token in tokens if token and len(token.strip()) >= 20]
+        if len(set(tokens)) < 2:
+            return None
+        return cls(tokens)
+
+    def fingerprint(self, token: str) -> str:
+        """
+        Rate-limit key for a pooled token
+        """
+        return self._fingerprints.get(token) or token_fingerprint(token)
+
+    def active_tokens(self) -> List[str]:
+        """
+        Tokens still in rotation
+        """
+        with self._lock:
+            return [token for token in self.tokens if token not in self._revoked]
+
+    def select(self, resource: str = 'core') -> str:
+        """
+        Pick the token with the most usable budget for a resource
+
+        Tokens with an unknown budget are tried first so every token reports
+        its state early; ties rotate round-robin.
+
+        :param resource: GitHub rate-limit resource
+        :return: Selected token
+        :raises ValueError: If every token has been revoked
+        """
+        active = self.active_tokens()
+        if not active:
+            raise ValueError("No valid GitHub tokens left in the pool")
+
+        turn = next(self._turns)
+        best_token, best_rank = None, None
+        for offset in range(len(active)):
+            token = active[(turn + offset) % len(active)]
+            headroom = self.scheduler.headroom(self.fingerprint(token), resource)
+            rank = float('inf') if headroom is None else headroom
+            if best_rank is None or rank > best_rank:
+                best_token, best_rank = token, rank
+
+        return best_token
+
+    def report(self, token: str, status_code: Optional[int]):
+        """
+        Record the outcome of a call made with a pooled token
+
+        :param token: Token used for the call
+        :param status_code: Response status code
+        """
+        if status_code != 401:
+            return
+
+        with self._lock:
+            if token in self._revoked:
+                return
+            self._revoked.add(token)
+            remaining = len(self.tokens) - len(self._revoked)
+        github_logger.error(
+            f"GitHub token {self.fingerprint(token)} rejected with 401, "
+            f"removed from rotation ({remaining} left)"
+        )
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Per-token rotation state keyed by token fingerprint
+        """
+        with self._lock:
+            revoked = set(self._revoked)
+        return {
+            self.fingerprint(token): {
+                'active': token not in revoked,
+                'core_headroom': self.scheduler.headroom(self.fingerprint(token), 'core'),
+                'graphql_headroom': self.scheduler.headroom(self.fingerprint(token), 'graphql')
+            }
+            for token in self.tokens
+        }
+
+_token_pool: Optional[TokenPool] = None
+_token_pool_loaded = False
+_token_pool_lock = threading.Lock()
+
+def get_token_pool() -> Optional[TokenPool]:
+    """
+    Return the process-wide token pool configured through the environment
+
+    :return: Shared token pool, or None when only one token is configured
+    """
+    global _token_pool, _token_pool_loaded
+    if not _token_pool_loaded:
+        with _token_pool_lock:
+            if not _token_pool_loaded:
+                _token_pool = TokenPool.from_config()
+                _token_pool_loaded = True
+    return _token_pool
@@ -0,0 +1,168 @@
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar, Token, copy_context
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Characters allowed in a Server-Timing metric name (an HTTP token)
+_INVALID_TOKEN_CHARS = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+# Incoming request IDs are echoed in headers and logs, so only simple ones are kept
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,128}$')
+
+class Span:
+    """
+    Timed stage of a request
+    """
+    __slots__ = ('name', 'start_ms', 'duration_ms')
+
+    def __init__(self, name: str, start_ms: float, duration_ms: float):
+        self.name = name
+        # Offset from the start of the trace
+        self.start_ms = start_ms
+        self.duration_ms = duration_ms
+
+class Trace:
+    """
+    Spans recorded while serving one request
+
+    Spans may be added from fetch threads, so recording is locked.
+    """
+    __slots__ = ('request_id', 'started', 'spans', '_lock')
+
+    def __init__(self, request_id: str = None):
+        self.request_id = request_id if request_id and _VALID_REQUEST_ID.match(request_id) else uuid.uuid4().hex
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, duration: float):
+        """
+        Record a span
+
+        :param name: Stage name
+        :param start: perf_counter value when the stage started
+        :param duration: Stage duration in seconds
+        """
+        span = Span(name, (start - self.started) * 1000, duration * 1000)
+        with self._lock:
+            self.spans.append(span)
+
+    def totals(self) -> Dict[str, Tuple[float, int]]:
+        """
+        Total milliseconds and count per stage, in order of first appearance
+        """
+        totals: Dict[str, Tuple[float, int]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            duration, count = totals.get(span.name, (0.0, 0))
+            totals[span.name] = (duration + span.duration_ms, count + 1)
+        return totals
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """
+        Render the stages as a Server-Timing header value
+
+        Repeated stages, such as one span per GitHub call, are summed and
+        their count is given as the description.
+
+        :return: Header value ending with the total request time
+        """
+        metrics = []
+        for name, (duration, count) in self.totals().items():
+            metric = f'{_INVALID_TOKEN_CHARS.sub("_", name)};dur={duration:.1f}'
+            if count > 1:
+                metric += f';desc="x{count}"'
+            metrics.append(metric)
+        metrics.append(f'total;dur={self.elapsed_ms():.1f}')
+        return ', '.join(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Structured form for the trace log
+        """
+        with self._lock:
+            spans = [
+                {'name': span.name, 'start_ms': round(span.start_ms, 3), 'duration_ms': round(span.duration_ms, 3)}
+                for span in self.spans
+            ]
+        return {'request_id': self.request_id, 'total_ms': round(self.elapsed_ms(), 3), 'spans': spans}
+
+_current: ContextVar[Optional[Trace]] = ContextVar('trace', default=None)
+
+def start_trace(request_id: str = None) -> Token:
+    """
+    Start tracing the current request
+
+    :param request_id: Incoming request ID, a new one is generated if missing or unsafe
+    :return: Token to pass to end_trace
+    """
+    return _current.set(Trace(request_id))
+
+def end_trace(token: Token) -> Optional[Trace]:
+    """
+    Stop tracing the current request
+
+    :param token: Token returned by start_trace
+    :return: Finished trace
+    """
+    trace = _current.get()
+    _current.reset(token)
+    return trace
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+def current_request_id() -> Optional[str]:
+    """
+    Request ID of the trace being served, None outside a request
+    """
+    trace = _current.get()
+    return trace.request_id if trace is not None else None
+
+def record_span(name: str, start: float, duration: float):
+    """
+    Add a span to the current trace, if any
+
+    :param name: Stage name
+    :param start: perf_counter value when the stage started
+    :param duration: Stage duration in seconds
+    """
+    trace = _current.get()
+    if trace is not None:
+        trace.add(name, start, duration)
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block as a span of the current trace
+
+    :param name: Stage name
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, start, time.perf_counter() - start)
+
+def bind_context(func: Callable) -> Callable:
+    """
+    Bind a callable to the caller's context, for running it on another thread
+
+    Threads do not inherit context variables, so without this the spans and
+    request ID of work handed to a pool would be lost.
+
+    :param func: Callable to run elsewhere
+    :return: Callable running func inside a copy of the current context
+    """
+    context = copy_context()
+
+    def run(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+
+    return run
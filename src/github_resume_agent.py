@@ -1,10 +1,11 @@
 import os
 from typing import Dict, List, Any
-from github import Github, Auth
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 
 from src.core.config import config
+from src.core.http_client import http_clients
+from src.core.models import Repository, intern_string, intern_strings
 from src.resume_exporter import ResumeExporter
 
 # Load environment variables
@@ -24,11 +25,8 @@ class GitHubResumeAgent:
         if not self.token or len(self.token.strip()) < 20:
             raise ValueError("Invalid GitHub token")
         
-        # Create GitHub authentication object
-        auth = Auth.Token(self.token)
-        
-        # Initialize GitHub client with new authentication method
-        self.github = Github(auth=auth)
+        # Reuse the process-wide pooled client for this token
+        self.github = http_clients.get_github_client(self.token)
         
         # Get authenticated user
         self.user = self.github.get_user()
@@ -36,7 +34,7 @@ class GitHubResumeAgent:
         # Initialize resume exporter
         self.exporter = ResumeExporter()
 
-    def get_repositories(self) -> List[Dict[str, Any]]:
+    def get_repositories(self) -> List[Repository]:
         """
         Retrieve and analyze user's repositories
         
@@ -45,23 +43,44 @@ class GitHubResumeAgent:
         repos = self.user.get_repos()
         return [self._analyze_repo(repo) for repo in repos]
     
-    def _analyze_repo(self, repo) -> Dict[str, Any]:
+    def _analyze_repo(self, repo) -> Repository:
         """
         Extract detailed information about a repository
         
         :param repo: GitHub repository object
+        :return: Repository record
+        """
+        return Repository(
+            name=repo.name,
+            full_name=repo.full_name,
+            description=repo.description or 'No description',
+            language=intern_string(repo.language),
+            stars=repo.stargazers_count,
+            forks=repo.forks_count,
+            created_at=repo.created_at.isoformat(),
+            updated_at=repo.updated_at.isoformat(),
+            html_url=repo.html_url,
+            topics=intern_strings(repo.get_topics())
+        )
+
+    @staticmethod
+    def _repository_dict(repo: Repository) -> Dict[str, Any]:
+        """
+        Serialize a repository to the agent's resume shape
+
+        :param repo: Repository record
         :return: Dictionary of repository details
         """
         return {
             'name': repo.name,
-            'description': repo.description or 'No description',
+            'description': repo.description,
             'language': repo.language,
-            'stars': repo.stargazers_count,
-            'forks': repo.forks_count,
-            'created_at': repo.created_at.isoformat(),
-            'updated_at': repo.updated_at.isoformat(),
+            'stars': repo.stars,
+            'forks': repo.forks,
+            'created_at': repo.created_at,
+            'updated_at': repo.updated_at,
             'url': repo.html_url,
-            'topics': repo.get_topics()
+            'topics': list(repo.topics)
         }
     
     def generate_resume(self) -> Dict[str, Any]:
@@ -86,7 +105,7 @@ class GitHubResumeAgent:
                 'total_repositories': contributions.get('total_repositories', 0),
                 'total_contributions': contributions.get('total_contributions', 0)
             },
-            'repositories': repositories,
+            'repositories': [self._repository_dict(repo) for repo in repositories],
             'skills': self._extract_skills(repositories),
             'contributions': contributions
         }
@@ -163,7 +182,7 @@ class GitHubResumeAgent:
                 'total_repositories': 0
             }
 
-    def _extract_skills(self, repositories: List[Dict[str, Any]]) -> List[str]:
+    def _extract_skills(self, repositories: List[Repository]) -> List[str]:
         """
         Extract skills from repositories
         
@@ -172,7 +191,7 @@ class GitHubResumeAgent:
         """
         language_counts = {}
         for project in repositories:
-            lang = project.get('language')
+            lang = project.language
             if lang:
                 language_counts[lang] = language_counts.get(lang, 0) + 1
         return sorted(language_counts, key=language_counts.get, reverse=True)[:10]  # Top 10 languages
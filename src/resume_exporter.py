@@ -1,8 +1,9 @@
 import os
-import json
-import markdown
-import pdfkit
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
+from src.core.error_handling import PDFRenderError
+from src.core.serialization import dumps
+from src.utils.pdf_renderer import get_pdf_renderer
+from src.utils.template_engine import agent_templates
 
 class ResumeExporter:
     """
@@ -10,58 +11,53 @@ class ResumeExporter:
     """
 
     @staticmethod
-    def to_json(resume: Dict[str, Any], output_path: str = None) -> str:
+    def to_json(resume: Dict[str, Any], output_path: str = None, pretty: bool = False) -> str:
         """
         Convert resume to JSON format
 
         :param resume: Resume dictionary
         :param output_path: Optional path to save JSON file
+        :param pretty: Indent the output, compact by default
         :return: JSON string
         """
-        json_content = json.dumps(resume, indent=2)
+        encoded = dumps(resume, pretty=pretty)
         
         if output_path:
-            with open(output_path, 'w') as f:
-                f.write(json_content)
+            with open(output_path, 'wb') as f:
+                f.write(encoded)
         
-        return json_content
+        return encoded.decode('utf-8')
 
     @staticmethod
-    def to_markdown(resume: Dict[str, Any], output_path: str = None) -> str:
+    def iter_markdown(resume: Dict[str, Any]) -> Iterator[str]:
         """
-        Convert resume to markdown format
+        Render resume to markdown incrementally
 
         :param resume: Resume dictionary
-        :param output_path: Optional path to save markdown file
-        :return: Markdown content
+        :return: Iterator of markdown fragments
         """
-        profile = resume.get('profile', {})
-        repositories = resume.get('repositories', [])
-        skills = resume.get('skills', [])
-        contributions = resume.get('contributions', {})
-
-        markdown_content = f"""# {profile.get('name', 'GitHub Resume')}
+        return agent_templates.stream('markdown', resume)
 
-## Profile
-- **Location**: {profile.get('location', 'Not specified')}
-- **Email**: {profile.get('email', 'Not available')}
-- **Bio**: {profile.get('bio', 'No bio available')}
-- **Total Repositories**: {contributions.get('total_repositories', 0)}
-- **Total Contributions**: {contributions.get('total_contributions', 0)}
+    @staticmethod
+    def iter_html(resume: Dict[str, Any]) -> Iterator[str]:
+        """
+        Render resume to a complete HTML document incrementally
 
-## Skills
-**Programming Languages**: {', '.join(skills)}
+        :param resume: Resume dictionary
+        :return: Iterator of HTML fragments
+        """
+        return agent_templates.stream('html', resume)
 
-## Projects
-"""
-        for repo in repositories:
-            markdown_content += f"""### {repo.get('name', 'Unnamed Project')}
-- **Language**: {repo.get('language', 'Not specified')}
-- **Description**: {repo.get('description', 'No description')}
-- **Stars**: {repo.get('stars', 0)}
-- **Forks**: {repo.get('forks', 0)}
+    @staticmethod
+    def to_markdown(resume: Dict[str, Any], output_path: str = None) -> str:
+        """
+        Convert resume to markdown format
 
-"""
+        :param resume: Resume dictionary
+        :param output_path: Optional path to save markdown file
+        :return: Markdown content
+        """
+        markdown_content = agent_templates.render('markdown', resume)
         
         if output_path:
             with open(output_path, 'w') as f:
@@ -78,42 +74,14 @@ class ResumeExporter:
         :param output_path: Optional path to save PDF file
         :return: PDF file path or None
         """
-        # Check if wkhtmltopdf is available
-        try:
-            config = pdfkit.configuration()
-        except OSError:
-            raise RuntimeError("wkhtmltopdf not installed. Please install it to generate PDFs.")
-        
-        # Convert to markdown first
-        markdown_content = ResumeExporter.to_markdown(resume)
-        
-        # Convert markdown to HTML
-        html_content = markdown.markdown(markdown_content)
-        
-        # Wrap HTML with basic styling
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-                h1, h2 {{ color: #333; }}
-                ul {{ padding-left: 20px; }}
-            </style>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
-        
         # Generate PDF
         if output_path is None:
             output_path = 'resume.pdf'
         
         try:
-            pdfkit.from_string(full_html, output_path, configuration=config)
-            return output_path
-        except Exception as e:
+            # Styling comes from the renderer's pre-parsed stylesheet
+            full_html = agent_templates.render('html', resume)
+            return get_pdf_renderer().render_to_file(full_html, output_path)
+        except PDFRenderError as e:
             print(f"Error generating PDF: {e}")
             return None
@@ -0,0 +1,393 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+import httpx
+from src.core.config import config
+from src.core.logging import github_logger
+from src.core.error_handling import async_retry, circuit_breakers
+from src.core import http_cache
+from src.core.models import Profile, Repository
+from src.core.performance_monitor import monitor
+from src.core.tracing import record_span
+from src.core.http_client import token_fingerprint
+from src.core.rate_limit import rate_limiter
+from src.core.token_pool import TokenPool, get_token_pool
+from src.services.github_service import (
+    GitHubService,
+    REPOSITORY_TOPICS_QUERY,
+    GRAPHQL_BATCH_SIZE,
+    MAX_PAGE_SIZE
+)
+
+class AsyncGitHubService:
+    """
+    Asyncio-native GitHub data retrieval service
+
+    Principles:
+    - Never block the event loop on network I/O
+    - Bound concurrent calls per service
+    - Share normalization with the blocking GitHubService
+    """
+    def __init__(
+        self,
+        token: str = None,
+        base_url: str = None,
+        max_concurrency: int = None,
+        token_pool: TokenPool = None
+    ):
+        """
+        Initialize async GitHub Service
+
+        :param token: GitHub API token
+        :param base_url: Base URL for GitHub API, defaults to github.api_base_url
+        :param max_concurrency: Maximum in-flight GitHub calls for this service
+        :param token_pool: Pool of tokens to balance calls across, defaults to
+                           GITHUB_TOKENS when no explicit token is given
+        :raises ValueError: If token is invalid
+        """
+        self.token = GitHubService.resolve_token(token)
+        self.token_pool = token_pool if token_pool is not None or token is not None else get_token_pool()
+        self.base_url = base_url or config.get('github.api_base_url', 'https://api.github.com')
+        self.graphql_url = GitHubService._graphql_url(self.base_url)
+        self.timeout = config.get('http.timeout', 10)
+        self.max_concurrency = max_concurrency or config.get('github.max_concurrent_requests', 10)
+        self.logger = github_logger
+        self.cache = http_cache.response_cache
+        self.rate_limiter = rate_limiter
+        self.token_id = token_fingerprint(self.token)
+
+        # Created lazily so both are bound to the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncGitHubService':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the pooled HTTP client
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled async HTTP client, creating it on first use
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    'Authorization': f'token {self.token}',
+                    'Accept': 'application/vnd.github.v3+json'
+                },
+                limits=httpx.Limits(
+                    max_connections=config.get('http.pool_maxsize', 20),
+                    max_keepalive_connections=config.get('http.pool_maxsize', 20)
+                ),
+                timeout=self.timeout
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _select_token(self, resource: str = 'core') -> str:
+        """
+        Token the next call is made with
+
+        :param resource: GitHub rate-limit resource the call is charged to
+        :return: The pooled token with the most budget left, or the service token
+        """
+        return self.token_pool.select(resource) if self.token_pool is not None else self.token
+
+    async def _send(self, method: str, url: str, resource: str = 'core', token: str = None, **kwargs) -> httpx.Response:
+        """
+        Issue one GitHub call within the concurrency bound and rate-limit budget
+
+        :param method: HTTP method
+        :param url: Request URL
+        :param resource: GitHub rate-limit resource the call is charged to
+        :param token: Token to call with, selected per call when omitted
+        :return: HTTP response
+        :raises RateLimitExceeded: If the budget will not recover in time
+        :raises CircuitBreakerError: If the endpoint's circuit is open
+        """
+        client = self._get_client()
+        token = token or self._select_token(resource)
+        token_id = self.token_id
+        if token != self.token:
+            token_id = self.token_pool.fingerprint(token)
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, Authorization=f'token {token}')
+
+        breaker = circuit_breakers.for_url(url)
+        async with self._semaphore:
+            await self.rate_limiter.acquire_async(token_id, resource)
+            probe = breaker.acquire()
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except Exception as e:
+                breaker.record_error(e, probe)
+                raise
+            except BaseException:
+                # Cancelled, the outcome says nothing about the service
+                breaker.release(probe)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                record_span(f'github.{breaker.endpoint}', start, elapsed)
+        github_logger.debug(f"{method} {url} -> {response.status_code} in {elapsed * 1000:.1f}ms")
+        breaker.record(response.status_code >= 500, probe)
+        self.rate_limiter.update(token_id, response.headers, response.status_code, resource)
+
+        if self.token_pool is not None:
+            self.token_pool.report(token, response.status_code)
+        return response
+
+    async def _request(self, method: str, url: str, resource: str = 'core', **kwargs) -> httpx.Response:
+        """
+        Issue one GitHub call and fail on non-2xx responses
+
+        :param method: HTTP method
+        :param url: Request URL
+        :param resource: GitHub rate-limit resource the call is charged to
+        :return: HTTP response
+        :raises httpx.HTTPStatusError: On non-2xx responses
+        """
+        response = await self._send(method, url, resource, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def _get_json(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None) -> Any:
+        """
+        GET a REST resource, revalidating cached copies with conditional requests
+
+        :param url: Request URL
+        :param params: Query parameters
+        :param headers: Extra request headers
+        :return: Decoded JSON body
+        :raises httpx.HTTPError: On transport or HTTP errors
+        """
+        return (await self._get_with_headers(url, params, headers))[0]
+
+    async def _cache_call(self, method: Callable, *args) -> Any:
+        """
+        Use the response cache without blocking the event loop
+
+        The in-memory cache is called inline, backends doing file or network
+        I/O run on a worker thread.
+
+        :param method: Bound cache method
+        :return: Result of the cache call
+        """
+        if isinstance(self.cache, http_cache.MemoryResponseCache):
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def _get_with_headers(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, str] = None
+    ) -> Tuple[Any, Any]:
+        """
+        GET a REST resource, revalidating cached copies with conditional requests
+
+        :param url: Request URL
+        :param params: Query parameters
+        :param headers: Extra request headers
+        :return: Tuple of decoded JSON body and response headers
+        :raises httpx.HTTPError: On transport or HTTP errors
+        """
+        headers = dict(headers or {})
+        # Cached validators belong to the token that will send the request
+        token = self._select_token()
+        key = entry = None
+        if self.cache is not None:
+            key = http_cache.cache_key(token, url, params, headers.get('Accept'))
+            entry = await self._cache_call(self.cache.get, key)
+            headers.update(http_cache.conditional_headers(entry))
+
+        response = await self._send('GET', url, token=token, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            github_logger.debug(f"Not modified, served from cache: {url}")
+            return entry['body'], entry.get('headers') or {}
+
+        response.raise_for_status()
+        body = response.json()
+
+        if key is not None:
+            new_entry = http_cache.make_entry(response.headers, body)
+            if new_entry is not None:
+                await self._cache_call(self.cache.set, key, new_entry)
+
+        return body, response.headers
+
+    @monitor.track()
+    @async_retry(max_attempts=3)
+    async def get_user_profile(self, username: str) -> Profile:
+        """
+        Retrieve comprehensive GitHub user profile
+
+        :param username: GitHub username
+        :return: User profile information
+        """
+        try:
+            profile = await self._get_json(f'{self.base_url}/users/{username}')
+            github_logger.info(f"Retrieved profile for {username}")
+            return Profile.from_api(profile)
+
+        except httpx.HTTPError as e:
+            github_logger.error(f"GitHub API error: {e}")
+            raise
+
+    @monitor.track()
+    async def get_repositories(self, username: str, max_repos: int = 50) -> List[Repository]:
+        """
+        Retrieve user's repositories with detailed information
+
+        :param username: GitHub username
+        :param max_repos: Maximum number of repositories to retrieve
+        :return: List of repository details
+        """
+        try:
+            repos = []
+            async for repo in self.iter_repositories(username, per_page=min(max_repos, MAX_PAGE_SIZE)):
+                repos.append(repo)
+                if len(repos) >= max_repos:
+                    break
+            github_logger.info(f"Retrieved {len(repos)} repositories for {username}")
+            return repos
+
+        except httpx.HTTPError as e:
+            github_logger.error(f"GitHub repositories retrieval error: {e}")
+            raise
+
+    async def iter_repositories(
+        self,
+        username: str,
+        per_page: int = MAX_PAGE_SIZE,
+        stop_when: Optional[Callable[[Repository], bool]] = None
+    ) -> AsyncIterator[Repository]:
+        """
+        Lazily yield a user's repositories, most recently updated first
+
+        :param username: GitHub username
+        :param per_page: Repositories per page, at most 100
+        :param stop_when: Predicate on a repository, evaluated before its
+                          topics are resolved, that ends iteration before
+                          the repository is yielded
+        :return: Async iterator of repository details
+        """
+        url = f'{self.base_url}/users/{username}/repos'
+        params = {'per_page': min(per_page, MAX_PAGE_SIZE), 'sort': 'updated'}
+
+        while url:
+            repos, headers = await self._get_repository_page(url, params)
+            wanted = GitHubService._cut_page(repos, stop_when)
+            # Topics are only resolved for repositories that will be yielded
+            topics = await self._get_topics_for(wanted)
+
+            for repo in wanted:
+                yield Repository.from_api(repo, topics.get(repo.get('full_name'), ()))
+            if len(wanted) < len(repos):
+                return
+
+            # The next link already carries the query string
+            url, params = GitHubService._next_page_url(headers), None
+
+    @async_retry(max_attempts=3)
+    async def _get_repository_page(self, url: str, params: Dict[str, Any] = None) -> Tuple[List[Dict[str, Any]], Any]:
+        """
+        Retrieve one page of a repository listing
+
+        :param url: Page URL
+        :param params: Query parameters for the first page
+        :return: Tuple of raw repository payloads and response headers
+        """
+        return await self._get_with_headers(url, params)
+
+    @monitor.track()
+    async def _get_topics_for(self, repos: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Resolve topics for a list of raw repository payloads
+
+        :param repos: Raw repository payloads from the REST API
+        :return: Mapping of full repository name to topics
+        """
+        topics, missing = GitHubService._split_known_topics(repos)
+
+        node_ids = [repo['node_id'] for repo in missing if repo.get('node_id')]
+        if node_ids:
+            try:
+                topics.update(await self._get_repository_topics_batch(node_ids))
+            except Exception as e:
+                github_logger.warning(f"Batched topics lookup failed, falling back to REST: {e}")
+
+        # Per-repo fallbacks run concurrently, bounded by the service semaphore
+        fallback = [repo.get('full_name') for repo in missing if repo.get('full_name') not in topics]
+        results = await asyncio.gather(*(self._get_repository_topics(name) for name in fallback))
+        topics.update(zip(fallback, results))
+
+        return topics
+
+    async def _get_repository_topics_batch(self, node_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Retrieve topics for many repositories with GraphQL node lookups
+
+        :param node_ids: GraphQL node IDs of the repositories
+        :return: Mapping of full repository name to topics
+        """
+        batches = [
+            node_ids[start:start + GRAPHQL_BATCH_SIZE]
+            for start in range(0, len(node_ids), GRAPHQL_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(*(
+            self._request(
+                'POST',
+                self.graphql_url,
+                resource='graphql',
+                json={'query': REPOSITORY_TOPICS_QUERY, 'variables': {'ids': batch}}
+            )
+            for batch in batches
+        ))
+
+        topics: Dict[str, List[str]] = {}
+        for response in responses:
+            topics.update(GitHubService._parse_topics_payload(response.json()))
+        return topics
+
+    async def _get_repository_topics(self, full_name: str) -> List[str]:
+        """
+        Retrieve repository topics
+
+        :param full_name: Full repository name (owner/repo)
+        :return: List of repository topics
+        """
+        try:
+            return GitHubService._parse_rest_topics(await self._get_json(
+                f'{self.base_url}/repos/{full_name}/topics',
+                headers={'Accept': 'application/vnd.github.mercy-preview+json'}
+            ))
+        except Exception as e:
+            # Log the error and return an empty list
+            github_logger.error(f"Error retrieving topics for {full_name}: {e}")
+            return []
+
+    async def get_contributions(self, username: str, profile: Profile = None) -> Dict[str, Any]:
+        """
+        Retrieve user's contribution statistics
+
+        :param username: GitHub username
+        :param profile: Already retrieved profile, avoids a second profile request
+        :return: Contribution statistics
+        """
+        if profile is None:
+            profile = await self.get_user_profile(username)
+        return {
+            'total_repositories': profile.public_repos,
+            'followers': profile.followers,
+            'following': profile.following
+        }
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from typing import Dict, Any
+from src.core.performance_monitor import monitor
+from src.services.async_github_service import AsyncGitHubService
+from src.services.ranking import ProjectRanker
+from src.services.resume_service import ResumeService
+from src.core.logging import app_logger
+
+class AsyncResumeService(ResumeService):
+    """
+    Asyncio-native resume generation service
+
+    Principles:
+    - Overlap independent GitHub calls on the event loop
+    - Share ranking and assembly with ResumeService
+    """
+    def __init__(self, github_service: AsyncGitHubService, ranker: ProjectRanker = None):
+        """
+        Initialize resume service with async GitHub service
+
+        :param github_service: Configured async GitHub service
+        :param ranker: Project ranking engine, defaults to ranking.* settings
+        """
+        super().__init__(github_service, ranker=ranker)
+
+    @monitor.track()
+    async def generate_resume(self, username: str) -> Dict[str, Any]:
+        """
+        Generate comprehensive resume from GitHub profile
+
+        :param username: GitHub username
+        :return: Structured resume dictionary
+        """
+        try:
+            timings: Dict[str, float] = {}
+            profile, repositories = await asyncio.gather(
+                self._timed(timings, 'get_user_profile', self.github_service.get_user_profile(username)),
+                self._timed(timings, 'get_repositories', self.github_service.get_repositories(username))
+            )
+            # Contributions are derived from the profile already fetched
+            contributions = await self.github_service.get_contributions(username, profile=profile)
+
+            self.last_fetch_timings = timings
+            app_logger.info(f"Fetch timings for {username} (ms): {timings}")
+
+            resume = self._assemble_resume(username, profile, repositories, contributions)
+            app_logger.info(f"Generated resume for {username}")
+            return resume.to_dict()
+
+        except Exception as e:
+            app_logger.error(f"Resume generation error: {e}")
+            raise
+
+    @staticmethod
+    async def _timed(timings: Dict[str, float], label: str, coro) -> Any:
+        """
+        Await a coroutine and record its duration in milliseconds
+        """
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[label] = (time.perf_counter() - start) * 1000
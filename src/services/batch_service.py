@@ -0,0 +1,282 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+from src.core.config import config
+from src.core.logging import app_logger
+from src.core.serialization import dumps, loads
+
+# Per-process resume service, built once in each pool worker
+_worker_service = None
+
+def generate_for_user(username: str) -> Dict[str, Any]:
+    """
+    Build one resume inside a pool worker
+
+    :param username: GitHub username
+    :return: Result record with status, resume or error, and timing
+    """
+    global _worker_service
+    start = time.perf_counter()
+    try:
+        if _worker_service is None:
+            # Imported here so the parent process does not need a token to fan out
+            from src.services.github_service import GitHubService
+            from src.services.resume_service import ResumeService
+            from src.services.snapshot_store import SnapshotStore
+            _worker_service = ResumeService(GitHubService(), snapshots=SnapshotStore.from_config())
+
+        resume = _worker_service.generate_resume(username)
+        return {
+            'username': username,
+            'status': 'ok',
+            'resume': resume,
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+    except Exception as e:
+        return {
+            'username': username,
+            'status': 'error',
+            'error': f'{type(e).__name__}: {e}',
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+
+class BatchReport:
+    """
+    Running throughput and failure statistics for a batch
+    """
+    def __init__(self, total: int, skipped: int = 0, workers: int = None):
+        self.total = total
+        self.skipped = skipped
+        self.workers = workers
+        self.succeeded = 0
+        self.failures: Dict[str, str] = {}
+        self.latencies: List[float] = []
+        self.start = time.perf_counter()
+
+    def add(self, record: Dict[str, Any]):
+        """
+        Account for one result record
+        """
+        if record['status'] == 'ok':
+            self.succeeded += 1
+        else:
+            self.failures[record['username']] = record['error']
+        if 'elapsed_ms' in record:
+            self.latencies.append(record['elapsed_ms'])
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + len(self.failures)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Report throughput and per-user failures
+        """
+        elapsed = time.perf_counter() - self.start
+        return {
+            'total': self.total,
+            'skipped': self.skipped,
+            'succeeded': self.succeeded,
+            'failed': len(self.failures),
+            'failures': self.failures,
+            'elapsed_s': round(elapsed, 3),
+            'throughput_per_s': round(self.processed / elapsed, 3) if elapsed > 0 else None,
+            'mean_latency_ms': round(sum(self.latencies) / len(self.latencies), 1) if self.latencies else None,
+            'workers': self.workers
+        }
+
+class BatchService:
+    """
+    Batch resume generation over a worker pool
+
+    Principles:
+    - Fan work out across one long-lived process pool
+    - Persist every result as soon as it is ready
+    - Pick up where an interrupted run stopped
+    """
+    def __init__(
+        self,
+        workers: int = None,
+        executor_factory: Callable[[int], Executor] = None,
+        worker: Callable[[str], Dict[str, Any]] = generate_for_user
+    ):
+        """
+        Initialize batch service
+
+        :param workers: Worker count, defaults to batch.workers
+        :param executor_factory: Builds the executor for a worker count, defaults to spawned processes
+        :param worker: Picklable callable producing one result record
+        """
+        self.workers = workers or config.get('batch.workers') or os.cpu_count() or 1
+        self.executor_factory = executor_factory or self._process_pool
+        self.worker = worker
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+    @staticmethod
+    def _process_pool(workers: int) -> Executor:
+        # Spawned workers do not inherit the server's threads and locks
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def _get_executor(self) -> Executor:
+        """
+        Return the pool shared by every batch, creating it on first use
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self.executor_factory(self.workers)
+            return self._executor
+
+    def _reset_executor(self, executor: Executor):
+        """
+        Replace a pool whose worker died
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """
+        Stop the worker pool
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_results(self, usernames: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Generate resumes concurrently, yielding records as they complete
+
+        :param usernames: GitHub usernames, duplicates are generated once
+        :return: Iterator of result records in completion order
+        """
+        pending = list(dict.fromkeys(name.strip() for name in usernames if name and name.strip()))
+        if not pending:
+            return
+
+        executor = self._get_executor()
+        futures = {executor.submit(self.worker, username): username for username in pending}
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # The worker process itself died
+                    if isinstance(e, BrokenProcessPool):
+                        self._reset_executor(executor)
+                    yield {'username': futures[future], 'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+        finally:
+            # Drop this batch's queued work if the consumer stops early, the pool stays up
+            for future in futures:
+                future.cancel()
+
+    def run(
+        self,
+        usernames: Iterable[str],
+        output_path: str = None,
+        output_dir: str = None,
+        progress_every: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Generate resumes and write them incrementally
+
+        Results go to a JSONL file (one record per line) or to one JSON file
+        per user. Users already written successfully by an earlier run are
+        skipped, so an interrupted batch resumes where it stopped.
+
+        :param usernames: GitHub usernames
+        :param output_path: JSONL output file
+        :param output_dir: Directory for one <username>.json per user
+        :param progress_every: Log progress after this many results
+        :return: Throughput and per-user failure report
+        """
+        if not output_path and not output_dir:
+            raise ValueError("Either output_path or output_dir is required")
+
+        usernames = list(dict.fromkeys(name.strip() for name in usernames if name and name.strip()))
+        completed = self._completed(output_path, output_dir)
+        pending = [name for name in usernames if name not in completed]
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        elif os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        app_logger.info(f"Batch starting: {len(pending)} pending, {len(usernames) - len(pending)} already done")
+
+        report = BatchReport(len(usernames), len(usernames) - len(pending), self.workers)
+        jsonl = self._open_jsonl(output_path) if output_path else None
+        try:
+            for record in self.iter_results(pending):
+                report.add(record)
+                self._write(record, jsonl, output_dir)
+
+                if progress_every and report.processed % progress_every == 0:
+                    app_logger.info(f"Batch progress: {report.processed}/{len(pending)}")
+        finally:
+            if jsonl:
+                jsonl.close()
+
+        summary = report.as_dict()
+        app_logger.info(
+            f"Batch finished: {summary['succeeded']} ok, {summary['failed']} failed, "
+            f"{summary['throughput_per_s']} users/s"
+        )
+        return summary
+
+    @staticmethod
+    def _open_jsonl(output_path: str):
+        """
+        Open the JSONL output for appending, terminating any line cut short
+        """
+        needs_newline = False
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            with open(output_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+
+        jsonl = open(output_path, 'ab')
+        if needs_newline:
+            jsonl.write(b'\n')
+        return jsonl
+
+    @staticmethod
+    def _write(record: Dict[str, Any], jsonl, output_dir: Optional[str]):
+        """
+        Persist one result record
+        """
+        if jsonl is not None:
+            jsonl.write(dumps(record) + b'\n')
+            jsonl.flush()
+        elif record['status'] == 'ok':
+            path = os.path.join(output_dir, f"{record['username']}.json")
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps(record['resume']))
+            os.replace(tmp_path, path)
+
+    @staticmethod
+    def _completed(output_path: Optional[str], output_dir: Optional[str]) -> Set[str]:
+        """
+        Usernames already written successfully by a previous run
+        """
+        completed = set()
+        if output_path and os.path.exists(output_path):
+            with open(output_path) as f:
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # A line cut short by an interruption
+                        continue
+                    if record.get('status') == 'ok':
+                        completed.add(record.get('username'))
+        elif output_dir and os.path.isdir(output_dir):
+            completed.update(name[:-len('.json')] for name in os.listdir(output_dir) if name.endswith('.json'))
+        return completed
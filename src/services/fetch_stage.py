@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from src.core.config import config
+from src.core.tracing import bind_context
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used for GitHub fetches
+
+    :return: Shared thread pool executor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=config.get('resume.fetch_workers', 8),
+                    thread_name_prefix='github-fetch'
+                )
+    return _executor
+
+class FetchStage:
+    """
+    Concurrent fetch stage scoped to a single resume build
+
+    Principles:
+    - Issue independent calls in parallel
+    - Never issue the same call twice per build
+    - Record how long every call took
+    """
+    def __init__(self, executor: ThreadPoolExecutor = None):
+        """
+        Initialize fetch stage
+
+        :param executor: Thread pool to run calls on, defaults to the shared pool
+        """
+        self.executor = executor or get_fetch_executor()
+        self.timings: Dict[str, float] = {}
+        self._futures: Dict[Tuple[Hashable, ...], Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args, label: str = None, **kwargs) -> Future:
+        """
+        Schedule a call, reusing the pending result of an identical call
+
+        :param func: Callable to run
+        :param label: Name the call's timing is recorded under, defaults to its qualified name
+        :return: Future resolving to the call result
+        """
+        label = label or getattr(func, '__qualname__', None) or getattr(func, '__name__', repr(func))
+        # The callable itself, bound methods are only equal for the same instance
+        key = (func, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Lists and dicts cannot be compared cheaply, run such calls as they come
+            key = None
+
+        with self._lock:
+            future = self._futures.get(key) if key is not None else None
+            if future is None:
+                # Pool threads join the caller's trace and request ID
+                future = self.executor.submit(bind_context(self._timed), label, func, args, kwargs)
+                if key is not None:
+                    self._futures[key] = future
+            return future
+
+    def _timed(self, label: str, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """
+        Run a call and record its wall-clock duration in milliseconds
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.timings[label] = (time.perf_counter() - start) * 1000
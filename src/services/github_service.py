@@ -1,10 +1,43 @@
-from typing import Dict, List, Any
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 import requests
 import os
 from src.core.config import config
 from src.core.logging import github_logger
-from src.core.error_handling import CircuitBreaker, retry
-from github import Github, Auth
+from src.core.error_handling import circuit_breakers, retry
+from src.core import http_cache
+from src.core.models import Profile, Repository
+from src.core.performance_monitor import monitor
+from src.core.tracing import record_span
+from src.core.http_client import http_clients, token_fingerprint
+from src.core.rate_limit import rate_limiter
+from src.core.token_pool import TokenPool, get_token_pool
+from github import Github
+
+# Topics for many repositories at once, looked up by GraphQL node ID
+REPOSITORY_TOPICS_QUERY = """
+query($ids: [ID!]!) {
+    nodes(ids: $ids) {
+        ... on Repository {
+            nameWithOwner
+            repositoryTopics(first: 20) {
+                nodes {
+                    topic {
+                        name
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# GitHub caps the number of node IDs per GraphQL lookup
+GRAPHQL_BATCH_SIZE = 100
+
+# GitHub caps REST list pages at 100 items
+MAX_PAGE_SIZE = 100
 
 class GitHubService:
     """
@@ -15,47 +48,173 @@ class GitHubService:
     - Comprehensive error handling
     - Efficient data extraction
     """
-    def __init__(self, token: str = None, base_url: str = 'https://api.github.com'):
+    def __init__(self, token: str = None, base_url: str = None, token_pool: TokenPool = None):
         """
         Initialize GitHub Service
 
         :param token: GitHub API token
-        :param base_url: Base URL for GitHub API
+        :param base_url: Base URL for GitHub API, defaults to github.api_base_url
+        :param token_pool: Pool of tokens to balance calls across, defaults to
+                           GITHUB_TOKENS when no explicit token is given
+        :raises ValueError: If token is invalid
+        """
+        self.token = self.resolve_token(token)
+        self.token_pool = token_pool if token_pool is not None or token is not None else get_token_pool()
+        self.base_url = base_url or config.get('github.api_base_url', 'https://api.github.com')
+        self.graphql_url = self._graphql_url(self.base_url)
+        self.logger = github_logger
+        self.timeout = config.get('http.timeout', 10)
+
+        # Pooled keep-alive session shared by every service using this token
+        self.session = http_clients.get_session(self.token)
+        self.cache = http_cache.response_cache
+        self.rate_limiter = rate_limiter
+        self.token_id = token_fingerprint(self.token)
+
+    @staticmethod
+    def resolve_token(token: str = None) -> str:
+        """
+        Resolve and validate the GitHub token from argument, environment or config
+
+        :param token: Explicit GitHub API token
+        :return: Validated token
         :raises ValueError: If token is invalid
         """
         # Attempt to get token from multiple sources
         if token is not None:
-            self.token = token.strip()
+            token = token.strip()
         else:
             # Try to get token from environment or configuration
             env_token = os.getenv('GITHUB_TOKEN')
             config_token = config.get('github.token')
             
             # Prioritize non-None tokens
-            self.token = (env_token or config_token or '').strip()
+            token = (env_token or config_token or '').strip()
         
         # Validate token
-        if not self.token or len(self.token) < 20:
+        if not token or len(token) < 20:
             raise ValueError("Invalid GitHub token")
-        
-        # Create GitHub authentication object
-        self.auth = Auth.Token(self.token)
-        
-        # Initialize GitHub client with new authentication method
-        self.github_client = Github(auth=self.auth)
-        
-        self.base_url = base_url or config.get('github.api_base_url', 'https://api.github.com')
-        self.logger = github_logger
-        
-        # Configure headers for API requests
-        self.headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
 
-    @CircuitBreaker()
+        return token
+
+    @property
+    def github_client(self) -> Github:
+        """
+        Shared PyGithub client for this token
+        """
+        return http_clients.get_github_client(self.token)
+
+    def _select_token(self, resource: str = 'core') -> str:
+        """
+        Token the next call is made with
+
+        :param resource: GitHub rate-limit resource the call is charged to
+        :return: The pooled token with the most budget left, or the service token
+        """
+        return self.token_pool.select(resource) if self.token_pool is not None else self.token
+
+    def _send(self, method: str, url: str, resource: str = 'core', token: str = None, **kwargs) -> requests.Response:
+        """
+        Issue one GitHub call through the process-wide rate-limit scheduler
+
+        With a token pool, each call is charged to the token with the most
+        budget left. Every attempt is reported to the endpoint's circuit
+        breaker, which fails fast while the endpoint is unhealthy.
+
+        :param method: HTTP method
+        :param url: Request URL
+        :param resource: GitHub rate-limit resource the call is charged to
+        :param token: Token to call with, selected per call when omitted
+        :return: HTTP response
+        :raises RateLimitExceeded: If the budget will not recover in time
+        :raises CircuitBreakerError: If the endpoint's circuit is open
+        """
+        token = token or self._select_token(resource)
+        if token == self.token:
+            token_id, session = self.token_id, self.session
+        else:
+            token_id = self.token_pool.fingerprint(token)
+            session = http_clients.get_session(token)
+
+        breaker = circuit_breakers.for_url(url)
+        self.rate_limiter.acquire(token_id, resource)
+        probe = breaker.acquire()
+        send = session.post if method == 'POST' else session.get
+        start = time.perf_counter()
+        try:
+            response = send(url, timeout=self.timeout, **kwargs)
+        except Exception as e:
+            breaker.record_error(e, probe)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            record_span(f'github.{breaker.endpoint}', start, elapsed)
+        status_code = getattr(response, 'status_code', None)
+        github_logger.debug(f"{method} {url} -> {status_code} in {elapsed * 1000:.1f}ms")
+        breaker.record(isinstance(status_code, int) and status_code >= 500, probe)
+        self.rate_limiter.update(token_id, getattr(response, 'headers', {}), status_code, resource)
+
+        if self.token_pool is not None:
+            self.token_pool.report(token, status_code)
+        return response
+
+    def _get_json(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None) -> Any:
+        """
+        GET a REST resource, revalidating cached copies with conditional requests
+
+        :param url: Request URL
+        :param params: Query parameters
+        :param headers: Extra request headers
+        :return: Decoded JSON body
+        :raises requests.RequestException: On transport or HTTP errors
+        """
+        return self._get_with_headers(url, params, headers)[0]
+
+    def _get_with_headers(
+        self,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, str] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        GET a REST resource, revalidating cached copies with conditional requests
+
+        A 304 answer does not count against the rate limit, so unchanged
+        resources are served from the response cache for free.
+
+        :param url: Request URL
+        :param params: Query parameters
+        :param headers: Extra request headers
+        :return: Tuple of decoded JSON body and response headers
+        :raises requests.RequestException: On transport or HTTP errors
+        """
+        headers = dict(headers or {})
+        # Cached validators belong to the token that will send the request
+        token = self._select_token()
+        key = entry = None
+        if self.cache is not None:
+            key = http_cache.cache_key(token, url, params, headers.get('Accept'))
+            entry = self.cache.get(key)
+            headers.update(http_cache.conditional_headers(entry))
+
+        response = self._send('GET', url, token=token, params=params, headers=headers)
+        if entry is not None and response.status_code == 304:
+            github_logger.debug(f"Not modified, served from cache: {url}")
+            return entry['body'], entry.get('headers') or {}
+
+        response.raise_for_status()
+        body = response.json()
+
+        if key is not None:
+            new_entry = http_cache.make_entry(response.headers, body)
+            if new_entry is not None:
+                self.cache.set(key, new_entry)
+
+        return body, response.headers
+
+    @monitor.track()
     @retry(max_attempts=3)
-    def get_user_profile(self, username: str) -> Dict[str, Any]:
+    def get_user_profile(self, username: str) -> Profile:
         """
         Retrieve comprehensive GitHub user profile
         
@@ -63,34 +222,17 @@ class GitHubService:
         :return: User profile information
         """
         try:
-            response = requests.get(
-                f'{self.base_url}/users/{username}', 
-                headers=self.headers
-            )
-            response.raise_for_status()
-            
-            profile = response.json()
+            profile = self._get_json(f'{self.base_url}/users/{username}')
             github_logger.info(f"Retrieved profile for {username}")
             
-            return {
-                'name': profile.get('name'),
-                'login': profile.get('login'),
-                'email': profile.get('email'),
-                'bio': profile.get('bio'),
-                'location': profile.get('location'),
-                'public_repos': profile.get('public_repos'),
-                'followers': profile.get('followers'),
-                'following': profile.get('following'),
-                'avatar_url': profile.get('avatar_url')
-            }
+            return Profile.from_api(profile)
         
         except requests.RequestException as e:
             github_logger.error(f"GitHub API error: {e}")
             raise
 
-    @CircuitBreaker()
-    @retry(max_attempts=3)
-    def get_repositories(self, username: str, max_repos: int = 50) -> List[Dict[str, Any]]:
+    @monitor.track()
+    def get_repositories(self, username: str, max_repos: int = 50) -> List[Repository]:
         """
         Retrieve user's repositories with detailed information
         
@@ -99,36 +241,137 @@ class GitHubService:
         :return: List of repository details
         """
         try:
-            response = requests.get(
-                f'{self.base_url}/users/{username}/repos', 
-                headers=self.headers,
-                params={'per_page': max_repos, 'sort': 'updated'}
-            )
-            response.raise_for_status()
-            
-            repos = response.json()[:max_repos]
+            repos = list(islice(
+                self.iter_repositories(username, per_page=min(max_repos, MAX_PAGE_SIZE)),
+                max_repos
+            ))
             github_logger.info(f"Retrieved {len(repos)} repositories for {username}")
-            
-            return [
-                {
-                    'name': repo.get('name'),
-                    'full_name': repo.get('full_name'),
-                    'description': repo.get('description'),
-                    'language': repo.get('language'),
-                    'stars': repo.get('stargazers_count'),
-                    'forks': repo.get('forks_count'),
-                    'created_at': repo.get('created_at'),
-                    'updated_at': repo.get('updated_at'),
-                    'html_url': repo.get('html_url'),
-                    'topics': self._get_repository_topics(repo.get('full_name'))
-                }
-                for repo in repos
-            ]
+            return repos
         
         except requests.RequestException as e:
             github_logger.error(f"GitHub repositories retrieval error: {e}")
             raise
 
+    def iter_repositories(
+        self,
+        username: str,
+        per_page: int = MAX_PAGE_SIZE,
+        stop_when: Optional[Callable[[Repository], bool]] = None
+    ) -> Iterator[Repository]:
+        """
+        Lazily yield a user's repositories, most recently updated first
+
+        Pages are fetched one at a time by following ``Link`` headers, so
+        only the page being consumed is held in memory and pages past the
+        point where the caller stops are never requested.
+
+        :param username: GitHub username
+        :param per_page: Repositories per page, at most 100
+        :param stop_when: Predicate on a repository, evaluated before its
+                          topics are resolved, that ends iteration before
+                          the repository is yielded
+        :return: Iterator of repository details
+        """
+        url = f'{self.base_url}/users/{username}/repos'
+        params = {'per_page': min(per_page, MAX_PAGE_SIZE), 'sort': 'updated'}
+
+        while url:
+            repos, headers = self._get_repository_page(url, params)
+            wanted = self._cut_page(repos, stop_when)
+            # Topics are only resolved for repositories that will be yielded
+            topics = self._get_topics_for(wanted)
+
+            for repo in wanted:
+                yield Repository.from_api(repo, topics.get(repo.get('full_name'), ()))
+            if len(wanted) < len(repos):
+                return
+
+            # The next link already carries the query string
+            url, params = self._next_page_url(headers), None
+
+    @staticmethod
+    def _cut_page(
+        repos: List[Dict[str, Any]],
+        stop_when: Optional[Callable[[Repository], bool]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Drop the repositories from the first one matching stop_when onwards
+
+        :param repos: Raw repository payloads of one page
+        :param stop_when: Stop predicate, or None
+        :return: Raw repository payloads to yield
+        """
+        if stop_when is None:
+            return repos
+        for index, repo in enumerate(repos):
+            if stop_when(Repository.from_api(repo)):
+                return repos[:index]
+        return repos
+
+    @retry(max_attempts=3)
+    def _get_repository_page(self, url: str, params: Dict[str, Any] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Retrieve one page of a repository listing
+
+        :param url: Page URL
+        :param params: Query parameters for the first page
+        :return: Tuple of raw repository payloads and response headers
+        """
+        return self._get_with_headers(url, params)
+
+    @monitor.track()
+    def _get_topics_for(self, repos: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Resolve topics for a list of raw repository payloads
+
+        Topics already present in the listing are used as-is, the rest are
+        fetched with batched GraphQL lookups, and the per-repository REST
+        endpoint is only used for repositories the batch could not resolve.
+
+        :param repos: Raw repository payloads from the REST API
+        :return: Mapping of full repository name to topics
+        """
+        topics, missing = self._split_known_topics(repos)
+
+        node_ids = [repo['node_id'] for repo in missing if repo.get('node_id')]
+        if node_ids:
+            try:
+                topics.update(self._get_repository_topics_batch(node_ids))
+            except Exception as e:
+                github_logger.warning(f"Batched topics lookup failed, falling back to REST: {e}")
+
+        for repo in missing:
+            full_name = repo.get('full_name')
+            if full_name not in topics:
+                topics[full_name] = self._get_repository_topics(full_name)
+
+        return topics
+
+    def _get_repository_topics_batch(self, node_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Retrieve topics for many repositories with GraphQL node lookups
+
+        :param node_ids: GraphQL node IDs of the repositories
+        :return: Mapping of full repository name to topics
+        :raises requests.RequestException: If a GraphQL request fails
+        """
+        topics: Dict[str, List[str]] = {}
+        for start in range(0, len(node_ids), GRAPHQL_BATCH_SIZE):
+            response = self._send(
+                'POST',
+                self.graphql_url,
+                resource='graphql',
+                json={
+                    'query': REPOSITORY_TOPICS_QUERY,
+                    'variables': {'ids': node_ids[start:start + GRAPHQL_BATCH_SIZE]}
+                }
+            )
+            response.raise_for_status()
+            topics.update(self._parse_topics_payload(response.json()))
+
+        github_logger.info(f"Retrieved topics for {len(topics)} repositories via GraphQL")
+        return topics
+
     def _get_repository_topics(self, full_name: str) -> List[str]:
         """
         Retrieve repository topics
@@ -136,43 +379,117 @@ class GitHubService:
         :param full_name: Full repository name (owner/repo)
         :return: List of repository topics
         """
-        headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.mercy-preview+json'
-        }
+        headers = {'Accept': 'application/vnd.github.mercy-preview+json'}
 
         try:
-            response = requests.get(
+            return self._parse_rest_topics(self._get_json(
                 f'{self.base_url}/repos/{full_name}/topics',
                 headers=headers
-            )
-            response.raise_for_status()
-            
-            # Handle both dictionary and list responses
-            topics_data = response.json()
-            if isinstance(topics_data, dict):
-                return topics_data.get('names', [])
-            elif isinstance(topics_data, list):
-                return topics_data
-            else:
-                return []
+            ))
         except Exception as e:
             # Log the error and return an empty list
             github_logger.error(f"Error retrieving topics for {full_name}: {e}")
             return []
 
-    def get_contributions(self, username: str) -> Dict[str, Any]:
+    @staticmethod
+    def _split_known_topics(repos: List[Dict[str, Any]]):
+        """
+        Separate repositories whose listing already carries topics
+
+        :param repos: Raw repository payloads from the REST API
+        :return: Tuple of known topics mapping and repositories still missing topics
+        """
+        topics: Dict[str, List[str]] = {}
+        missing = []
+        for repo in repos:
+            if isinstance(repo.get('topics'), list):
+                topics[repo.get('full_name')] = repo['topics']
+            else:
+                missing.append(repo)
+        return topics, missing
+
+    @staticmethod
+    def _parse_topics_payload(payload: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Extract topics from a batched GraphQL topics response
+
+        :param payload: GraphQL response body
+        :return: Mapping of full repository name to topics
+        """
+        if payload.get('errors'):
+            github_logger.warning(f"GraphQL topics lookup returned errors: {payload['errors']}")
+
+        topics: Dict[str, List[str]] = {}
+        for node in (payload.get('data') or {}).get('nodes') or []:
+            if not node or 'nameWithOwner' not in node:
+                continue
+            topics[node['nameWithOwner']] = [
+                item['topic']['name']
+                for item in node['repositoryTopics']['nodes']
+            ]
+        return topics
+
+    @staticmethod
+    def _parse_rest_topics(topics_data: Any) -> List[str]:
+        """
+        Extract topics from a REST topics response
+
+        :param topics_data: REST topics response body
+        :return: List of topics
+        """
+        # Handle both dictionary and list responses
+        if isinstance(topics_data, dict):
+            return topics_data.get('names', [])
+        elif isinstance(topics_data, list):
+            return topics_data
+        else:
+            return []
+
+    @staticmethod
+    def _next_page_url(headers: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the next page URL from a ``Link`` header
+
+        :param headers: Response headers
+        :return: Next page URL or None on the last page
+        """
+        link = headers.get('Link') if hasattr(headers, 'get') else None
+        if not isinstance(link, str):
+            return None
+        for item in requests.utils.parse_header_links(link):
+            if item.get('rel') == 'next':
+                return item.get('url')
+        return None
+
+    @staticmethod
+    def _graphql_url(base_url: str) -> str:
+        """
+        Derive the GraphQL endpoint from the REST base URL
+
+        :param base_url: REST API base URL
+        :return: GraphQL endpoint URL
+        """
+        base_url = base_url.rstrip('/')
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL under /api/graphql
+        if base_url.endswith('/api/v3'):
+            return base_url[:-len('/v3')] + '/graphql'
+        return f'{base_url}/graphql'
+
+    @monitor.track()
+    def get_contributions(self, username: str, profile: Profile = None) -> Dict[str, Any]:
         """
         Retrieve user's contribution statistics
         
         :param username: GitHub username
+        :param profile: Already retrieved profile, avoids a second profile request
         :return: Contribution statistics
         """
         # Note: GitHub GraphQL API would be more suitable for detailed contributions
         # This is a simplified implementation
-        profile = self.get_user_profile(username)
+        if profile is None:
+            profile = self.get_user_profile(username)
         return {
-            'total_repositories': profile.get('public_repos', 0),
-            'followers': profile.get('followers', 0),
-            'following': profile.get('following', 0)
+            'total_repositories': profile.public_repos,
+            'followers': profile.followers,
+            'following': profile.following
         }
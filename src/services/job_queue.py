@@ -0,0 +1,403 @@
+import heapq
+import itertools
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.core.config import config
+from src.core.error_handling import JobQueueFull
+from src.core.logging import app_logger, error_logger
+from src.core.serialization import dumps, loads
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+class Job:
+    """
+    Resume generation request tracked by the job queue
+    """
+    __slots__ = (
+        'id', 'username', 'output_format', 'priority', 'status',
+        'created_at', 'started_at', 'finished_at', 'result', 'error'
+    )
+
+    def __init__(
+        self,
+        username: str,
+        output_format: str = 'json',
+        priority: int = 0,
+        job_id: str = None,
+        created_at: float = None
+    ):
+        self.id = job_id or uuid.uuid4().hex
+        self.username = username
+        self.output_format = output_format
+        self.priority = priority
+        self.status = QUEUED
+        self.created_at = time.time() if created_at is None else created_at
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        # Resume dictionary once the job succeeded
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """
+        Identity of the work, identical pending jobs are deduplicated on it
+        """
+        return self.username.lower(), self.output_format
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Public job status, without the result
+        """
+        return {
+            'job_id': self.id,
+            'username': self.username,
+            'format': self.output_format,
+            'priority': self.priority,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error
+        }
+
+class SQLiteJobStore:
+    """
+    Durable job records in a SQLite database
+
+    Queued jobs survive restarts and finished results stay available to
+    every process sharing the database file.
+    """
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            output_format TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            result BLOB,
+            error TEXT
+        )
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize job store
+
+        :param path: SQLite database file
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(self._SCHEMA)
+        self._lock = threading.Lock()
+
+    def save(self, job: Job):
+        """
+        Insert or update a job record
+
+        :param job: Job to persist
+        """
+        result = dumps(job.result) if job.result is not None else None
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    job.id, job.username, job.output_format, job.priority, job.status,
+                    job.created_at, job.started_at, job.finished_at, result, job.error
+                )
+            )
+
+    def load(self, job_id: str) -> Optional[Job]:
+        """
+        Load a job record
+
+        :param job_id: Job identifier
+        :return: Job, or None if unknown
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def unfinished(self) -> List[Job]:
+        """
+        Jobs that were queued or running when the previous process stopped
+
+        :return: Jobs in submission order
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY created_at', (QUEUED, RUNNING)
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    @staticmethod
+    def _to_job(row: Tuple) -> Job:
+        job = Job(row[1], row[2], row[3], job_id=row[0], created_at=row[5])
+        job.status, job.started_at, job.finished_at = row[4], row[6], row[7]
+        job.result = loads(row[8]) if row[8] is not None else None
+        job.error = row[9]
+        return job
+
+class JobQueue:
+    """
+    Prioritized background queue for resume generation
+
+    Principles:
+    - Answer the client immediately with a job ID
+    - Run higher priorities first, first come first served within a priority
+    - Never queue the same pending work twice
+    - Bound the backlog instead of accepting work that cannot finish
+    """
+    def __init__(
+        self,
+        handler: Callable[[Job], Dict[str, Any]],
+        workers: int = 2,
+        max_depth: int = 100,
+        max_finished: int = 1000,
+        store: SQLiteJobStore = None
+    ):
+        """
+        Initialize job queue
+
+        :param handler: Callable producing a job's result, run on a worker thread
+        :param workers: Worker threads
+        :param max_depth: Maximum queued jobs before submissions are rejected
+        :param max_finished: Finished jobs kept in memory for status lookups
+        :param store: Optional durable store for job records
+        """
+        self.handler = handler
+        self.workers = workers
+        self.max_depth = max_depth
+        self.max_finished = max_finished
+        self.store = store
+        self._heap: List[Tuple[int, int, str]] = []
+        self._jobs: Dict[str, Job] = {}
+        self._pending: Dict[Tuple[str, str], str] = {}
+        self._finished: 'OrderedDict[str, Job]' = OrderedDict()
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+        self._stats = {'submitted': 0, 'deduplicated': 0, 'rejected': 0, 'succeeded': 0, 'failed': 0}
+
+        if store is not None:
+            recovered = store.unfinished()
+            for job in recovered:
+                # Jobs interrupted mid-run start over
+                job.status, job.started_at = QUEUED, None
+                self._enqueue(job)
+            if recovered:
+                app_logger.info(f"Recovered {len(recovered)} unfinished resume jobs")
+                self._start_workers()
+
+    @classmethod
+    def from_config(cls, handler: Callable[[Job], Dict[str, Any]]) -> 'JobQueue':
+        """
+        Create a job queue from the jobs.* settings
+
+        :param handler: Callable producing a job's result
+        """
+        database = config.get('jobs.database')
+        return cls(
+            handler,
+            workers=config.get('jobs.workers', 2),
+            max_depth=config.get('jobs.max_depth', 100),
+            max_finished=config.get('jobs.max_finished', 1000),
+            store=SQLiteJobStore(database) if database else None
+        )
+
+    def submit(self, username: str, output_format: str = 'json', priority: int = 0) -> Job:
+        """
+        Queue a resume generation job
+
+        :param username: GitHub username
+        :param output_format: Requested export format
+        :param priority: Higher runs first, raises the priority of an identical queued job
+        :return: New job, or the identical job already pending
+        :raises JobQueueFull: If the queue is at max_depth
+        """
+        job = Job(username, output_format, priority)
+        with self._condition:
+            pending_id = self._pending.get(job.key)
+            if pending_id is not None:
+                self._stats['deduplicated'] += 1
+                pending = self._jobs[pending_id]
+                if priority > pending.priority and pending.status == QUEUED:
+                    self._reprioritize(pending, priority)
+                    self._persist(pending)
+                return pending
+
+            if len(self._heap) >= self.max_depth:
+                self._stats['rejected'] += 1
+                raise JobQueueFull(f"Resume job queue is full ({self.max_depth} jobs waiting)")
+
+            self._enqueue(job)
+            self._stats['submitted'] += 1
+            # Persisted before any worker can pick the job up and record progress
+            self._persist(job)
+            self._start_workers()
+
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by ID
+
+        :param job_id: Job identifier
+        :return: Job, or None if unknown or forgotten
+        """
+        with self._condition:
+            job = self._jobs.get(job_id) or self._finished.get(job_id)
+        if job is None and self.store is not None:
+            job = self.store.load(job_id)
+        return job
+
+    def position(self, job_id: str) -> Optional[int]:
+        """
+        Number of queued jobs that will run before a job
+
+        :param job_id: Job identifier
+        :return: Zero-based queue position, or None if the job is not queued
+        """
+        with self._condition:
+            entries = sorted(self._heap)
+            for index, (_, _, queued_id) in enumerate(entries):
+                if queued_id == job_id:
+                    return index
+        return None
+
+    def wait(self, job_id: str, timeout: float = None) -> Optional[Job]:
+        """
+        Block until a job finished
+
+        :param job_id: Job identifier
+        :param timeout: Seconds to wait at most
+        :return: Job, finished unless the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while job_id in self._jobs and not self._jobs[job_id].done:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+        return self.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of queue counters for monitoring
+
+        :return: Submission and outcome counters plus current depth
+        """
+        with self._condition:
+            running = len(self._jobs) - len(self._heap)
+            return dict(self._stats, depth=len(self._heap), running=running, max_depth=self.max_depth)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the workers once they finish their current job
+
+        :param wait: Block until every worker exited
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _enqueue(self, job: Job):
+        """
+        Add a job to the heap, the caller holds the lock unless initializing
+        """
+        heapq.heappush(self._heap, (-job.priority, next(self._sequence), job.id))
+        self._jobs[job.id] = job
+        self._pending[job.key] = job.id
+
+    def _reprioritize(self, job: Job, priority: int):
+        """
+        Move a queued job to a new priority, the caller holds the lock
+
+        The job keeps its submission order among jobs of the new priority.
+        """
+        for index, (_, sequence, queued_id) in enumerate(self._heap):
+            if queued_id == job.id:
+                self._heap[index] = (-priority, sequence, job.id)
+                heapq.heapify(self._heap)
+                job.priority = priority
+                return
+
+    def _start_workers(self):
+        """
+        Start the worker threads on first use
+        """
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'resume-job-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        """
+        Worker loop: run the highest priority job until shut down
+        """
+        while True:
+            with self._condition:
+                while not self._heap and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                _, _, job_id = heapq.heappop(self._heap)
+                job = self._jobs[job_id]
+                job.status, job.started_at = RUNNING, time.time()
+            self._persist(job)
+            self._run(job)
+
+    def _run(self, job: Job):
+        """
+        Run a job's handler and record the outcome
+        """
+        try:
+            result, error, status = self.handler(job), None, SUCCEEDED
+        except Exception as e:
+            error_logger.error(f"Resume job {job.id} for {job.username} failed: {e}")
+            result, error, status = None, str(e), FAILED
+
+        with self._condition:
+            job.result, job.error, job.status, job.finished_at = result, error, status, time.time()
+            self._stats[status] += 1
+            del self._jobs[job.id]
+            if self._pending.get(job.key) == job.id:
+                del self._pending[job.key]
+            self._finished[job.id] = job
+            while len(self._finished) > self.max_finished:
+                self._finished.popitem(last=False)
+            self._condition.notify_all()
+        self._persist(job)
+
+    def _persist(self, job: Job):
+        """
+        Write a job record to the durable store, if any
+        """
+        if self.store is None:
+            return
+        try:
+            self.store.save(job)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            error_logger.warning(f"Could not persist resume job {job.id}: {e}")
@@ -0,0 +1,87 @@
+import hashlib
+import heapq
+from typing import Iterable, List, Sequence
+from src.core.config import config
+from src.core.models import Repository
+
+DEFAULT_POPULAR_LANGUAGES = ('Python', 'JavaScript', 'TypeScript', 'Java', 'Go')
+
+class ProjectRanker:
+    """
+    Project ranking engine with top-k selection
+
+    Principles:
+    - Cost grows with k, not with the size of the listing
+    - Keep weights in configuration, versioned for caches
+    """
+    def __init__(
+        self,
+        stars_weight: float = 0.4,
+        forks_weight: float = 0.3,
+        language_bonus: float = 0.3,
+        popular_languages: Iterable[str] = DEFAULT_POPULAR_LANGUAGES,
+        top_k: int = 10
+    ):
+        """
+        Initialize ranker
+
+        :param stars_weight: Score per star
+        :param forks_weight: Score per fork
+        :param language_bonus: Flat bonus for popular languages
+        :param popular_languages: Languages earning the bonus
+        :param top_k: Projects kept per resume
+        """
+        self.stars_weight = stars_weight
+        self.forks_weight = forks_weight
+        self.language_bonus = language_bonus
+        self.popular_languages = frozenset(popular_languages)
+        self.top_k = top_k
+
+    @classmethod
+    def from_config(cls) -> 'ProjectRanker':
+        """
+        Create a ranker from the ranking.* settings
+        """
+        return cls(
+            stars_weight=config.get('ranking.stars_weight', 0.4),
+            forks_weight=config.get('ranking.forks_weight', 0.3),
+            language_bonus=config.get('ranking.language_bonus', 0.3),
+            popular_languages=config.get('ranking.popular_languages', DEFAULT_POPULAR_LANGUAGES),
+            top_k=config.get('ranking.top_k', 10)
+        )
+
+    @property
+    def version(self) -> str:
+        """
+        Fingerprint of the ranking parameters, part of the resume cache key
+        """
+        parameters = (
+            f'{self.stars_weight}:{self.forks_weight}:{self.language_bonus}:'
+            f'{",".join(sorted(self.popular_languages))}:{self.top_k}'
+        )
+        return hashlib.sha256(parameters.encode('utf-8')).hexdigest()[:12]
+
+    def score(self, project: Repository) -> float:
+        """
+        Calculate project importance score
+
+        :param project: Repository record
+        :return: Score, higher ranks first
+        """
+        score = project.stars * self.stars_weight + project.forks * self.forks_weight
+        if project.language in self.popular_languages:
+            score += self.language_bonus
+        return score
+
+    def top(self, repositories: Sequence[Repository], k: int = None) -> List[Repository]:
+        """
+        Select the highest scoring projects
+
+        Ties keep listing order, exactly as a stable descending sort would.
+
+        :param repositories: Repository records
+        :param k: Projects to keep, defaults to top_k
+        :return: Up to k projects, best first
+        """
+        k = self.top_k if k is None else k
+        return heapq.nlargest(k, repositories, key=self.score)
@@ -0,0 +1,215 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.core.config import config
+from src.core.serialization import dumps
+from src.core.logging import app_logger
+
+class _CacheEntry:
+    """
+    Cached resume with its creation time and encoded JSON
+    """
+    __slots__ = ('resume', 'created_at', 'encoded')
+
+    def __init__(self, resume: Dict[str, Any], created_at: float):
+        self.resume = resume
+        self.created_at = created_at
+        # Compact JSON, encoded on first request
+        self.encoded: Optional[bytes] = None
+
+class ResumeCache:
+    """
+    Bounded resume cache with TTL, LRU eviction and stale-while-revalidate
+
+    Principles:
+    - Serve hot users instantly
+    - Refresh stale entries in the background
+    - Generate each missing resume only once, however many callers wait
+    """
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 600.0,
+        stale_ttl: float = 3600.0,
+        refresh_workers: int = 2
+    ):
+        """
+        Initialize resume cache
+
+        :param max_entries: Maximum cached resumes before LRU eviction
+        :param ttl: Seconds an entry is served as fresh
+        :param stale_ttl: Further seconds a stale entry is served while refreshing
+        :param refresh_workers: Threads used for background refreshes
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: 'OrderedDict[Tuple[str, str], _CacheEntry]' = OrderedDict()
+        # Single-flight generations of missing entries, their futures carry the resume
+        self._pending: Dict[Tuple[str, str], Future] = {}
+        # Background refreshes of stale entries, never awaited by callers
+        self._refreshing: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='resume-refresh')
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'refreshes': 0,
+            'refresh_failures': 0,
+            'encoded_hits': 0
+        }
+
+    @classmethod
+    def from_config(cls) -> 'ResumeCache':
+        """
+        Create a resume cache from the resume_cache.* settings
+        """
+        return cls(
+            max_entries=config.get('resume_cache.max_entries', 256),
+            ttl=config.get('resume_cache.ttl', 600.0),
+            stale_ttl=config.get('resume_cache.stale_ttl', 3600.0),
+            refresh_workers=config.get('resume_cache.refresh_workers', 2)
+        )
+
+    def get_or_generate(
+        self,
+        username: str,
+        generate: Callable[[str], Dict[str, Any]],
+        version: str = ''
+    ) -> Dict[str, Any]:
+        """
+        Return a cached resume, generating or refreshing it as needed
+
+        :param username: GitHub username
+        :param generate: Callable building a resume for a username
+        :param version: Ranking/config version, part of the cache key
+        :return: Resume dictionary
+        """
+        key = (username.lower(), version)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.created_at
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry.resume
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats['stale_hits'] += 1
+                    if key not in self._refreshing:
+                        self._refreshing[key] = self._refresher.submit(self._refresh, key, username, generate)
+                    return entry.resume
+
+            self._stats['misses'] += 1
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+
+        if not owner:
+            # Another caller is already generating this resume
+            return future.result()
+
+        try:
+            resume = generate(username)
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        self._store(key, resume)
+        with self._lock:
+            self._pending.pop(key, None)
+        future.set_result(resume)
+        return resume
+
+    def _refresh(self, key: Tuple[str, str], username: str, generate: Callable[[str], Dict[str, Any]]):
+        """
+        Regenerate a stale entry in the background
+        """
+        try:
+            resume = generate(username)
+        except Exception as e:
+            app_logger.error(f"Background resume refresh failed for {username}: {e}")
+            with self._lock:
+                self._refreshing.pop(key, None)
+                self._stats['refresh_failures'] += 1
+            return
+
+        self._store(key, resume)
+        with self._lock:
+            self._refreshing.pop(key, None)
+            self._stats['refreshes'] += 1
+
+    def _store(self, key: Tuple[str, str], resume: Dict[str, Any]):
+        """
+        Insert an entry and evict least recently used ones past the bound
+        """
+        with self._lock:
+            self._entries[key] = _CacheEntry(resume, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def encode(self, username: str, resume: Dict[str, Any], version: str = '') -> bytes:
+        """
+        Compact JSON for a resume, encoded once per cache entry
+
+        :param username: GitHub username
+        :param resume: Resume returned by get_or_generate
+        :param version: Ranking/config version, part of the cache key
+        :return: UTF-8 JSON bytes
+        """
+        key = (username.lower(), version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.resume is resume and entry.encoded is not None:
+                self._stats['encoded_hits'] += 1
+                return entry.encoded
+
+        encoded = dumps(resume)
+        with self._lock:
+            entry = self._entries.get(key)
+            # Only attach to the entry still holding this exact resume
+            if entry is not None and entry.resume is resume:
+                entry.encoded = encoded
+        return encoded
+
+    def invalidate(self, username: str, version: Optional[str] = None):
+        """
+        Drop cached resumes for a user
+
+        :param username: GitHub username
+        :param version: Only drop this version, all versions when omitted
+        """
+        username = username.lower()
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == username and (version is None or key[1] == version):
+                    del self._entries[key]
+
+    def clear(self):
+        """
+        Drop every cached resume
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of cache counters for monitoring
+
+        :return: Hit, miss, eviction and refresh counters plus current size
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._entries), max_entries=self.max_entries)
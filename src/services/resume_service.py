@@ -1,5 +1,13 @@
-from typing import Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
+from src.core.models import Profile, Repository, Resume
+from src.core.performance_monitor import monitor
 from src.services.github_service import GitHubService
+from src.services.fetch_stage import FetchStage
+from src.services.ranking import ProjectRanker
+from src.services.snapshot_store import Snapshot, SnapshotStore
 from src.core.logging import app_logger
 
 class ResumeService:
@@ -11,49 +19,85 @@ class ResumeService:
     - Intelligent project ranking
     - Flexible resume generation
     """
-    def __init__(self, github_service: GitHubService):
+    # Bump whenever ranking or resume structure changes to invalidate cached resumes
+    RANKING_VERSION = '1'
+    # Repositories a resume is built from, as GitHubService.get_repositories returns
+    MAX_REPOSITORIES = 50
+
+    def __init__(
+        self,
+        github_service: GitHubService,
+        executor: ThreadPoolExecutor = None,
+        ranker: ProjectRanker = None,
+        snapshots: SnapshotStore = None
+    ):
         """
         Initialize resume service with GitHub service
         
         :param github_service: Configured GitHub service
+        :param executor: Optional thread pool for concurrent GitHub fetches
+        :param ranker: Project ranking engine, defaults to ranking.* settings
+        :param snapshots: Optional snapshot store enabling incremental regeneration
         """
         self.github_service = github_service
+        self.executor = executor
+        self.ranker = ranker or ProjectRanker.from_config()
+        self.snapshots = snapshots
+        self.last_fetch_timings: Dict[str, float] = {}
 
+    @property
+    def cache_version(self) -> str:
+        """
+        Version of the resume output, used to key cached resumes
+        """
+        # Changing ranking weights must not serve resumes ranked the old way
+        return f'{self.RANKING_VERSION}-{self.ranker.version}'
+
+    @monitor.track()
     def generate_resume(self, username: str) -> Dict[str, Any]:
         """
         Generate comprehensive resume from GitHub profile
+
+        With a snapshot store, a user built before is refreshed incrementally:
+        only repositories updated since the snapshot's watermark are fetched
+        and merged into it, and an unchanged user reuses the stored resume.
         
         :param username: GitHub username
         :return: Structured resume dictionary
         """
         try:
-            # Retrieve user profile and repositories
-            profile = self.github_service.get_user_profile(username)
-            repositories = self.github_service.get_repositories(username)
-            contributions = self.github_service.get_contributions(username)
-
-            # Analyze and rank projects
-            ranked_projects = self._rank_projects(repositories)
-
-            # Construct resume
-            resume = {
-                'basics': {
-                    'name': profile.get('name') or username,
-                    'username': profile.get('login'),
-                    'email': profile.get('email'),
-                    'bio': profile.get('bio'),
-                    'location': profile.get('location'),
-                    'avatar': profile.get('avatar_url')
-                },
-                'work': [],  # Placeholder for potential future work experience
-                'projects': ranked_projects[:10],  # Top 10 projects
-                'skills': self._extract_skills(repositories),
-                'contributions': {
-                    'total_repositories': contributions.get('total_repositories', 0),
-                    'followers': contributions.get('followers', 0),
-                    'following': contributions.get('following', 0)
-                }
-            }
+            snapshot = self.snapshots.load(username, self.cache_version) if self.snapshots else None
+
+            # Retrieve user profile and repositories concurrently
+            stage = FetchStage(self.executor)
+            profile_future = stage.submit(self.github_service.get_user_profile, username, label='get_user_profile')
+            if snapshot is None:
+                repositories_future = stage.submit(self.github_service.get_repositories, username, label='get_repositories')
+            else:
+                repositories_future = stage.submit(
+                    self._get_updated_repositories, username, snapshot.watermark, label='get_repositories'
+                )
+
+            profile = profile_future.result()
+            fetched = repositories_future.result()
+            # Contributions are derived from the profile already fetched
+            contributions = self.github_service.get_contributions(username, profile=profile)
+
+            self.last_fetch_timings = dict(stage.timings)
+            app_logger.info(f"Fetch timings for {username} (ms): {self.last_fetch_timings}")
+
+            if snapshot is None:
+                repositories, built_at = fetched, time.time()
+            else:
+                repositories, changed = self._merge_repositories(snapshot.repositories, fetched)
+                if not changed and profile == snapshot.profile:
+                    app_logger.info(f"Resume for {username} unchanged since its snapshot")
+                    return snapshot.resume
+                built_at = snapshot.built_at
+
+            resume = self._assemble_resume(username, profile, repositories, contributions).to_dict()
+            if self.snapshots is not None:
+                self.snapshots.save(username, Snapshot(profile, repositories, resume, self.cache_version, built_at))
 
             app_logger.info(f"Generated resume for {username}")
             return resume
@@ -62,40 +106,100 @@ class ResumeService:
             app_logger.error(f"Resume generation error: {e}")
             raise
 
-    def _rank_projects(self, repositories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _get_updated_repositories(self, username: str, watermark: Optional[str]) -> List[Repository]:
+        """
+        Fetch the repositories updated since a snapshot was taken
+
+        The listing is ordered by last update, so paging stops at the first
+        repository older than the watermark. Repositories updated exactly at
+        the watermark are fetched again in case they changed within that second.
+
+        :param username: GitHub username
+        :param watermark: Latest updated_at covered by the snapshot
+        :return: Updated repositories, most recently updated first
+        """
+        if watermark is None:
+            return self.github_service.get_repositories(username)
+
+        updated = self.github_service.iter_repositories(
+            username,
+            stop_when=lambda repo: (repo.updated_at or '') < watermark
+        )
+        return list(islice(updated, self.MAX_REPOSITORIES))
+
+    def _merge_repositories(
+        self,
+        previous: List[Repository],
+        updated: List[Repository]
+    ) -> Tuple[List[Repository], bool]:
+        """
+        Merge updated repositories into a snapshot's listing
+
+        :param previous: Snapshot repositories, most recently updated first
+        :param updated: Repositories fetched since the watermark
+        :return: Tuple of merged listing, capped like a full fetch, and whether anything changed
+        """
+        def key(repo: Repository) -> str:
+            return repo.full_name or repo.name
+
+        known = {key(repo): repo for repo in previous}
+        changed = any(known.get(key(repo)) != repo for repo in updated)
+
+        updated_keys = {key(repo) for repo in updated}
+        merged = updated + [repo for repo in previous if key(repo) not in updated_keys]
+        return merged[:self.MAX_REPOSITORIES], changed
+
+    def _assemble_resume(
+        self,
+        username: str,
+        profile: Profile,
+        repositories: List[Repository],
+        contributions: Dict[str, Any]
+    ) -> Resume:
+        """
+        Build the resume structure from fetched GitHub data
+
+        :param username: GitHub username
+        :param profile: User profile
+        :param repositories: Repositories
+        :param contributions: Contribution statistics
+        :return: Resume record, serialized with to_dict
         """
-        Rank projects based on multiple factors
+        # Analyze and rank projects
+        ranked_projects = self._rank_projects(repositories)
+
+        # Construct resume
+        return Resume(
+            basics={
+                'name': profile.name or username,
+                'username': profile.login,
+                'email': profile.email,
+                'bio': profile.bio,
+                'location': profile.location,
+                'avatar': profile.avatar_url
+            },
+            work=(),  # Placeholder for potential future work experience
+            projects=tuple(ranked_projects),
+            skills=self._extract_skills(repositories),
+            contributions={
+                'total_repositories': contributions.get('total_repositories', 0),
+                'followers': contributions.get('followers', 0),
+                'following': contributions.get('following', 0)
+            }
+        )
+
+    @monitor.track()
+    def _rank_projects(self, repositories: List[Repository]) -> List[Repository]:
+        """
+        Select the top projects based on multiple factors
         
         :param repositories: List of repositories
-        :return: Ranked list of projects
-        """
-        def project_score(project: Dict[str, Any]) -> float:
-            """Calculate project importance score"""
-            stars_weight = 0.4
-            forks_weight = 0.3
-            language_bonus = 0.3
-
-            # Base score calculation
-            score = (
-                project.get('stars', 0) * stars_weight +
-                project.get('forks', 0) * forks_weight
-            )
-
-            # Language bonus for popular languages
-            popular_languages = ['Python', 'JavaScript', 'TypeScript', 'Java', 'Go']
-            if project.get('language') in popular_languages:
-                score += language_bonus
-
-            return score
-
-        # Sort and rank projects
-        return sorted(
-            repositories, 
-            key=project_score, 
-            reverse=True
-        )
+        :return: Best projects first, at most ranking.top_k
+        """
+        return self.ranker.top(repositories)
 
-    def _extract_skills(self, repositories: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    @monitor.track()
+    def _extract_skills(self, repositories: List[Repository]) -> Dict[str, List[str]]:
         """
         Extract and categorize skills from repositories
         
@@ -105,7 +209,7 @@ class ResumeService:
         # Language extraction
         languages = {}
         for repo in repositories:
-            lang = repo.get('language')
+            lang = repo.language
             if lang:
                 languages[lang] = languages.get(lang, 0) + 1
 
@@ -119,7 +223,7 @@ class ResumeService:
         # Extract topics as additional skills
         topics = set()
         for repo in repositories:
-            topics.update(repo.get('topics', []))
+            topics.update(repo.topics)
 
         return {
             'programming_languages': [lang for lang, _ in sorted_languages[:5]],
@@ -0,0 +1,143 @@
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+from src.core.config import config
+from src.core.logging import error_logger
+from src.core.models import Profile, Repository
+from src.core.serialization import dumps, loads
+
+class Snapshot:
+    """
+    Data a resume was last built from
+    """
+    __slots__ = ('profile', 'repositories', 'resume', 'version', 'built_at')
+
+    def __init__(
+        self,
+        profile: Profile,
+        repositories: List[Repository],
+        resume: Dict[str, Any],
+        version: str,
+        built_at: float
+    ):
+        self.profile = profile
+        self.repositories = repositories
+        self.resume = resume
+        self.version = version
+        # Time of the last full rebuild, incremental refreshes keep it
+        self.built_at = built_at
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """
+        Latest repository update covered by the snapshot
+        """
+        return max((repo.updated_at for repo in self.repositories if repo.updated_at), default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'profile': self.profile.to_dict(),
+            'repositories': [repo.to_dict() for repo in self.repositories],
+            'resume': self.resume,
+            'version': self.version,
+            'built_at': self.built_at
+        }
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Snapshot':
+        return cls(
+            Profile.from_dict(record['profile']),
+            [Repository.from_dict(repo) for repo in record['repositories']],
+            record['resume'],
+            record['version'],
+            record['built_at']
+        )
+
+class SnapshotStore:
+    """
+    Per-user resume snapshots persisted as one JSON file per user
+
+    Principles:
+    - Remember what each resume was built from
+    - Survive restarts and share snapshots across worker processes
+    - Force a full rebuild once a snapshot is old enough to have drifted
+    """
+    def __init__(self, directory: str, max_age: float = 7 * 24 * 3600):
+        """
+        Initialize snapshot store
+
+        :param directory: Directory holding the snapshots
+        :param max_age: Seconds after which a snapshot no longer seeds incremental refreshes
+        """
+        self.directory = directory
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls) -> Optional['SnapshotStore']:
+        """
+        Create a snapshot store from the snapshots.* settings
+
+        :return: Snapshot store, or None when snapshots are disabled
+        """
+        if not config.get('snapshots.enabled', True):
+            return None
+        return cls(
+            directory=config.get('snapshots.directory', '.cache/snapshots'),
+            max_age=config.get('snapshots.max_age', 7 * 24 * 3600)
+        )
+
+    def _path(self, username: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(username.lower().encode('utf-8')).hexdigest() + '.json')
+
+    def load(self, username: str, version: str) -> Optional[Snapshot]:
+        """
+        Load a user's snapshot if it can seed an incremental refresh
+
+        :param username: GitHub username
+        :param version: Resume version the snapshot must have been built with
+        :return: Snapshot, or None if missing, outdated or unreadable
+        """
+        try:
+            with open(self._path(username), 'rb') as f:
+                snapshot = Snapshot.from_dict(loads(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            error_logger.warning(f"Unreadable resume snapshot for {username}: {e}")
+            return None
+
+        if snapshot.version != version or time.time() - snapshot.built_at > self.max_age:
+            return None
+        return snapshot
+
+    def save(self, username: str, snapshot: Snapshot):
+        """
+        Persist a user's snapshot atomically
+
+        :param username: GitHub username
+        :param snapshot: Snapshot to store
+        """
+        # Write to a temporary file first so readers never see partial snapshots
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dumps(snapshot.to_dict()))
+            os.replace(tmp_path, self._path(username))
+        except (OSError, TypeError, ValueError) as e:
+            error_logger.warning(f"Could not store resume snapshot for {username}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def delete(self, username: str):
+        """
+        Forget a user's snapshot, the next build is a full one
+
+        :param username: GitHub username
+        """
+        try:
+            os.remove(self._path(username))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,292 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from src.core.config import config
+from src.core.logging import app_logger, error_logger
+from src.core.serialization import dumps
+
+def artifact_key(resume: Dict[str, Any], export_format: str, template_version: str) -> str:
+    """
+    Content address of a rendered export
+
+    :param resume: Resume dictionary
+    :param export_format: Export format, e.g. pdf
+    :param template_version: Version of the markup and styling used to render
+    :return: Hex digest identifying the artifact
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{export_format}\0{template_version}\0'.encode('utf-8'))
+    digest.update(dumps(resume, sort_keys=True))
+    return digest.hexdigest()
+
+class ArtifactStore:
+    """
+    Content-addressed on-disk store for rendered exports
+
+    Principles:
+    - Render an unchanged resume only once
+    - Never let concurrent requests share an output file
+    - Bound disk usage, evicting least recently used artifacts
+    - Never evict an artifact while it is being served
+    """
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize artifact store
+
+        :param directory: Directory holding the artifacts
+        :param max_bytes: Total size kept on disk before eviction
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: 'OrderedDict[str, int]' = OrderedDict()
+        self._size = 0
+        self._pending: Dict[str, Future] = {}
+        # Artifact name to the number of callers still serving it
+        self._pins: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @classmethod
+    def from_config(cls) -> 'ArtifactStore':
+        """
+        Create an artifact store from the artifacts.* settings
+        """
+        return cls(
+            directory=config.get('artifacts.directory', '.cache/artifacts'),
+            max_bytes=config.get('artifacts.max_bytes', 256 * 1024 * 1024)
+        )
+
+    def _load_index(self):
+        """
+        Pick up artifacts left by earlier runs, oldest first
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name, stat.st_size))
+
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._size += size
+        self._evict()
+
+    def path(self, key: str, extension: str) -> str:
+        """
+        Location of an artifact on disk
+
+        :param key: Artifact key
+        :param extension: File extension without the dot
+        :return: Absolute artifact path
+        """
+        return os.path.abspath(os.path.join(self.directory, f'{key}.{extension}'))
+
+    def get(self, key: str, extension: str, pin: bool = False) -> Optional[str]:
+        """
+        Look up a stored artifact
+
+        :param key: Artifact key
+        :param extension: File extension without the dot
+        :param pin: Keep the artifact from eviction until it is released
+        :return: Artifact path, or None if it is not stored
+        """
+        name = f'{key}.{extension}'
+        path = self.path(key, extension)
+        with self._lock:
+            if name not in self._index:
+                return None
+            try:
+                # Keep recency on disk so a restart evicts in the same order
+                os.utime(path)
+            except FileNotFoundError:
+                # Removed behind our back, e.g. by another process
+                self._size -= self._index.pop(name)
+                return None
+            self._index.move_to_end(name)
+            if pin:
+                self._pin(name)
+            return path
+
+    def put(self, key: str, extension: str, data: bytes, pin: bool = False) -> str:
+        """
+        Store an artifact atomically
+
+        :param key: Artifact key
+        :param extension: File extension without the dot
+        :param data: Artifact bytes
+        :param pin: Keep the artifact from eviction until it is released
+        :return: Artifact path
+        """
+        name = f'{key}.{extension}'
+        path = self.path(key, extension)
+
+        # Write to a temporary file first so readers never see partial artifacts
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._size -= self._index.pop(name, 0)
+            self._index[name] = len(data)
+            self._size += len(data)
+            if pin:
+                self._pin(name)
+            self._evict(keep=name)
+        return path
+
+    def get_or_render(self, key: str, extension: str, render: Callable[[], bytes], pin: bool = False) -> str:
+        """
+        Return a stored artifact, rendering it on first request
+
+        :param key: Artifact key
+        :param extension: File extension without the dot
+        :param render: Callable producing the artifact bytes
+        :param pin: Keep the artifact from eviction until it is released
+        :return: Artifact path
+        """
+        name = f'{key}.{extension}'
+        path = self.get(key, extension, pin=pin)
+        if path is not None:
+            with self._lock:
+                self._stats['hits'] += 1
+            return path
+
+        with self._lock:
+            if name in self._index:
+                # Stored by a render that finished since the lookup
+                self._stats['hits'] += 1
+                if pin:
+                    self._pin(name)
+                return self.path(key, extension)
+            self._stats['misses'] += 1
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+
+        if not owner:
+            # Another caller is already rendering this artifact
+            path = future.result()
+            if not pin:
+                return path
+            with self._lock:
+                if name in self._index:
+                    self._pin(name)
+                    return path
+            # Evicted before it could be pinned, render it again
+            return self.get_or_render(key, extension, render, pin=pin)
+
+        try:
+            path = self.put(key, extension, render(), pin=pin)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(path)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        return path
+
+    def release(self, path: str):
+        """
+        Let a pinned artifact be evicted again
+
+        :param path: Artifact path returned by a pinned lookup
+        """
+        name = os.path.basename(path)
+        with self._lock:
+            count = self._pins.get(name, 0) - 1
+            if count > 0:
+                self._pins[name] = count
+                return
+            self._pins.pop(name, None)
+            # Eviction may have been held back while the artifact was served
+            self._evict()
+
+    def _pin(self, name: str):
+        """
+        Must be called with the lock held.
+        """
+        self._pins[name] = self._pins.get(name, 0) + 1
+
+    def _evict(self, keep: str = None):
+        """
+        Remove least recently used artifacts until the store fits its bound
+
+        Must be called with the lock held.
+        """
+        for name in list(self._index):
+            if self._size <= self.max_bytes:
+                break
+            # Never evict what was just stored, even if it alone is too large,
+            # nor what a response is still reading
+            if name == keep or name in self._pins:
+                continue
+
+            self._size -= self._index.pop(name)
+            self._stats['evictions'] += 1
+            try:
+                # Open file handles keep serving a removed artifact until closed
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                error_logger.warning(f"Could not evict artifact {name}: {e}")
+
+    def clear(self):
+        """
+        Remove every stored artifact
+        """
+        with self._lock:
+            for name in self._index:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            self._index.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of store counters for monitoring
+
+        :return: Hit, miss and eviction counters plus current usage
+        """
+        with self._lock:
+            return dict(self._stats, artifacts=len(self._index), bytes=self._size, max_bytes=self.max_bytes)
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+def get_artifact_store() -> ArtifactStore:
+    """
+    Return the process-wide artifact store
+
+    :return: Shared artifact store
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArtifactStore.from_config()
+                app_logger.info(f"Artifact store at {_store.directory}, {_store.max_bytes} bytes max")
+    return _store
@@ -1,8 +1,30 @@
 import os
-import json
-import markdown2
-import pdfkit
-from typing import Dict, Any
+import shutil
+from typing import Dict, Any, Iterable, Iterator
+from src.core.performance_monitor import monitor
+from src.core.serialization import dumps
+from src.utils.artifact_store import artifact_key, get_artifact_store
+from src.utils.pdf_renderer import get_pdf_renderer
+from src.utils.template_engine import resume_templates
+
+def buffer_chunks(chunks: Iterable[str], size: int = 8192) -> Iterator[bytes]:
+    """
+    Coalesce small rendered sections into network-sized chunks
+
+    :param chunks: Rendered text fragments
+    :param size: Minimum bytes per chunk, the last one may be shorter
+    :return: Iterator of UTF-8 encoded chunks
+    """
+    buffer, buffered = [], 0
+    for chunk in chunks:
+        data = chunk.encode('utf-8')
+        buffer.append(data)
+        buffered += len(data)
+        if buffered >= size:
+            yield b''.join(buffer)
+            buffer, buffered = [], 0
+    if buffer:
+        yield b''.join(buffer)
 
 class ExportService:
     """
@@ -14,24 +36,48 @@ class ExportService:
     - Provide flexible export options
     """
     @staticmethod
-    def to_json(resume: Dict[str, Any], output_path: str = None) -> str:
+    @monitor.track()
+    def to_json(resume: Dict[str, Any], output_path: str = None, pretty: bool = False) -> str:
         """
         Export resume to JSON format
         
         :param resume: Resume dictionary
         :param output_path: Optional output file path
+        :param pretty: Indent the output, compact by default
         :return: JSON string
         """
-        json_content = json.dumps(resume, indent=2)
+        encoded = dumps(resume, pretty=pretty)
         
         if output_path:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w') as f:
-                f.write(json_content)
+            if os.path.dirname(output_path):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(encoded)
         
-        return json_content
+        return encoded.decode('utf-8')
+
+    @staticmethod
+    def iter_markdown(resume: Dict[str, Any]) -> Iterator[str]:
+        """
+        Render resume to markdown incrementally
+
+        :param resume: Resume dictionary
+        :return: Iterator of markdown fragments
+        """
+        return resume_templates.stream('markdown', resume)
+
+    @staticmethod
+    def iter_html(resume: Dict[str, Any]) -> Iterator[str]:
+        """
+        Render resume to a complete HTML document incrementally
+
+        :param resume: Resume dictionary
+        :return: Iterator of HTML fragments
+        """
+        return resume_templates.stream('html', resume)
 
     @staticmethod
+    @monitor.track()
     def to_markdown(resume: Dict[str, Any], output_path: str = None) -> str:
         """
         Convert resume to markdown format
@@ -40,83 +86,91 @@ class ExportService:
         :param output_path: Optional output file path
         :return: Markdown content
         """
-        basics = resume.get('basics', {})
-        projects = resume.get('projects', [])
-        skills = resume.get('skills', {})
-        contributions = resume.get('contributions', {})
-
-        markdown_content = f"""# {basics.get('name', 'GitHub Resume')}
-
-## Profile
-- **Username**: {basics.get('username', 'N/A')}
-- **Location**: {basics.get('location', 'Not specified')}
-- **Bio**: {basics.get('bio', 'No bio available')}
-
-## Contributions
-- **Total Repositories**: {contributions.get('total_repositories', 0)}
-- **Followers**: {contributions.get('followers', 0)}
-- **Following**: {contributions.get('following', 0)}
-
-## Skills
-- **Programming Languages**: {', '.join(skills.get('programming_languages', []))}
-- **Topics**: {', '.join(skills.get('topics', []))}
-
-## Projects
-"""
-        
-        for project in projects:
-            markdown_content += f"""
-### {project.get('name', 'Unnamed Project')}
-- **Description**: {project.get('description', 'No description')}
-- **Language**: {project.get('language', 'N/A')}
-- **Stars**: {project.get('stars', 0)}
-- **Forks**: {project.get('forks', 0)}
-- **URL**: {project.get('html_url', '#')}
-"""
+        markdown_content = resume_templates.render('markdown', resume)
         
         if output_path:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            if os.path.dirname(output_path):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'w') as f:
                 f.write(markdown_content)
         
         return markdown_content
 
+    @staticmethod
+    @monitor.track()
+    def to_html(resume: Dict[str, Any], output_path: str = None) -> str:
+        """
+        Convert resume to a standalone HTML document
+
+        :param resume: Resume dictionary
+        :param output_path: Optional output file path
+        :return: HTML content
+        """
+        html_content = resume_templates.render('html', resume)
+
+        if output_path:
+            if os.path.dirname(output_path):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'w') as f:
+                f.write(html_content)
+
+        return html_content
+
+    @staticmethod
+    @monitor.track()
+    def render_pdf(resume: Dict[str, Any]) -> bytes:
+        """
+        Render resume to PDF bytes
+
+        :param resume: Resume dictionary
+        :return: PDF bytes
+        """
+        # Styling comes from the renderer's pre-parsed stylesheet
+        return get_pdf_renderer().render(resume_templates.render('html', resume))
+
+    @staticmethod
+    @monitor.track()
+    def pdf_artifact(resume: Dict[str, Any], pin: bool = False) -> str:
+        """
+        Return the stored PDF for a resume, rendering it only if its content changed
+
+        :param resume: Resume dictionary
+        :param pin: Keep the artifact from eviction until release_artifact is called
+        :return: Path to the content-addressed PDF artifact
+        """
+        # Markup and stylesheet both shape the PDF, a change to either re-renders
+        renderer = get_pdf_renderer()
+        template_version = f"{resume_templates.get_format('html').fingerprint}-{renderer.fingerprint}"
+        key = artifact_key(resume, 'pdf', template_version)
+        return get_artifact_store().get_or_render(key, 'pdf', lambda: ExportService.render_pdf(resume), pin=pin)
+
+    @staticmethod
+    def release_artifact(path: str):
+        """
+        Let a pinned artifact be evicted again once it has been served
+
+        :param path: Path returned by pdf_artifact with pin=True
+        """
+        get_artifact_store().release(path)
+
     @staticmethod
     def to_pdf(resume: Dict[str, Any], output_path: str = None) -> str:
         """
         Convert resume to PDF
-        
+
         :param resume: Resume dictionary
-        :param output_path: Optional output file path
+        :param output_path: Optional output file path, a copy of the stored artifact
         :return: Path to generated PDF
         """
-        # Convert markdown to HTML
-        markdown_content = ExportService.to_markdown(resume)
-        html_content = markdown2.markdown(markdown_content)
-        
-        # Default PDF path if not specified
         if not output_path:
-            output_path = os.path.join(os.getcwd(), 'github_resume.pdf')
-        
+            return ExportService.pdf_artifact(resume)
+
         # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        # Convert HTML to PDF with styling
-        html_template = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; line-height: 1.6; }}
-                h1, h2 {{ color: #333; }}
-                a {{ color: #0066cc; text-decoration: none; }}
-            </style>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
-        
-        pdfkit.from_string(html_template, output_path)
-        
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        artifact_path = ExportService.pdf_artifact(resume, pin=True)
+        try:
+            shutil.copyfile(artifact_path, output_path)
+        finally:
+            ExportService.release_artifact(artifact_path)
         return output_path
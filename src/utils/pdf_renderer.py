@@ -0,0 +1,177 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+from src.core.config import config
+from src.core.error_handling import PDFRenderError
+from src.core.logging import app_logger
+
+# Shared print stylesheet for every exported PDF
+RESUME_STYLESHEET = """
+body { font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }
+h1, h2 { color: #333; }
+a { color: #0066cc; text-decoration: none; }
+ul { padding-left: 20px; }
+"""
+
+# Parsed once per worker process by _init_worker
+_worker_stylesheet = None
+
+def _init_worker(stylesheet: str):
+    """
+    Load WeasyPrint and parse the stylesheet once per worker process
+    """
+    global _worker_stylesheet
+    from weasyprint import CSS
+    _worker_stylesheet = CSS(string=stylesheet)
+
+def _render(html: str) -> bytes:
+    """
+    Render an HTML document to PDF bytes inside a worker process
+    """
+    from weasyprint import HTML
+    return HTML(string=html).write_pdf(stylesheets=[_worker_stylesheet])
+
+class PDFRenderer:
+    """
+    PDF rendering engine backed by long-lived worker processes
+
+    Principles:
+    - Pay renderer start-up and stylesheet parsing once per worker
+    - Cap concurrent renders
+    - Never let one document hold a caller forever
+    """
+    def __init__(
+        self,
+        workers: int = None,
+        max_concurrency: int = None,
+        timeout: float = None,
+        stylesheet: str = RESUME_STYLESHEET,
+        executor_factory: Callable[[], Executor] = None,
+        render: Callable[[str], bytes] = _render
+    ):
+        """
+        Initialize renderer
+
+        :param workers: Renderer processes, defaults to pdf.workers
+        :param max_concurrency: Renders admitted at once, defaults to pdf.max_concurrency,
+                                never more than there are workers
+        :param timeout: Seconds a render may take, defaults to pdf.timeout
+        :param stylesheet: CSS applied to every document
+        :param executor_factory: Builds the worker pool, defaults to spawned processes
+        :param render: Picklable callable turning HTML into PDF bytes
+        """
+        self.workers = workers or config.get('pdf.workers', 2)
+        self.max_concurrency = max_concurrency or config.get('pdf.max_concurrency', 4)
+        self.timeout = timeout or config.get('pdf.timeout', 30.0)
+        self.stylesheet = stylesheet
+        self.fingerprint = hashlib.sha256(stylesheet.encode('utf-8')).hexdigest()[:16]
+        self.executor_factory = executor_factory or self._process_pool
+        self.render_func = render
+        # Admitted renders start at once, so the timeout measures only their run
+        self._slots = threading.BoundedSemaphore(min(self.max_concurrency, self.workers))
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+
+    def _process_pool(self) -> Executor:
+        # Spawned workers do not inherit the server's threads and locks
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.stylesheet,)
+        )
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self.executor_factory()
+            return self._executor
+
+    def _reset_executor(self, executor: Executor):
+        """
+        Replace a pool whose worker hung or died
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+
+        # A hung render cannot be cancelled, stop its process outright
+        for process in list(getattr(executor, '_processes', {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def render(self, html: str) -> bytes:
+        """
+        Render an HTML document to PDF bytes
+
+        :param html: Complete HTML document
+        :return: PDF bytes
+        :raises PDFRenderError: If the render fails, times out or cannot be admitted
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PDFRenderError(f"PDF renderer busy, no slot freed within {self.timeout}s")
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(self.render_func, html)
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                # Never started, the workers are busy but healthy
+                raise PDFRenderError(f"PDF render timed out waiting {self.timeout}s for a worker")
+            app_logger.error(f"PDF render exceeded {self.timeout}s, restarting renderer pool")
+            self._reset_executor(executor)
+            raise PDFRenderError(f"PDF render timed out after {self.timeout}s")
+        except BrokenProcessPool as e:
+            self._reset_executor(executor)
+            raise PDFRenderError(f"PDF renderer unavailable: {e}") from e
+        except Exception as e:
+            raise PDFRenderError(f"PDF render failed: {e}") from e
+        finally:
+            self._slots.release()
+
+    def render_to_file(self, html: str, output_path: str) -> str:
+        """
+        Render an HTML document and write the PDF to disk
+
+        :param html: Complete HTML document
+        :param output_path: Destination path
+        :return: Path to generated PDF
+        """
+        pdf_bytes = self.render(html)
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(pdf_bytes)
+        return output_path
+
+    def shutdown(self):
+        """
+        Stop the worker pool
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+_renderer: Optional[PDFRenderer] = None
+_renderer_lock = threading.Lock()
+
+def get_pdf_renderer() -> PDFRenderer:
+    """
+    Return the process-wide PDF renderer
+
+    :return: Shared renderer, its workers start on first render
+    """
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = PDFRenderer()
+    return _renderer
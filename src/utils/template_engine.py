@@ -0,0 +1,120 @@
+import hashlib
+import os
+from typing import Any, Dict, Iterator, List
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# Export templates ship next to the web templates
+TEMPLATE_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'templates', 'exports'))
+
+class ExportFormat:
+    """
+    Registered export format with its compiled template
+    """
+    __slots__ = ('name', 'template', 'mimetype', 'extension', 'fingerprint')
+
+    def __init__(self, name: str, template, mimetype: str, extension: str, fingerprint: str):
+        self.name = name
+        self.template = template
+        self.mimetype = mimetype
+        self.extension = extension
+        self.fingerprint = fingerprint
+
+class TemplateEngine:
+    """
+    Registry of export formats rendered from precompiled templates
+
+    Principles:
+    - Compile each template once, at registration
+    - Render straight from the resume dictionary
+    - Plug new formats in without touching the exporters
+    """
+    def __init__(self, directory: str = TEMPLATE_DIRECTORY):
+        """
+        Initialize template engine
+
+        :param directory: Directory holding the export templates
+        """
+        self.environment = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(enabled_extensions=('html',), default_for_string=False),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+            # Templates are compiled once, never re-checked on disk
+            auto_reload=False
+        )
+        self._formats: Dict[str, ExportFormat] = {}
+
+    def register(self, name: str, template: str, mimetype: str, extension: str = None) -> ExportFormat:
+        """
+        Compile a template and register it as an export format
+
+        :param name: Format name, e.g. html
+        :param template: Template file name
+        :param mimetype: Media type of the rendered document
+        :param extension: File extension, defaults to the format name
+        :return: Registered format
+        :raises jinja2.TemplateError: If the template is missing or invalid
+        """
+        source, _, _ = self.environment.loader.get_source(self.environment, template)
+        export_format = ExportFormat(
+            name,
+            self.environment.get_template(template),
+            mimetype,
+            extension or name,
+            hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+        )
+        self._formats[name] = export_format
+        return export_format
+
+    def get_format(self, name: str) -> ExportFormat:
+        """
+        Look up a registered format
+
+        :param name: Format name
+        :return: Registered format
+        :raises ValueError: If the format is not registered
+        """
+        try:
+            return self._formats[name]
+        except KeyError:
+            raise ValueError(f"Unsupported export format: {name}")
+
+    def formats(self) -> List[str]:
+        """
+        Names of every registered format
+        """
+        return list(self._formats)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._formats
+
+    def render(self, name: str, resume: Dict[str, Any]) -> str:
+        """
+        Render a resume in a registered format
+
+        :param name: Format name
+        :param resume: Resume dictionary
+        :return: Rendered document
+        """
+        return self.get_format(name).template.render(resume=resume)
+
+    def stream(self, name: str, resume: Dict[str, Any]) -> Iterator[str]:
+        """
+        Render a resume incrementally in a registered format
+
+        :param name: Format name
+        :param resume: Resume dictionary
+        :return: Iterator of document fragments
+        """
+        return self.get_format(name).template.generate(resume=resume)
+
+# Formats for resumes built by ResumeService
+resume_templates = TemplateEngine()
+resume_templates.register('markdown', 'resume.md', 'text/markdown', 'md')
+resume_templates.register('html', 'resume.html', 'text/html')
+
+# Formats for resumes built by GitHubResumeAgent
+agent_templates = TemplateEngine()
+agent_templates.register('markdown', 'agent_resume.md', 'text/markdown', 'md')
+agent_templates.register('html', 'agent_resume.html', 'text/html')
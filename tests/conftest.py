@@ -1,5 +1,42 @@
 import os
 import sys
 
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import circuit_breakers, retry_budget
+
+@pytest.fixture(autouse=True)
+def reset_resilience_state():
+    """Give every test fresh circuit breakers and a full retry budget, failures must not leak between tests"""
+    circuit_breakers.reset()
+    retry_budget.reset()
+    yield
+    circuit_breakers.reset()
+    retry_budget.reset()
+
+class FakeClock:
+    """Controllable clock, tests move time by setting now"""
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock():
+    """Fresh fake clock starting at zero"""
+    return FakeClock()
+
+@pytest.fixture
+def http_error():
+    """Factory for requests.HTTPError carrying a response with the given status and headers"""
+    def make(status_code, headers=None):
+        response = MagicMock(status_code=status_code, headers=headers or {})
+        return requests.HTTPError(f'{status_code} error', response=response)
+    return make
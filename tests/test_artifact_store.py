@@ -0,0 +1,123 @@
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.artifact_store import ArtifactStore, artifact_key
+
+RESUME = {'basics': {'username': 'testuser'}, 'projects': []}
+
+class TestArtifactStore:
+    def test_key_is_content_addressed(self):
+        """Test keys depend on content and template version, not key order"""
+        reordered = {'projects': [], 'basics': {'username': 'testuser'}}
+
+        assert artifact_key(RESUME, 'pdf', '1') == artifact_key(reordered, 'pdf', '1')
+        assert artifact_key(RESUME, 'pdf', '1') != artifact_key(RESUME, 'pdf', '2')
+        assert artifact_key(RESUME, 'pdf', '1') != artifact_key({'basics': {'username': 'other'}}, 'pdf', '1')
+
+    def test_unchanged_resume_rendered_once(self, tmp_path):
+        """Test a stored artifact is served without rendering again"""
+        store = ArtifactStore(str(tmp_path))
+        render = MagicMock(return_value=b'%PDF-1')
+        key = artifact_key(RESUME, 'pdf', '1')
+
+        first = store.get_or_render(key, 'pdf', render)
+        second = store.get_or_render(key, 'pdf', render)
+
+        assert first == second
+        with open(first, 'rb') as f:
+            assert f.read() == b'%PDF-1'
+        render.assert_called_once()
+        assert store.stats()['hits'] == 1
+
+    def test_concurrent_requests_share_one_render(self, tmp_path):
+        """Test concurrent callers wait for the render already in flight"""
+        store = ArtifactStore(str(tmp_path))
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def render():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return b'%PDF-1'
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(store.get_or_render('k', 'pdf', render)))
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(target=lambda: results.append(store.get_or_render('k', 'pdf', render)))
+        waiter.start()
+        release.set()
+        owner.join()
+        waiter.join()
+
+        assert len(calls) == 1
+        assert results[0] == results[1]
+
+    def test_size_bounded_eviction(self, tmp_path):
+        """Test least recently used artifacts are removed past the byte budget"""
+        store = ArtifactStore(str(tmp_path), max_bytes=20)
+
+        a = store.put('a', 'pdf', b'x' * 8)
+        store.put('b', 'pdf', b'x' * 8)
+        store.get('a', 'pdf')
+        store.put('c', 'pdf', b'x' * 8)
+
+        assert os.path.exists(a)
+        assert store.get('b', 'pdf') is None
+        assert not os.path.exists(store.path('b', 'pdf'))
+        assert store.stats()['bytes'] == 16
+
+    def test_pinned_artifacts_are_not_evicted(self, tmp_path):
+        """Test an artifact being served survives eviction until it is released"""
+        store = ArtifactStore(str(tmp_path), max_bytes=20)
+        a = store.get_or_render('a', 'pdf', lambda: b'x' * 8, pin=True)
+
+        store.put('b', 'pdf', b'x' * 16)
+
+        assert os.path.exists(a)
+        assert store.stats()['bytes'] == 24
+
+        store.release(a)
+
+        assert not os.path.exists(a)
+        assert store.get('b', 'pdf') is not None
+        assert store.stats()['bytes'] == 16
+
+    def test_index_survives_restart(self, tmp_path):
+        """Test artifacts written by an earlier process are reused"""
+        ArtifactStore(str(tmp_path)).put('a', 'pdf', b'%PDF-1')
+
+        store = ArtifactStore(str(tmp_path))
+
+        assert store.get('a', 'pdf') == store.path('a', 'pdf')
+
+    def test_generate_resume_serves_pdf_bytes(self, tmp_path):
+        """Test the PDF format streams the artifact instead of returning a path"""
+        from src.app import create_app
+        from src.utils.export_service import ExportService
+
+        store = ArtifactStore(str(tmp_path))
+        with patch('src.app.GitHubService'), \
+             patch('src.app.ResumeService') as resume_service, \
+             patch('src.utils.export_service.get_artifact_store', return_value=store), \
+             patch.object(ExportService, 'render_pdf', return_value=b'%PDF-1') as render_pdf:
+            resume_service.return_value.generate_resume.return_value = RESUME
+            resume_service.return_value.cache_version = '1'
+            client = create_app().test_client()
+
+            first = client.post('/generate_resume', data={'github_username': 'testuser', 'format': 'pdf'})
+            second = client.post('/generate_resume', data={'github_username': 'testuser', 'format': 'pdf'})
+
+        assert first.status_code == 200
+        assert first.mimetype == 'application/pdf'
+        assert first.data == b'%PDF-1'
+        assert first.headers['ETag'] == second.headers['ETag']
+        render_pdf.assert_called_once()
+        first.close()
+        second.close()
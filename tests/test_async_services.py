@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from unittest.mock import AsyncMock, patch
+import httpx
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.asgi import ResumeASGIApp
+from src.core.http_cache import DiskResponseCache
+from src.core.error_handling import CircuitBreakerError, RateLimitExceeded
+from src.services.async_github_service import AsyncGitHubService
+from src.services.async_resume_service import AsyncResumeService
+
+TOKEN = 'ghp_' + 'a' * 36
+
+def fake_github(method, url, **kwargs):
+    """Answer GitHub API calls with canned payloads"""
+    if url.endswith('/users/testuser'):
+        payload = {'name': 'Test User', 'login': 'testuser', 'public_repos': 1, 'followers': 2, 'following': 3}
+    elif url.endswith('/users/testuser/repos'):
+        payload = [{
+            'name': 'test-repo',
+            'full_name': 'testuser/test-repo',
+            'language': 'Python',
+            'stargazers_count': 10,
+            'forks_count': 5
+        }]
+    elif url.endswith('/topics'):
+        payload = {'names': ['python', 'test']}
+    else:
+        return httpx.Response(404, request=httpx.Request(method, url))
+    return httpx.Response(200, json=payload, request=httpx.Request(method, url))
+
+class TestAsyncServices:
+    def test_generate_resume(self):
+        """Test the async pipeline builds the same resume shape as the sync one"""
+        async def run():
+            async with AsyncGitHubService(token=TOKEN) as github_service:
+                return await AsyncResumeService(github_service).generate_resume('testuser')
+
+        with patch.object(httpx.AsyncClient, 'request', new=AsyncMock(side_effect=fake_github)) as mock_request:
+            resume = asyncio.run(run())
+
+        assert resume['basics']['name'] == 'Test User'
+        assert resume['projects'][0]['topics'] == ['python', 'test']
+        assert resume['contributions']['followers'] == 2
+        # Profile, repository listing and one topics fallback
+        assert mock_request.await_count == 3
+
+    def test_disk_cache_runs_off_the_event_loop(self, tmp_path):
+        """Test blocking cache backends are used from a worker thread"""
+        threads = []
+
+        class RecordingCache(DiskResponseCache):
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return super().get(key)
+
+        async def run():
+            async with AsyncGitHubService(token=TOKEN) as github_service:
+                github_service.cache = RecordingCache(str(tmp_path))
+                await github_service.get_user_profile('testuser')
+                return threading.get_ident()
+
+        with patch.object(httpx.AsyncClient, 'request', new=AsyncMock(side_effect=fake_github)):
+            loop_thread = asyncio.run(run())
+
+        assert threads and loop_thread not in threads
+
+    def test_asgi_generate_resume(self):
+        """Test the ASGI entry point serves /generate_resume"""
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'github_username=testuser&format=json'}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/generate_resume',
+            'headers': [(b'content-type', b'application/x-www-form-urlencoded')]
+        }
+
+        with patch.dict(os.environ, {'GITHUB_TOKEN': TOKEN}), \
+             patch.object(httpx.AsyncClient, 'request', new=AsyncMock(side_effect=fake_github)):
+            asyncio.run(ResumeASGIApp()(scope, receive, send))
+
+        assert messages[0]['status'] == 200
+        assert json.loads(messages[1]['body'])['basics']['username'] == 'testuser'
+
+    def run_asgi(self, generate_resume, body=b'github_username=testuser&format=json', messages=None):
+        """Drive the ASGI app with a stubbed resume pipeline, returning sent messages"""
+        messages = [] if messages is None else messages
+
+        async def receive():
+            return {'type': 'http.request', 'body': body}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {'type': 'http', 'method': 'POST', 'path': '/generate_resume', 'headers': []}
+        with patch.dict(os.environ, {'GITHUB_TOKEN': TOKEN}), \
+             patch.object(AsyncResumeService, 'generate_resume', new=AsyncMock(side_effect=generate_resume)):
+            asyncio.run(ResumeASGIApp()(scope, receive, send))
+        return messages
+
+    def test_asgi_maps_rate_limits_and_open_circuits(self):
+        """Test the ASGI app answers 429 and 503 with Retry-After, like the Flask app"""
+        limited = self.run_asgi(RateLimitExceeded('exhausted', retry_after=42))
+        shed = self.run_asgi(CircuitBreakerError('open'))
+
+        assert limited[0]['status'] == 429
+        assert (b'retry-after', b'42') in limited[0]['headers']
+        assert shed[0]['status'] == 503
+        assert any(name == b'retry-after' for name, _ in shed[0]['headers'])
+
+    def test_asgi_never_restarts_a_started_response(self):
+        """Test a failure while streaming aborts instead of sending a second response start"""
+        def broken_stream(format_name, resume):
+            yield '# partial'
+            raise RuntimeError('template failed')
+
+        messages = []
+        with patch('src.asgi.resume_templates.stream', side_effect=broken_stream), \
+             pytest.raises(RuntimeError):
+            self.run_asgi({'basics': {}}, body=b'github_username=testuser&format=markdown', messages=messages)
+
+        assert [message['type'] for message in messages].count('http.response.start') == 1
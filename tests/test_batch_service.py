@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.batch_service import BatchService
+
+def fake_worker(username):
+    """Produce a result record without touching GitHub"""
+    if username.startswith('missing'):
+        return {'username': username, 'status': 'error', 'error': 'HTTPError: 404', 'elapsed_ms': 1.0}
+    return {'username': username, 'status': 'ok', 'resume': {'basics': {'username': username}}, 'elapsed_ms': 1.0}
+
+def make_service(worker=fake_worker):
+    return BatchService(workers=4, executor_factory=lambda workers: ThreadPoolExecutor(workers), worker=worker)
+
+class TestBatchService:
+    def test_run_writes_jsonl(self, tmp_path):
+        """Test every user gets one JSONL record and failures are reported"""
+        output = tmp_path / 'results.jsonl'
+
+        report = make_service().run(['alice', 'bob', 'missing-user', 'alice'], output_path=str(output))
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(record['username'] for record in records) == ['alice', 'bob', 'missing-user']
+        assert report['succeeded'] == 2
+        assert report['failures'] == {'missing-user': 'HTTPError: 404'}
+
+    def test_run_resumes_after_interruption(self, tmp_path):
+        """Test users already written are skipped and failed ones are retried"""
+        output = tmp_path / 'results.jsonl'
+        output.write_text(
+            json.dumps({'username': 'alice', 'status': 'ok', 'resume': {}}) + '\n' +
+            json.dumps({'username': 'bob', 'status': 'error', 'error': 'boom'}) + '\n' +
+            '{"username": "carol", "sta'
+        )
+        seen = []
+
+        def worker(username):
+            seen.append(username)
+            return fake_worker(username)
+
+        report = make_service(worker).run(['alice', 'bob', 'carol'], output_path=str(output))
+
+        assert sorted(seen) == ['bob', 'carol']
+        assert report['skipped'] == 1
+        # The truncated line is left alone and new records start on their own line
+        assert json.loads(output.read_text().splitlines()[-1])['status'] == 'ok'
+
+    def test_run_writes_one_file_per_user(self, tmp_path):
+        """Test per-user output files"""
+        report = make_service().run(['alice', 'missing-user'], output_dir=str(tmp_path))
+
+        assert json.loads((tmp_path / 'alice.json').read_text()) == {'basics': {'username': 'alice'}}
+        assert not (tmp_path / 'missing-user.json').exists()
+        assert report['failed'] == 1
+
+    def test_batches_share_one_pool(self):
+        """Test the worker pool is created once and survives a batch stopped early"""
+        created = []
+
+        def factory(workers):
+            created.append(ThreadPoolExecutor(workers))
+            return created[-1]
+
+        service = BatchService(workers=2, executor_factory=factory, worker=fake_worker)
+        try:
+            results = service.iter_results(['alice', 'bob', 'carol'])
+            next(results)
+            results.close()
+            records = list(service.iter_results(['dave']))
+        finally:
+            service.shutdown()
+
+        assert [record['username'] for record in records] == ['dave']
+        assert len(created) == 1
+
+    def test_default_pool_spawns_workers(self):
+        """Test workers are spawned, never forked from the threaded server"""
+        executor = BatchService._process_pool(1)
+        try:
+            assert executor._mp_context.get_start_method() == 'spawn'
+        finally:
+            executor.shutdown()
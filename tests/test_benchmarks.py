@@ -0,0 +1,53 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.run import Benchmark, compare, load_baseline, main, run, save_baseline
+from benchmarks.synthetic import make_repositories, make_resume
+
+class TestSynthetic:
+    def test_listings_are_deterministic(self):
+        """Test the same seed always builds the same listing"""
+        assert make_repositories(50, seed=3) == make_repositories(50, seed=3)
+        assert make_repositories(50, seed=3) != make_repositories(50, seed=4)
+
+    def test_resume_lists_every_repository(self):
+        """Test the synthetic resume has one project per repository"""
+        assert len(make_resume(25)['projects']) == 25
+
+class TestCompare:
+    def test_only_slowdowns_beyond_threshold_regress(self):
+        """Test small slowdowns, speedups and new benchmarks are not regressions"""
+        baseline = {'a[10]': 1.0, 'b[10]': 1.0, 'c[10]': 1.0, 'd[10]': None}
+        results = {'a[10]': 1.2, 'b[10]': 1.3, 'c[10]': 0.5, 'd[10]': 2.0, 'e[10]': 9.0}
+
+        assert compare(results, baseline, threshold=0.25) == ['b[10]']
+
+    def test_skipped_benchmarks_never_regress(self):
+        """Test benchmarks unavailable here are ignored"""
+        assert compare({'a[10]': None}, {'a[10]': 1.0}) == []
+
+class TestRun:
+    def test_runs_every_size_up_to_the_limit(self):
+        """Test each benchmark is measured per size and capped by max_size"""
+        benchmarks = [
+            Benchmark('sum', lambda size: (lambda values=list(range(size)): sum(values))),
+            Benchmark('capped', lambda size: (lambda: None), max_size=10)
+        ]
+
+        results = run(sizes=(10, 100), benchmarks=benchmarks, repeat=1, min_time=0.001)
+
+        assert list(results) == ['sum[10]', 'sum[100]', 'capped[10]']
+        assert all(seconds > 0 for seconds in results.values())
+
+    def test_baseline_round_trip_and_regression_exit_code(self, tmp_path):
+        """Test a stored baseline is read back and regressions fail the run"""
+        path = str(tmp_path / 'baseline.json')
+        assert load_baseline(path) == {}
+
+        save_baseline({'resume_service.rank_projects[10]': 1e-12}, path)
+
+        assert load_baseline(path) == {'resume_service.rank_projects[10]': 1e-12}
+        assert main(['--sizes', '10', '-k', 'rank_projects', '--repeat', '1', '--baseline', path]) == 1
@@ -0,0 +1,124 @@
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import (
+    CircuitBreaker,
+    CircuitBreakerError,
+    CircuitBreakerRegistry,
+    circuit_breakers,
+    is_service_failure
+)
+from src.services.github_service import GitHubService
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate_in_window(self, clock):
+        """Test the circuit opens only once the window failure rate crosses the threshold"""
+        breaker = CircuitBreaker('test', window=10, min_calls=4, failure_rate=0.5, clock=clock)
+
+        for failed in (False, False, False, True, True):
+            breaker.record(failed, breaker.acquire())
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record(True, breaker.acquire())
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitBreakerError):
+            breaker.acquire()
+        assert breaker.stats()['fast_fails'] == 1
+
+    def test_old_outcomes_leave_the_window(self, clock):
+        """Test failures older than the window no longer count"""
+        breaker = CircuitBreaker('test', window=10, min_calls=2, failure_rate=0.5, clock=clock)
+
+        breaker.record(True, breaker.acquire())
+        clock.now = 11
+        breaker.record(False, breaker.acquire())
+        breaker.record(False, breaker.acquire())
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.stats()['window_calls'] == 2
+
+    def test_half_open_limits_probes(self, clock):
+        """Test recovery admits a bounded number of probes and closes once they succeed"""
+        transitions = []
+        breaker = CircuitBreaker(
+            'test', min_calls=1, recovery_time=5, half_open_max_calls=2, clock=clock,
+            on_transition=lambda name, old, new: transitions.append(new)
+        )
+        breaker.record(True, breaker.acquire())
+
+        clock.now = 6
+        probes = [breaker.acquire(), breaker.acquire()]
+        with pytest.raises(CircuitBreakerError):
+            breaker.acquire()
+        for probe in probes:
+            breaker.record(False, probe)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert transitions == ['OPEN', 'HALF_OPEN', 'CLOSED']
+
+    def test_failed_probe_reopens(self, clock, http_error):
+        """Test a failing probe sends the circuit straight back to open"""
+        breaker = CircuitBreaker('test', min_calls=1, recovery_time=5, clock=clock)
+        breaker.record(True, breaker.acquire())
+        clock.now = 6
+
+        breaker.record_error(http_error(502), breaker.acquire())
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opened_at == 6
+
+    def test_error_classification(self, http_error):
+        """Test client errors are not held against the service"""
+        assert is_service_failure(requests.ConnectionError('reset'))
+        assert is_service_failure(http_error(503))
+        assert not is_service_failure(http_error(404))
+        assert not is_service_failure(CircuitBreakerError('open'))
+
+    def test_concurrent_records_are_counted(self):
+        """Test counters stay exact under concurrent callers"""
+        breaker = CircuitBreaker('test', min_calls=10 ** 6)
+
+        def call():
+            for _ in range(1000):
+                breaker.record(False, breaker.acquire())
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert breaker.stats()['calls'] == 8000
+
+class TestCircuitBreakerRegistry:
+    def test_breakers_are_per_endpoint(self):
+        """Test endpoints get independent, shared breakers"""
+        registry = CircuitBreakerRegistry(min_calls=1)
+
+        users = registry.for_url('https://api.github.com/users/testuser')
+        assert registry.for_url('https://api.github.com/users/other/repos') is users
+        assert registry.for_url('https://api.github.com/graphql') is not users
+
+        users.record(True, users.acquire())
+        assert registry.stats()['api.github.com/users']['state'] == CircuitBreaker.OPEN
+        assert registry.stats()['api.github.com/graphql']['state'] == CircuitBreaker.CLOSED
+
+    def test_github_service_fails_fast_when_open(self):
+        """Test an open circuit stops GitHub calls before they are sent"""
+        service = GitHubService(token='ghp_' + 'a' * 36)
+        service.session = MagicMock()
+        service.rate_limiter = MagicMock()
+        breaker = circuit_breakers.get('api.github.com/users')
+        breaker._open()
+
+        with pytest.raises(CircuitBreakerError):
+            service._send('GET', 'https://api.github.com/users/testuser')
+        service.session.get.assert_not_called()
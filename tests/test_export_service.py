@@ -0,0 +1,86 @@
+import os
+import sys
+from unittest.mock import patch
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.export_service import ExportService, buffer_chunks
+from src.utils.template_engine import TemplateEngine
+
+RESUME = {
+    'basics': {'name': 'Test User', 'username': 'testuser'},
+    'skills': {'programming_languages': ['Python'], 'topics': ['web']},
+    'contributions': {'total_repositories': 3},
+    'projects': [
+        {'name': f'repo{i}', 'description': f'Project *{i}*', 'language': 'Python', 'stars': i}
+        for i in range(3)
+    ]
+}
+
+class TestExportService:
+    def test_markdown_streams_incrementally(self):
+        """Test the markdown generator yields the same document in fragments"""
+        fragments = list(ExportService.iter_markdown(RESUME))
+
+        assert len(fragments) > len(RESUME['projects'])
+        assert ''.join(fragments) == ExportService.to_markdown(RESUME)
+
+    def test_html_renders_directly_from_resume(self):
+        """Test HTML is rendered from the dictionary and escaped, without a markdown pass"""
+        resume = dict(RESUME, projects=[{'name': '<script>', 'description': 'Project *1*'}])
+
+        html = ExportService.to_html(resume)
+
+        assert html.startswith('<!DOCTYPE html>')
+        assert '<h3>&lt;script&gt;</h3>' in html
+        assert 'Project *1*' in html
+        assert ''.join(ExportService.iter_html(resume)) == html
+
+    def test_bare_output_filenames_are_written(self, tmp_path, monkeypatch):
+        """Test output paths without a directory write to the working directory"""
+        monkeypatch.chdir(tmp_path)
+
+        ExportService.to_html(RESUME, 'resume.html')
+        ExportService.to_markdown(RESUME, 'resume.md')
+        ExportService.to_json(RESUME, 'resume.json')
+
+        assert sorted(os.listdir(tmp_path)) == ['resume.html', 'resume.json', 'resume.md']
+
+    def test_registered_format_plugs_in(self, tmp_path):
+        """Test a new format only needs a template and a registration"""
+        (tmp_path / 'resume.txt').write_text("{{ resume['basics']['name'] }}\n")
+        engine = TemplateEngine(str(tmp_path))
+
+        export_format = engine.register('text', 'resume.txt', 'text/plain')
+
+        assert 'text' in engine
+        assert engine.render('text', RESUME) == 'Test User\n'
+        assert export_format.extension == 'text'
+        with pytest.raises(ValueError):
+            engine.render('yaml', RESUME)
+
+    def test_buffer_chunks(self):
+        """Test small sections are coalesced into larger chunks"""
+        chunks = list(buffer_chunks(['ab', 'cd', 'é', 'f'], size=4))
+
+        assert chunks == [b'abcd', 'éf'.encode('utf-8')]
+
+    def test_generate_resume_streams_markdown(self):
+        """Test markdown and HTML are sent as streamed responses"""
+        from src.app import create_app
+
+        with patch('src.app.GitHubService'), patch('src.app.ResumeService') as resume_service:
+            resume_service.return_value.generate_resume.return_value = RESUME
+            resume_service.return_value.cache_version = '1'
+            client = create_app().test_client()
+
+            markdown_response = client.post('/generate_resume', data={'github_username': 'testuser', 'format': 'markdown'})
+            html_response = client.post('/generate_resume', data={'github_username': 'testuser', 'format': 'html'})
+
+        assert markdown_response.is_streamed
+        assert markdown_response.mimetype == 'text/markdown'
+        assert markdown_response.get_data(as_text=True) == ExportService.to_markdown(RESUME)
+        assert html_response.mimetype == 'text/html'
+        assert html_response.get_data(as_text=True) == ExportService.to_html(RESUME)
@@ -1,13 +1,16 @@
 import os
 import sys
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import os
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.services.github_service import GitHubService
+from src.core.http_cache import MemoryResponseCache, DiskResponseCache, ResponseCache, cache_key
+from src.core.rate_limit import RateLimitScheduler
+from src.core.token_pool import TokenPool
 from src.core.config import config
 
 class TestGitHubService:
@@ -21,7 +24,14 @@ class TestGitHubService:
         assert github_service is not None
         assert github_service.token is not None
 
-    @patch('requests.get')
+    def test_session_reuse(self, github_service):
+        """Test services with the same token share one pooled session"""
+        other = GitHubService(token=github_service.token)
+
+        assert other.session is github_service.session
+        assert other.github_client is github_service.github_client
+
+    @patch('requests.Session.get')
     def test_get_user_profile(self, mock_get, github_service):
         """Test user profile retrieval"""
         # Mock successful response
@@ -42,12 +52,12 @@ class TestGitHubService:
         # Test profile retrieval
         profile = github_service.get_user_profile('testuser')
         
-        assert profile['name'] == 'Test User'
-        assert profile['login'] == 'testuser'
-        assert 'email' in profile
-        assert 'bio' in profile
+        assert profile.name == 'Test User'
+        assert profile.login == 'testuser'
+        assert profile.followers == 5
+        assert 'email' in profile.to_dict()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_repositories(self, mock_get, github_service):
         """Test repository retrieval"""
         # Mock successful response
@@ -70,6 +80,8 @@ class TestGitHubService:
         def side_effect(url, *args, **kwargs):
             if 'topics' in url:
                 mock_topics_response = type('MockResponse', (), {
+                    'status_code': 200,
+                    'headers': {},
                     'json': lambda self: {'names': ['python', 'test']},
                     'raise_for_status': lambda self: None
                 })()
@@ -83,8 +95,92 @@ class TestGitHubService:
         repos = github_service.get_repositories('testuser')
         
         assert len(repos) > 0
-        assert repos[0]['name'] == 'test-repo'
-        assert repos[0]['topics'] == ['python', 'test']
+        assert repos[0].name == 'test-repo'
+        assert repos[0].topics == ('python', 'test')
+        assert repos[0].to_dict()['topics'] == ['python', 'test']
+
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_get_repositories_batches_topics(self, mock_get, mock_post, github_service):
+        """Test topics are fetched with one GraphQL request instead of one call per repo"""
+        mock_get.return_value.json.return_value = [
+            {
+                'name': f'repo-{i}',
+                'full_name': f'testuser/repo-{i}',
+                'node_id': f'R_{i}',
+                'stargazers_count': i,
+                'forks_count': 0
+            }
+            for i in range(3)
+        ]
+        mock_post.return_value.json.return_value = {
+            'data': {
+                'nodes': [
+                    {
+                        'nameWithOwner': f'testuser/repo-{i}',
+                        'repositoryTopics': {'nodes': [{'topic': {'name': f'topic-{i}'}}]}
+                    }
+                    for i in range(3)
+                ]
+            }
+        }
+
+        repos = github_service.get_repositories('testuser')
+
+        assert [repo.topics for repo in repos] == [('topic-0',), ('topic-1',), ('topic-2',)]
+        assert mock_get.call_count == 1
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs['json']['variables']['ids'] == ['R_0', 'R_1', 'R_2']
+
+    @patch('requests.Session.get')
+    def test_conditional_requests(self, mock_get, github_service):
+        """Test unchanged resources are revalidated and served from the cache"""
+        github_service.cache = MemoryResponseCache()
+        fresh = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+        fresh.json.return_value = {'login': 'testuser', 'name': 'Test User'}
+        not_modified = MagicMock(status_code=304, headers={'ETag': '"v1"'})
+        mock_get.side_effect = [fresh, not_modified]
+
+        first = github_service.get_user_profile('testuser')
+        second = github_service.get_user_profile('testuser')
+
+        assert first == second
+        assert 'If-None-Match' not in mock_get.call_args_list[0].kwargs['headers']
+        assert mock_get.call_args_list[1].kwargs['headers']['If-None-Match'] == '"v1"'
+        not_modified.json.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_cache_keys_follow_pooled_token(self, mock_get):
+        """Test cached responses are keyed by the pooled token that fetched them"""
+        tokens = ['ghp_' + letter * 36 for letter in 'ab']
+        pool = TokenPool(tokens, scheduler=RateLimitScheduler())
+        pool.scheduler.update(pool.fingerprint(tokens[0]), {
+            'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '100', 'X-RateLimit-Reset': str(2 ** 40)
+        })
+        service = GitHubService(token=tokens[0], token_pool=pool)
+        service.cache = MemoryResponseCache()
+        fresh = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+        fresh.json.return_value = {'login': 'testuser'}
+        mock_get.return_value = fresh
+
+        service.get_user_profile('testuser')
+
+        url = f'{service.base_url}/users/testuser'
+        assert service.cache.get(cache_key(tokens[1], url)) is not None
+        assert service.cache.get(cache_key(tokens[0], url)) is None
+
+    def test_response_cache_is_abstract(self):
+        """Test the cache interface cannot be used without a backend"""
+        with pytest.raises(TypeError):
+            ResponseCache()
+
+    def test_disk_response_cache(self, tmp_path):
+        """Test disk-backed cache entries survive a new cache instance"""
+        entry = {'etag': '"v1"', 'last_modified': None, 'body': [1, 2], 'headers': {}}
+        DiskResponseCache(str(tmp_path)).set('key', entry)
+
+        assert DiskResponseCache(str(tmp_path)).get('key') == entry
+        assert DiskResponseCache(str(tmp_path)).get('missing') is None
 
     def test_error_handling(self):
         """Test error scenarios"""
@@ -110,3 +206,33 @@ class TestGitHubService:
         
         # Verify token meets minimum length requirement
         assert len(token) >= 20, "GitHub token is too short"
+
+    @patch('requests.Session.get')
+    def test_iter_repositories_follows_pages(self, mock_get, github_service):
+        """Test pagination follows Link headers and stops fetching once the caller stops"""
+        def page(start, next_url=None):
+            response = MagicMock(status_code=200, headers={})
+            if next_url:
+                response.headers['Link'] = f'<{next_url}>; rel="next", <https://api.github.com/last>; rel="last"'
+            response.json.return_value = [
+                {'name': f'repo-{i}', 'full_name': f'testuser/repo-{i}', 'topics': []}
+                for i in range(start, start + 2)
+            ]
+            return response
+
+        mock_get.side_effect = [
+            page(0, 'https://api.github.com/user/1/repos?page=2'),
+            page(2, 'https://api.github.com/user/1/repos?page=3'),
+            page(4)
+        ]
+
+        names = [repo.name for repo in github_service.iter_repositories('testuser', per_page=2)]
+        assert names == [f'repo-{i}' for i in range(6)]
+        assert mock_get.call_args_list[1].args[0] == 'https://api.github.com/user/1/repos?page=2'
+        assert mock_get.call_args_list[1].kwargs['params'] is None
+
+        mock_get.reset_mock()
+        mock_get.side_effect = [page(0, 'https://api.github.com/user/1/repos?page=2'), page(2)]
+        repos = github_service.iter_repositories('testuser', per_page=2, stop_when=lambda repo: repo.name == 'repo-1')
+        assert [repo.name for repo in repos] == ['repo-0']
+        assert mock_get.call_count == 1
@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import JobQueueFull
+from src.services.job_queue import FAILED, SUCCEEDED, JobQueue, SQLiteJobStore
+
+class TestJobQueue:
+    def test_job_runs_in_background(self):
+        """Test a submitted job is run by a worker and keeps its result"""
+        queue = JobQueue(lambda job: {'username': job.username}, workers=1)
+
+        job = queue.submit('testuser')
+        finished = queue.wait(job.id, timeout=5)
+
+        assert finished.status == SUCCEEDED
+        assert finished.result == {'username': 'testuser'}
+        assert queue.stats()['succeeded'] == 1
+        queue.shutdown()
+
+    def test_failures_are_recorded(self):
+        """Test handler errors mark the job failed instead of killing the worker"""
+        def handler(job):
+            raise ValueError('boom')
+
+        queue = JobQueue(handler, workers=1)
+        finished = queue.wait(queue.submit('testuser').id, timeout=5)
+
+        assert finished.status == FAILED
+        assert finished.error == 'boom'
+        queue.shutdown()
+
+    def test_priority_dedup_and_depth(self):
+        """Test ordering by priority, deduplication of pending work and the depth bound"""
+        release = threading.Event()
+        order = []
+
+        def handler(job):
+            if job.username == 'blocker':
+                release.wait(5)
+            order.append(job.username)
+            return {}
+
+        queue = JobQueue(handler, workers=1, max_depth=2)
+        blocker = queue.submit('blocker')
+        # Let the only worker pick up the blocker
+        while queue.stats()['running'] == 0:
+            pass
+
+        low = queue.submit('low', priority=0)
+        high = queue.submit('high', priority=5)
+        assert queue.submit('LOW') is low
+        assert queue.position(high.id) == 0
+        with pytest.raises(JobQueueFull):
+            queue.submit('other')
+
+        release.set()
+        queue.wait(low.id, timeout=5)
+        assert order == ['blocker', 'high', 'low']
+        assert queue.stats()['deduplicated'] == 1
+        assert queue.stats()['rejected'] == 1
+        assert queue.get(blocker.id).status == SUCCEEDED
+        queue.shutdown()
+
+    def test_duplicate_submit_raises_priority(self):
+        """Test resubmitting queued work at a higher priority moves it ahead"""
+        release = threading.Event()
+        order = []
+
+        def handler(job):
+            if job.username == 'blocker':
+                release.wait(5)
+            order.append(job.username)
+            return {}
+
+        queue = JobQueue(handler, workers=1)
+        queue.submit('blocker')
+        while queue.stats()['running'] == 0:
+            pass
+
+        low = queue.submit('low', priority=0)
+        queue.submit('middle', priority=3)
+        assert queue.submit('low', priority=5) is low
+        assert low.priority == 5
+        assert queue.position(low.id) == 0
+        # A lower priority never demotes the pending job
+        queue.submit('low', priority=1)
+        assert low.priority == 5
+
+        release.set()
+        queue.wait(low.id, timeout=5)
+        assert order[:2] == ['blocker', 'low']
+        queue.shutdown()
+
+    def test_sqlite_store_recovers_unfinished_jobs(self, tmp_path):
+        """Test queued jobs survive a restart and results are read back from SQLite"""
+        database = str(tmp_path / 'jobs.db')
+        # No workers, the job is still queued when the process "stops"
+        job = JobQueue(lambda job: {}, workers=0, store=SQLiteJobStore(database)).submit('testuser')
+
+        restarted = JobQueue(lambda job: {'username': job.username}, workers=1, store=SQLiteJobStore(database))
+        finished = restarted.wait(job.id, timeout=5)
+
+        assert finished.status == SUCCEEDED
+        restarted._finished.clear()
+        assert restarted.get(job.id).result == {'username': 'testuser'}
+        restarted.shutdown()
+
+class TestJobEndpoints:
+    def test_submit_poll_and_fetch_result(self):
+        """Test the job endpoints answer immediately and serve the finished resume"""
+        from src.app import create_app
+
+        resume = {'basics': {'name': 'Test User'}, 'projects': [], 'skills': {}, 'contributions': {}}
+        with patch('src.app.GitHubService'), patch('src.app.ResumeService') as resume_service:
+            resume_service.return_value.generate_resume.return_value = resume
+            resume_service.return_value.cache_version = '1'
+            app = create_app()
+            client = app.test_client()
+
+            submitted = client.post('/jobs', data={'github_username': 'testuser', 'format': 'json'})
+            job_id = submitted.get_json()['job_id']
+            app.extensions['job_queue'].wait(job_id, timeout=5)
+            status = client.get(f'/jobs/{job_id}')
+            result = client.get(f'/jobs/{job_id}/result')
+            app.extensions['job_queue'].shutdown()
+
+        assert submitted.status_code == 202
+        assert submitted.headers['Location'] == f'/jobs/{job_id}'
+        assert status.get_json()['status'] == SUCCEEDED
+        assert result.get_json() == resume
+        assert client.get('/jobs/unknown').status_code == 404
+        assert client.post('/jobs', data={'github_username': 'testuser', 'format': 'doc'}).status_code == 400
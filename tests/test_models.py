@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.models import Profile, Repository, Resume
+
+def api_repo(name, language='Python', topics=('web',)):
+    """Build a REST API repository payload"""
+    return {
+        'name': name,
+        'full_name': f'testuser/{name}',
+        'description': None,
+        'language': ''.join(language),  # A fresh string, as JSON decoding produces
+        'stargazers_count': 3,
+        'forks_count': None,
+        'html_url': f'https://github.com/testuser/{name}'
+    }, [''.join(topic) for topic in topics]
+
+class TestModels:
+    def test_repository_round_trips_to_dict(self):
+        """Test records serialize to the existing resume JSON shape"""
+        repo = Repository.from_api(*api_repo('one'))
+
+        assert repo.to_dict() == {
+            'name': 'one',
+            'full_name': 'testuser/one',
+            'description': None,
+            'language': 'Python',
+            'stars': 3,
+            'forks': 0,
+            'created_at': None,
+            'updated_at': None,
+            'html_url': 'https://github.com/testuser/one',
+            'topics': ['web']
+        }
+
+    def test_repeated_strings_are_shared(self):
+        """Test languages and topics are interned across records"""
+        first = Repository.from_api(*api_repo('one', language=['Py', 'thon'], topics=[['w', 'eb']]))
+        second = Repository.from_api(*api_repo('two', language=['Pyt', 'hon'], topics=[['we', 'b']]))
+
+        assert first.language is second.language
+        assert first.topics[0] is second.topics[0]
+
+    def test_resume_to_dict(self):
+        """Test an assembled resume serializes its projects"""
+        profile = Profile.from_api({'login': 'testuser', 'followers': 2})
+        resume = Resume(
+            basics={'username': profile.login},
+            projects=(Repository(name='one', topics=('cli',)),),
+            skills={'programming_languages': [], 'topics': ['cli']},
+            contributions={'followers': profile.followers}
+        )
+
+        serialized = resume.to_dict()
+
+        assert serialized['work'] == []
+        assert serialized['projects'][0]['topics'] == ['cli']
+        assert serialized['contributions'] == {'followers': 2}
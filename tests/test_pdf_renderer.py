@@ -0,0 +1,104 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import PDFRenderError
+from src.utils.pdf_renderer import PDFRenderer
+
+def fake_render(html):
+    """Stand in for WeasyPrint"""
+    return b'%PDF-' + html.encode('utf-8')
+
+class TestPDFRenderer:
+    def make_renderer(self, render=fake_render, **kwargs):
+        return PDFRenderer(executor_factory=lambda: ThreadPoolExecutor(2), render=render, **kwargs)
+
+    def test_render_reuses_workers(self, tmp_path):
+        """Test renders share one long-lived pool and write PDF bytes"""
+        created = []
+        renderer = PDFRenderer(
+            executor_factory=lambda: created.append(1) or ThreadPoolExecutor(2),
+            render=fake_render
+        )
+
+        path = renderer.render_to_file('<p>one</p>', str(tmp_path / 'out' / 'resume.pdf'))
+        renderer.render('<p>two</p>')
+
+        with open(path, 'rb') as f:
+            assert f.read() == b'%PDF-<p>one</p>'
+        assert len(created) == 1
+        renderer.shutdown()
+
+    def test_render_timeout(self):
+        """Test a slow render fails fast instead of holding the caller"""
+        release = threading.Event()
+        renderer = self.make_renderer(render=lambda html: release.wait(5) and b'', timeout=0.1)
+
+        with pytest.raises(PDFRenderError, match='timed out'):
+            renderer.render('<p>slow</p>')
+        release.set()
+
+    def test_slow_render_does_not_fail_concurrent_render(self):
+        """Test a render timing out leaves other in-flight renders alone"""
+        release, started = threading.Event(), threading.Event()
+
+        def render(html):
+            if html == 'slow':
+                started.set()
+                release.wait(5)
+            return b'%PDF-' + html.encode('utf-8')
+
+        renderer = self.make_renderer(render=render, workers=2, max_concurrency=4, timeout=0.3)
+        errors = []
+
+        def render_slow():
+            try:
+                renderer.render('slow')
+            except PDFRenderError as e:
+                errors.append(e)
+
+        slow = threading.Thread(target=render_slow)
+        slow.start()
+        started.wait(5)
+
+        assert renderer.render('fast') == b'%PDF-fast'
+        slow.join()
+        release.set()
+        assert len(errors) == 1
+        assert renderer.render('after') == b'%PDF-after'
+        renderer.shutdown()
+
+    def test_concurrency_cap(self):
+        """Test no more than max_concurrency renders run at once"""
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def render(html):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return b''
+
+        renderer = PDFRenderer(
+            executor_factory=lambda: ThreadPoolExecutor(8),
+            render=render,
+            workers=8,
+            max_concurrency=2,
+            timeout=5
+        )
+        threads = [threading.Thread(target=renderer.render, args=('<p/>',)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] == 2
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.performance_monitor import Histogram, PerformanceMonitor
+
+class TestHistogram:
+    def test_quantiles_interpolate_within_buckets(self):
+        """Test quantiles are estimated from bucket counts"""
+        histogram = Histogram((0.1, 0.2, 0.4))
+        for value in (0.05, 0.15, 0.15, 0.3):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == pytest.approx(0.15)
+        assert histogram.quantile(1.0) == pytest.approx(0.4)
+        assert histogram.cumulative() == [('0.1', 1), ('0.2', 3), ('0.4', 4), ('+Inf', 4)]
+
+class TestPerformanceMonitor:
+    def test_calls_are_aggregated_per_function(self):
+        """Test every call is timed and errors are counted"""
+        monitor = PerformanceMonitor(memory_sample_rate=0)
+
+        @monitor.track()
+        def work(fail=False):
+            if fail:
+                raise ValueError('boom')
+            return 'done'
+
+        assert work() == 'done'
+        with pytest.raises(ValueError):
+            work(fail=True)
+
+        summary = monitor.snapshot()[work.__qualname__]
+        assert summary['calls'] == 2
+        assert summary['errors'] == 1
+        assert summary['p99_ms'] is not None
+        assert summary['memory_samples'] == 0
+
+    def test_nested_sampled_calls_keep_the_outer_trace(self):
+        """Test an inner traced call does not stop the outer call's memory trace"""
+        monitor = PerformanceMonitor(memory_sample_rate=1.0)
+
+        @monitor.track('inner')
+        def inner():
+            return bytearray(1024)
+
+        @monitor.track('outer')
+        def outer():
+            inner()
+            # Still tracing after the inner call returned
+            assert tracemalloc.is_tracing()
+            return bytearray(64 * 1024)
+
+        outer()
+
+        summary = monitor.snapshot()
+        assert summary['outer']['memory_samples'] == 1
+        assert summary['outer']['memory_peak_bytes'] >= 64 * 1024
+        assert summary['inner']['memory_samples'] == 0
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled_monitor_returns_function_unchanged(self):
+        """Test instrumentation costs nothing while disabled"""
+        monitor = PerformanceMonitor(enabled=False)
+
+        def work():
+            return 1
+
+        assert monitor.track()(work) is work
+
+    def test_coroutines_are_timed(self):
+        """Test async functions are tracked without blocking the loop"""
+        monitor = PerformanceMonitor()
+
+        @monitor.track('fetch')
+        async def fetch():
+            await asyncio.sleep(0)
+            return 'ok'
+
+        assert asyncio.run(fetch()) == 'ok'
+        assert monitor.snapshot()['fetch']['calls'] == 1
+
+    def test_prometheus_exposition(self):
+        """Test histograms, counters and registered gauges are rendered"""
+        monitor = PerformanceMonitor()
+        monitor.observe('stage', 0.02, cpu=0.01)
+        monitor.register_gauges('cache', lambda: {'hits': 3, 'state': 'ignored'})
+        monitor.register_gauges('circuit', lambda: {'api.github.com/users': {'fast_fails': 2}})
+
+        text = monitor.render_prometheus()
+
+        assert '# TYPE github_resume_call_duration_seconds histogram' in text
+        assert 'github_resume_call_duration_seconds_bucket{function="stage",le="0.025"} 1' in text
+        assert 'github_resume_call_duration_seconds_count{function="stage"} 1' in text
+        assert 'github_resume_call_cpu_seconds_total{function="stage"} 0.01' in text
+        assert 'github_resume_cache_hits 3' in text
+        assert 'github_resume_circuit_fast_fails{name="api.github.com/users"} 2' in text
+        assert 'state' not in text
+
+    def test_metrics_endpoint(self):
+        """Test the Flask app serves the exposition text"""
+        from src.app import create_app
+
+        response = create_app().test_client().get('/metrics')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        assert b'github_resume_resume_cache_hits' in response.data
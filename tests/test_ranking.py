@@ -0,0 +1,38 @@
+import os
+import random
+import sys
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.models import Repository
+from src.services.ranking import ProjectRanker
+
+def make_repositories(count, seed=7):
+    """Random listing with plenty of score ties"""
+    rng = random.Random(seed)
+    languages = ['Python', 'Rust', 'Go', None]
+    return [
+        Repository(name=f'repo-{i}', stars=rng.randint(0, 20), forks=rng.randint(0, 5), language=rng.choice(languages))
+        for i in range(count)
+    ]
+
+def reference_ranking(ranker, repositories, k):
+    """Full stable sort, as ranking worked before top-k selection"""
+    return sorted(repositories, key=ranker.score, reverse=True)[:k]
+
+class TestProjectRanker:
+    def test_top_k_matches_full_sort(self):
+        """Test heap selection returns the same projects in the same order"""
+        ranker = ProjectRanker()
+        repositories = make_repositories(500)
+
+        assert ranker.top(repositories) == reference_ranking(ranker, repositories, 10)
+
+    def test_weights_are_configurable_and_versioned(self):
+        """Test weights change both the ranking and the cache version"""
+        forks_first = ProjectRanker(stars_weight=0.0, forks_weight=1.0, popular_languages=['Rust'])
+        repositories = [Repository(name='starred', stars=100), Repository(name='forked', forks=5, language='Rust')]
+
+        assert [repo.name for repo in forks_first.top(repositories)] == ['forked', 'starred']
+        assert forks_first.version != ProjectRanker().version
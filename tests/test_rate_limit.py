@@ -0,0 +1,112 @@
+import os
+import sys
+from unittest.mock import patch
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import RateLimitExceeded
+from src.core.rate_limit import RateLimitScheduler
+
+def headers(limit, remaining, reset):
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(reset)
+    }
+
+class TestRateLimitScheduler:
+    @patch('src.core.rate_limit.time.sleep')
+    def test_unknown_budget_is_not_paced(self, mock_sleep, clock):
+        """Test calls proceed immediately before any headers are seen"""
+        scheduler = RateLimitScheduler(clock=clock)
+
+        scheduler.acquire('token')
+
+        mock_sleep.assert_not_called()
+
+    @patch('src.core.rate_limit.time.sleep')
+    def test_healthy_budget_is_not_paced(self, mock_sleep, clock):
+        """Test calls proceed immediately while plenty of budget is left"""
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update('token', headers(5000, 4000, clock.now + 3600))
+
+        scheduler.acquire('token')
+
+        mock_sleep.assert_not_called()
+        assert scheduler.snapshot()['token/core']['remaining'] == 3999
+
+    @patch('src.core.rate_limit.time.sleep')
+    def test_low_budget_is_paced_until_reset(self, mock_sleep, clock):
+        """Test the remaining budget is spread evenly until the reset"""
+        scheduler = RateLimitScheduler(buffer=0.1, pacing_threshold=0.3, clock=clock)
+        # 30 left, 10 held back, 20 usable over 20 seconds
+        scheduler.update('token', headers(100, 30, clock.now + 20))
+
+        scheduler.acquire('token')
+        scheduler.acquire('token')
+
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits == [pytest.approx(1.0)]
+
+    def test_buffer_is_never_spent(self, clock):
+        """Test exhausting the usable budget fails fast past max_wait"""
+        scheduler = RateLimitScheduler(buffer=0.1, max_wait=5, clock=clock)
+        scheduler.update('token', headers(5000, 500, clock.now + 600))
+
+        with pytest.raises(RateLimitExceeded) as excinfo:
+            scheduler.acquire('token')
+        assert excinfo.value.retry_after == pytest.approx(600)
+
+    @patch('src.core.rate_limit.time.sleep')
+    def test_retry_after_blocks_calls(self, mock_sleep, clock):
+        """Test Retry-After holds back the next call"""
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update('token', {'Retry-After': '3'}, status_code=429)
+
+        def advance(seconds):
+            clock.now += seconds
+        mock_sleep.side_effect = advance
+
+        scheduler.acquire('token')
+
+        mock_sleep.assert_called_once_with(pytest.approx(3))
+
+    def test_budgets_are_tracked_per_resource(self, clock):
+        """Test GraphQL and REST budgets do not share state"""
+        scheduler = RateLimitScheduler(clock=clock)
+        scheduler.update('token', dict(headers(5000, 10, clock.now + 60), **{'X-RateLimit-Resource': 'graphql'}))
+
+        scheduler.acquire('token', 'core')
+        with pytest.raises(RateLimitExceeded):
+            scheduler.acquire('token', 'graphql')
+
+    @patch('src.core.rate_limit.time.sleep')
+    def test_spent_budget_without_reset_waits_bounded(self, mock_sleep, clock):
+        """Test a spent budget with no known reset is held for max_wait, then probed"""
+        scheduler = RateLimitScheduler(buffer=0.1, max_wait=5, clock=clock)
+        scheduler.update('token', {'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '0'})
+
+        def advance(seconds):
+            clock.now += seconds
+        mock_sleep.side_effect = advance
+
+        scheduler.acquire('token')
+
+        mock_sleep.assert_called_once_with(pytest.approx(5))
+
+    @patch('src.core.rate_limit.time.sleep')
+    def test_rejected_callers_do_not_reserve_slots(self, mock_sleep, clock):
+        """Test callers failing fast leave the pacing schedule untouched"""
+        scheduler = RateLimitScheduler(buffer=0.1, pacing_threshold=0.3, max_wait=30, clock=clock)
+        # 12 left, 10 held back, 2 usable over 100 seconds: one slot every 50s
+        scheduler.update('token', headers(100, 12, clock.now + 100))
+
+        scheduler.acquire('token')
+        for _ in range(3):
+            with pytest.raises(RateLimitExceeded) as excinfo:
+                scheduler.acquire('token')
+            assert excinfo.value.retry_after == pytest.approx(50)
+
+        assert scheduler.snapshot()['token/core']['remaining'] == 11
@@ -0,0 +1,109 @@
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.services.resume_cache import ResumeCache
+
+class TestResumeCache:
+    def test_hit_and_miss(self):
+        """Test a cached resume is generated once and then served from memory"""
+        cache = ResumeCache(ttl=60)
+        generate = MagicMock(return_value={'basics': {'username': 'testuser'}})
+
+        first = cache.get_or_generate('TestUser', generate)
+        second = cache.get_or_generate('testuser', generate)
+
+        assert first is second
+        generate.assert_called_once_with('TestUser')
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_version_is_part_of_key(self):
+        """Test a new ranking version does not reuse old resumes"""
+        cache = ResumeCache(ttl=60)
+        generate = MagicMock(side_effect=lambda username: {'username': username})
+
+        cache.get_or_generate('testuser', generate, version='1')
+        cache.get_or_generate('testuser', generate, version='2')
+
+        assert generate.call_count == 2
+
+    def test_lru_eviction(self):
+        """Test the least recently used resume is evicted past the bound"""
+        cache = ResumeCache(max_entries=2, ttl=60)
+        generate = MagicMock(side_effect=lambda username: {'username': username})
+
+        cache.get_or_generate('a', generate)
+        cache.get_or_generate('b', generate)
+        cache.get_or_generate('a', generate)
+        cache.get_or_generate('c', generate)
+        cache.get_or_generate('a', generate)
+        cache.get_or_generate('b', generate)
+
+        assert cache.stats()['evictions'] == 2
+        assert [call.args[0] for call in generate.call_args_list] == ['a', 'b', 'c', 'b']
+
+    def test_stale_while_revalidate(self):
+        """Test stale resumes are served immediately while a refresh runs"""
+        cache = ResumeCache(ttl=0, stale_ttl=60)
+        refreshed = threading.Event()
+        versions = iter([{'version': 1}, {'version': 2}])
+
+        def generate(username):
+            resume = next(versions)
+            if resume['version'] == 2:
+                refreshed.set()
+            return resume
+
+        assert cache.get_or_generate('testuser', generate) == {'version': 1}
+        assert cache.get_or_generate('testuser', generate) == {'version': 1}
+        assert refreshed.wait(timeout=5)
+
+        # Wait for the refreshed entry to be stored
+        deadline = time.monotonic() + 5
+        while cache.stats()['refreshes'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get_or_generate('testuser', generate) == {'version': 2}
+        assert cache.stats()['stale_hits'] == 2
+
+    def test_miss_during_refresh_generates_its_own_resume(self):
+        """Test an entry evicted while its refresh runs is regenerated, not answered with None"""
+        cache = ResumeCache(ttl=0, stale_ttl=60)
+        refresh_started, release_refresh = threading.Event(), threading.Event()
+        calls = []
+
+        def generate(username):
+            calls.append(username)
+            if len(calls) == 2:
+                # The background refresh, held until the miss has been served
+                refresh_started.set()
+                release_refresh.wait(timeout=5)
+            return {'call': len(calls)}
+
+        cache.get_or_generate('testuser', generate)
+        cache.get_or_generate('testuser', generate)
+        assert refresh_started.wait(timeout=5)
+        cache.invalidate('testuser')
+
+        try:
+            assert cache.get_or_generate('testuser', generate) == {'call': 3}
+        finally:
+            release_refresh.set()
+
+    def test_encoded_json_reused(self):
+        """Test a cached resume is JSON-encoded once and the bytes reused"""
+        cache = ResumeCache(ttl=60)
+        generate = MagicMock(return_value={'basics': {'username': 'testuser'}})
+
+        resume = cache.get_or_generate('testuser', generate)
+        first = cache.encode('testuser', resume)
+        second = cache.encode('testuser', cache.get_or_generate('testuser', generate))
+
+        assert first is second
+        assert first == b'{"basics":{"username":"testuser"}}'
+        assert cache.stats()['encoded_hits'] == 1
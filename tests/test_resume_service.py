@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.models import Profile, Repository
+from src.services.fetch_stage import FetchStage
+from src.services.resume_service import ResumeService
+
+def make_github_service():
+    """Create a GitHub service double with canned responses"""
+    github_service = MagicMock()
+    for method in ('get_user_profile', 'get_repositories', 'get_contributions'):
+        getattr(github_service, method).__name__ = method
+    github_service.get_user_profile.return_value = Profile(
+        name='Test User',
+        login='testuser',
+        public_repos=2,
+        followers=5,
+        following=3
+    )
+    github_service.get_repositories.return_value = [
+        Repository(name='small', language='Rust', stars=1, forks=0, topics=('cli',)),
+        Repository(name='big', language='Python', stars=50, forks=10, topics=('web',))
+    ]
+    github_service.get_contributions.side_effect = lambda username, profile=None: {
+        'total_repositories': profile.public_repos,
+        'followers': profile.followers,
+        'following': profile.following
+    }
+    return github_service
+
+class TestResumeService:
+    def test_generate_resume(self):
+        """Test resume generation fetches each resource once"""
+        github_service = make_github_service()
+        service = ResumeService(github_service)
+
+        resume = service.generate_resume('testuser')
+
+        assert resume['basics']['name'] == 'Test User'
+        assert [project['name'] for project in resume['projects']] == ['big', 'small']
+        assert resume['contributions']['total_repositories'] == 2
+        github_service.get_user_profile.assert_called_once_with('testuser')
+        github_service.get_repositories.assert_called_once_with('testuser')
+        assert set(service.last_fetch_timings) == {'get_user_profile', 'get_repositories'}
+
+    def test_fetch_stage_runs_calls_concurrently(self):
+        """Test independent calls overlap instead of running back to back"""
+        barrier = threading.Barrier(2, timeout=5)
+        stage = FetchStage()
+
+        first = stage.submit(barrier.wait)
+        second = stage.submit(lambda: barrier.wait())
+
+        # Both calls must be in flight at once for the barrier to release
+        first.result(timeout=5)
+        second.result(timeout=5)
+
+    def test_fetch_stage_deduplicates_calls(self):
+        """Test identical calls within one stage share a single execution"""
+        func = MagicMock(return_value=42, __qualname__='fetch', __name__='fetch')
+        stage = FetchStage()
+
+        futures = [stage.submit(func, 'testuser') for _ in range(3)]
+
+        assert [future.result() for future in futures] == [42, 42, 42]
+        func.assert_called_once_with('testuser')
+
+    def test_fetch_stage_keeps_distinct_callables_apart(self):
+        """Test different functions and instances sharing a name are not merged"""
+        class Service:
+            def __init__(self, ident):
+                self.ident = ident
+
+            def get(self, value):
+                return self.ident, value
+
+        stage = FetchStage()
+
+        first = stage.submit(lambda: 'profile')
+        second = stage.submit(lambda: 'repositories')
+        one = stage.submit(Service(1).get, 'x')
+        two = stage.submit(Service(2).get, 'x')
+
+        assert (first.result(timeout=5), second.result(timeout=5)) == ('profile', 'repositories')
+        assert (one.result(timeout=5), two.result(timeout=5)) == ((1, 'x'), (2, 'x'))
+
+    def test_fetch_stage_runs_unhashable_calls(self):
+        """Test calls with list or dict arguments run instead of failing to deduplicate"""
+        func = MagicMock(return_value=42, __qualname__='fetch', __name__='fetch')
+        stage = FetchStage()
+
+        futures = [stage.submit(func, ['testuser'], options={'page': 1}) for _ in range(2)]
+
+        assert [future.result(timeout=5) for future in futures] == [42, 42]
+        assert func.call_count == 2
+
+    def test_fetch_stage_timings_use_qualified_names(self):
+        """Test same-named callables record separate timings, labels override"""
+        class Profiles:
+            def get(self):
+                return 'profile'
+
+        class Repositories:
+            def get(self):
+                return 'repositories'
+
+        stage = FetchStage()
+        stage.submit(Profiles().get).result(timeout=5)
+        stage.submit(Repositories().get).result(timeout=5)
+        stage.submit(lambda: None, label='custom').result(timeout=5)
+
+        assert {'Profiles.get', 'Repositories.get', 'custom'} <= set(
+            label.rsplit('<locals>.', 1)[-1] for label in stage.timings
+        )
@@ -0,0 +1,90 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.error_handling import RetryBudget, RetryPolicy, is_retryable, retry, retry_after_hint
+
+class TestErrorClassification:
+    def test_transient_errors_are_retryable(self, http_error):
+        """Test transport errors, 5xx and rate-limit answers are retried"""
+        assert is_retryable(requests.ConnectionError('reset'))
+        assert is_retryable(requests.Timeout('slow'))
+        assert is_retryable(http_error(502))
+        assert is_retryable(http_error(429))
+        assert is_retryable(http_error(403, {'Retry-After': '5'}))
+
+    def test_permanent_errors_are_not_retried(self, http_error):
+        """Test unknown users, bad tokens and plain bugs fail immediately"""
+        assert not is_retryable(http_error(404))
+        assert not is_retryable(http_error(401))
+        assert not is_retryable(http_error(403))
+        assert not is_retryable(ValueError('bad payload'))
+
+    def test_retry_after_hint(self, http_error):
+        """Test Retry-After seconds, HTTP dates and exhausted budgets are understood"""
+        assert retry_after_hint(http_error(429, {'Retry-After': '7'})) == 7
+        assert retry_after_hint(
+            http_error(503, {'Retry-After': 'Thu, 01 Jan 1970 00:01:40 GMT'}), now=lambda: 40
+        ) == 60
+        assert retry_after_hint(
+            http_error(403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '130'}), now=lambda: 100
+        ) == 30
+        assert retry_after_hint(http_error(500)) is None
+
+class TestRetryPolicy:
+    def test_full_jitter_stays_below_exponential_cap(self, http_error):
+        """Test backoff is drawn between zero and the doubling cap"""
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=3.0, budget=RetryBudget(max_tokens=100))
+        error = http_error(500)
+
+        with patch('src.core.error_handling.random.uniform', side_effect=lambda low, high: high) as uniform:
+            delays = [policy.next_delay(attempt, error) for attempt in (1, 2, 3, 4, 5)]
+
+        assert delays == [1.0, 2.0, 3.0, 3.0, None]
+        assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+    def test_long_retry_after_is_not_waited_for(self, http_error):
+        """Test a server hint beyond max_delay fails the call instead of blocking"""
+        policy = RetryPolicy(max_attempts=3, max_delay=10, budget=RetryBudget())
+
+        assert policy.next_delay(1, http_error(429, {'Retry-After': '4'})) == 4
+        assert policy.next_delay(1, http_error(429, {'Retry-After': '60'})) is None
+
+    def test_budget_limits_retries(self, clock):
+        """Test retries stop once the shared budget is spent and resume as it refills"""
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=1, clock=clock)
+
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert budget.stats()['exhausted'] == 1
+
+class TestRetryDecorator:
+    @patch('src.core.error_handling.time.sleep')
+    def test_retries_transient_then_succeeds(self, mock_sleep, http_error):
+        """Test a transient failure is retried after a jittered wait"""
+        func = MagicMock(side_effect=[http_error(503), 'ok'])
+        func.__name__ = 'func'
+
+        assert retry(max_attempts=3, budget=RetryBudget())(func)() == 'ok'
+        assert func.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch('src.core.error_handling.time.sleep')
+    def test_permanent_error_is_raised_at_once(self, mock_sleep, http_error):
+        """Test a 404 is not retried"""
+        func = MagicMock(side_effect=http_error(404))
+        func.__name__ = 'func'
+
+        with pytest.raises(requests.HTTPError):
+            retry(max_attempts=3, budget=RetryBudget())(func)()
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
@@ -0,0 +1,29 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import serialization
+from src.core.serialization import dumps, dumps_str, loads
+
+DOCUMENT = {'name': 'Zoë', 'projects': [{'stars': 3, 'topics': ['web']}]}
+
+class TestSerialization:
+    def test_compact_by_default(self):
+        """Test output is compact unless pretty output is requested"""
+        assert dumps(DOCUMENT) == json.dumps(DOCUMENT, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        assert dumps_str(DOCUMENT, pretty=True) == json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+        assert loads(dumps(DOCUMENT)) == DOCUMENT
+
+    def test_stdlib_fallback(self):
+        """Test the standard library produces the same documents without orjson"""
+        expected_compact = dumps(DOCUMENT)
+        expected_pretty = dumps(DOCUMENT, pretty=True)
+
+        with patch.object(serialization, 'orjson', None):
+            assert dumps(DOCUMENT) == expected_compact
+            assert dumps(DOCUMENT, pretty=True) == expected_pretty
+            assert loads(expected_compact) == DOCUMENT
@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.models import Profile, Repository
+from src.services.resume_service import ResumeService
+from src.services.snapshot_store import Snapshot, SnapshotStore
+from tests.test_resume_service import make_github_service
+
+REPOSITORIES = [
+    Repository(name='big', full_name='testuser/big', language='Python', stars=50, updated_at='2024-03-01T00:00:00Z', topics=('web',)),
+    Repository(name='small', full_name='testuser/small', language='Rust', stars=1, updated_at='2024-01-01T00:00:00Z', topics=('cli',))
+]
+
+def make_incremental_service(tmp_path, listing):
+    """Create a snapshot-backed service over a repository listing"""
+    github_service = make_github_service()
+    github_service.get_repositories.return_value = list(listing)
+
+    def iter_repositories(username, stop_when=None):
+        for repo in listing:
+            if stop_when is not None and stop_when(repo):
+                return
+            yield repo
+
+    github_service.iter_repositories.side_effect = iter_repositories
+    return github_service, ResumeService(github_service, snapshots=SnapshotStore(str(tmp_path)))
+
+class TestSnapshotStore:
+    def test_round_trip(self, tmp_path):
+        """Test snapshots are restored as records"""
+        store = SnapshotStore(str(tmp_path))
+        snapshot = Snapshot(Profile(login='testuser'), REPOSITORIES, {'basics': {}}, 'v1', time.time())
+
+        store.save('TestUser', snapshot)
+        loaded = store.load('testuser', 'v1')
+
+        assert loaded.profile == snapshot.profile
+        assert loaded.repositories == REPOSITORIES
+        assert loaded.watermark == '2024-03-01T00:00:00Z'
+
+    def test_outdated_snapshots_are_ignored(self, tmp_path):
+        """Test version changes and old snapshots force a full rebuild"""
+        store = SnapshotStore(str(tmp_path), max_age=60)
+        store.save('testuser', Snapshot(Profile(), REPOSITORIES, {}, 'v1', time.time() - 120))
+
+        assert store.load('testuser', 'v1') is None
+        store.save('testuser', Snapshot(Profile(), REPOSITORIES, {}, 'v1', time.time()))
+        assert store.load('testuser', 'v2') is None
+        assert store.load('testuser', 'v1') is not None
+
+    def test_unreadable_snapshot(self, tmp_path):
+        """Test a corrupt snapshot is treated as missing"""
+        store = SnapshotStore(str(tmp_path))
+        with open(store._path('testuser'), 'wb') as f:
+            f.write(b'{not json')
+
+        assert store.load('testuser', 'v1') is None
+
+class TestIncrementalRegeneration:
+    def test_first_build_is_full_and_saved(self, tmp_path):
+        """Test the first build fetches everything and stores a snapshot"""
+        github_service, service = make_incremental_service(tmp_path, REPOSITORIES)
+
+        resume = service.generate_resume('testuser')
+
+        github_service.get_repositories.assert_called_once_with('testuser')
+        snapshot = service.snapshots.load('testuser', service.cache_version)
+        assert snapshot.resume == resume
+
+    def test_unchanged_user_reuses_resume(self, tmp_path):
+        """Test a refresh with no updates skips ranking"""
+        github_service, service = make_incremental_service(tmp_path, REPOSITORIES)
+        first = service.generate_resume('testuser')
+        service.ranker.top = None  # Must not be called again
+
+        assert service.generate_resume('testuser') == first
+        github_service.get_repositories.assert_called_once()
+
+    def test_updated_repositories_are_merged(self, tmp_path):
+        """Test only repositories past the watermark are fetched and merged"""
+        listing = list(REPOSITORIES)
+        github_service, service = make_incremental_service(tmp_path, listing)
+        service.generate_resume('testuser')
+
+        updated = Repository(name='small', full_name='testuser/small', language='Rust', stars=500, updated_at='2024-04-01T00:00:00Z', topics=('cli',))
+        listing[:] = [updated, REPOSITORIES[0]]
+        seen = []
+        original = github_service.iter_repositories.side_effect
+        github_service.iter_repositories.side_effect = lambda username, stop_when=None: (
+            seen.append(repo) or repo for repo in original(username, stop_when)
+        )
+
+        resume = service.generate_resume('testuser')
+
+        assert [project['name'] for project in resume['projects']] == ['small', 'big']
+        # The watermark repository is refetched, older ones are not
+        assert [repo.name for repo in seen] == ['small', 'big']
+        snapshot = service.snapshots.load('testuser', service.cache_version)
+        assert snapshot.watermark == '2024-04-01T00:00:00Z'
+        assert len(snapshot.repositories) == 2
@@ -0,0 +1,59 @@
+import os
+import sys
+import pytest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.rate_limit import RateLimitScheduler
+from src.core.token_pool import TokenPool
+
+TOKENS = ['ghp_' + letter * 36 for letter in 'abc']
+
+def budget(remaining, limit=5000, reset=2 ** 40):
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(reset)
+    }
+
+class TestTokenPool:
+    @pytest.fixture
+    def pool(self):
+        """Create a pool with its own scheduler"""
+        return TokenPool(TOKENS, scheduler=RateLimitScheduler())
+
+    def test_selects_token_with_most_budget(self, pool):
+        """Test calls go to the token with the most remaining budget"""
+        for token, remaining in zip(TOKENS, [1000, 4000, 2000]):
+            pool.scheduler.update(pool.fingerprint(token), budget(remaining))
+
+        assert pool.select() == TOKENS[1]
+
+    def test_unknown_budgets_are_tried_first(self, pool):
+        """Test tokens without rate-limit state are preferred"""
+        pool.scheduler.update(pool.fingerprint(TOKENS[0]), budget(4000))
+        pool.scheduler.update(pool.fingerprint(TOKENS[1]), budget(4000))
+
+        assert pool.select() == TOKENS[2]
+
+    def test_exhausted_tokens_rotate_out(self, pool):
+        """Test a token down to its buffer is not chosen while others have budget"""
+        pool.scheduler.update(pool.fingerprint(TOKENS[0]), budget(100))
+        pool.scheduler.update(pool.fingerprint(TOKENS[1]), budget(50))
+        pool.scheduler.update(pool.fingerprint(TOKENS[2]), budget(600))
+
+        assert {pool.select() for _ in range(6)} == {TOKENS[2]}
+
+    def test_unauthorized_tokens_are_dropped(self, pool):
+        """Test a token answering 401 leaves rotation for good"""
+        pool.report(TOKENS[0], 401)
+        pool.report(TOKENS[1], 200)
+
+        assert pool.active_tokens() == TOKENS[1:]
+        assert TOKENS[0] not in {pool.select() for _ in range(6)}
+
+        pool.report(TOKENS[1], 401)
+        pool.report(TOKENS[2], 401)
+        with pytest.raises(ValueError, match="No valid GitHub tokens"):
+            pool.select()
@@ -0,0 +1,69 @@
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.tracing import Trace, current_request_id, end_trace, span, start_trace
+from src.services.fetch_stage import FetchStage
+from tests.test_resume_service import make_github_service
+
+class TestTrace:
+    def test_server_timing_sums_repeated_stages(self):
+        """Test repeated spans are summed and counted in the header"""
+        trace = Trace('req-1')
+        trace.add('github.repos', trace.started, 0.010)
+        trace.add('github.repos', trace.started, 0.005)
+        trace.add('Resume Service', trace.started, 0.002)
+
+        header = trace.server_timing()
+
+        assert header.startswith('github.repos;dur=15.0;desc="x2", Resume_Service;dur=2.0, total;dur=')
+
+    def test_unsafe_request_ids_are_replaced(self):
+        """Test request IDs that could inject headers or log lines are not echoed"""
+        assert Trace('abc-123').request_id == 'abc-123'
+        assert Trace('bad\r\nid').request_id != 'bad\r\nid'
+        assert len(Trace(None).request_id) == 32
+
+    def test_spans_outside_a_trace_are_ignored(self):
+        """Test instrumented code runs unchanged when no request is traced"""
+        with span('stage'):
+            pass
+        assert current_request_id() is None
+
+    def test_fetch_stage_threads_join_the_trace(self):
+        """Test work handed to the fetch pool keeps the request ID and records spans"""
+        token = start_trace('req-2')
+        try:
+            def work():
+                with span('work'):
+                    return current_request_id()
+
+            assert FetchStage().submit(work).result(timeout=5) == 'req-2'
+        finally:
+            trace = end_trace(token)
+
+        assert [recorded.name for recorded in trace.spans] == ['work']
+
+class TestTracingHeaders:
+    def test_generate_resume_reports_stage_timings(self):
+        """Test /generate_resume answers with the request ID and per-stage Server-Timing"""
+        from src.app import create_app
+
+        with patch('src.app.GitHubService', return_value=make_github_service()), \
+             patch('src.app.SnapshotStore.from_config', return_value=None):
+            client = create_app().test_client()
+            response = client.post(
+                '/generate_resume',
+                data={'github_username': 'testuser'},
+                headers={'X-Request-ID': 'req-3'}
+            )
+
+        assert response.status_code == 200
+        assert response.headers['X-Request-ID'] == 'req-3'
+        timing = response.headers['Server-Timing']
+        assert 'ResumeService.generate_resume;dur=' in timing
+        assert 'ResumeService._rank_projects;dur=' in timing
+        assert 'total;dur=' in timing